@@ -0,0 +1,79 @@
+import argparse
+import random
+
+from benchmarks.data import generate_competition, generate_match_records
+from benchmarks.timing import best_of, print_table
+from models.match import PlayedMatch
+from validation import check_matches
+
+
+def dirty_records(size: int, error_rate: float, seed: int = 0) -> list[dict]:
+    competition = generate_competition()
+    records = generate_match_records(competition, size, seed)
+    rng = random.Random(seed)
+
+    for record in records:
+        record["competition"] = competition
+        if rng.random() >= error_rate:
+            continue
+        corruption = rng.randrange(3)
+        if corruption == 0:
+            record["away_team"] = record["home_team"]
+        elif corruption == 1:
+            record["home_goals"] = record["away_goals"]
+            record["home_shootout_goals"] = record["away_shootout_goals"] = None
+        else:
+            record["home_shootout_goals"] = 1
+
+    return records
+
+
+def validate_each(records: list[dict]) -> list[tuple[int, str]]:
+    failures = []
+    for index, record in enumerate(records):
+        try:
+            PlayedMatch(**PlayedMatch.resolve_row(record))
+        except Exception as exception:
+            failures.append((index, str(exception)))
+
+    return failures
+
+
+def main(size: int, repeat: int, error_rates: list[float]) -> None:
+    rows = []
+    for error_rate in error_rates:
+        records = dirty_records(size, error_rate)
+        competition = records[0]["competition"]
+
+        per_row_time = best_of(lambda: validate_each(records), repeat)
+        batch_time = best_of(lambda: check_matches(records, competition), repeat)
+        errors = check_matches(records, competition)
+        messages_time = best_of(lambda: list(errors.messages()), repeat)
+        assert len(errors.invalid_rows()) == len(validate_each(records))
+
+        rows.append(
+            (
+                f"{error_rate:.0%}",
+                f"{len(errors):,}",
+                f"{size / per_row_time:,.0f}",
+                f"{size / batch_time:,.0f}",
+                f"{per_row_time / batch_time:.1f}x",
+                f"{messages_time * 1000:.1f}",
+            )
+        )
+
+    print_table(
+        f"Validating {size:,} match rows (rows/second)",
+        ("bad rows", "errors", "per-row models", "check_matches", "speedup", "messages (ms)"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch rule checks against per-row model validation.")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--error-rates", type=float, nargs="+", default=[0.0, 0.1, 0.5])
+    arguments = parser.parse_args()
+
+    main(arguments.size, arguments.repeat, arguments.error_rates)
@@ -0,0 +1,51 @@
+import argparse
+
+from pydantic import TypeAdapter
+
+from benchmarks.data import generate_competition, generate_played_matches
+from benchmarks.timing import best_of, print_table
+from models.match import PlayedMatch
+from serialization.binary import SeasonFile, decode_matches, encode_matches
+
+
+def main(size: int, repeat: int) -> None:
+    competition = generate_competition()
+    matches = generate_played_matches(competition, size)
+    adapter = TypeAdapter(list[PlayedMatch])
+
+    json_data = adapter.dump_json(matches)
+    binary_data = encode_matches(matches)
+
+    rows = [
+        (
+            "encode",
+            f"{best_of(lambda: adapter.dump_json(matches), repeat):.3f}",
+            f"{best_of(lambda: encode_matches(matches), repeat):.3f}",
+        ),
+        (
+            "decode to models",
+            f"{best_of(lambda: adapter.validate_json(json_data), repeat):.3f}",
+            f"{best_of(lambda: decode_matches(binary_data), repeat):.3f}",
+        ),
+        (
+            "decode to MatchTable",
+            "-",
+            f"{best_of(lambda: SeasonFile(binary_data).match_table(competition), repeat):.3f}",
+        ),
+        ("size (MB)", f"{len(json_data) / 1e6:.2f}", f"{len(binary_data) / 1e6:.2f}"),
+    ]
+
+    print_table(
+        f"Season codec, {size:,} played matches (seconds, best of runs)",
+        ("operation", "model_dump_json / model_validate_json", "binary"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the binary season codec against pydantic JSON.")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    main(arguments.size, arguments.repeat)
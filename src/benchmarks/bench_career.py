@@ -0,0 +1,62 @@
+import argparse
+import os
+
+from benchmarks.data import generate_history, generate_played_matches
+from benchmarks.timing import best_of, print_table
+from models.match import PlayedMatch
+from standings import StandingsEngine, aggregate_careers
+
+
+def nested_scan(matches: list[PlayedMatch]) -> dict:
+    competitions = {match.competition.uuid: match.competition for match in matches}
+    engine = StandingsEngine()
+    totals: dict = {}
+
+    for competition in competitions.values():
+        played = [match for match in matches if match.competition.uuid == competition.uuid]
+        for row in engine.compute(competition, played):
+            total = totals.setdefault(row.team.uuid, [0, 0, 0])
+            total[0] += row.played
+            total[1] += row.regulation_wins + row.shootout_wins
+            total[2] += row.goals_for
+
+    return totals
+
+
+def main(matches_per_competition: int, max_workers: int, repeat: int) -> None:
+    competitions = generate_history()
+    matches = [
+        match
+        for seed, competition in enumerate(competitions)
+        for match in generate_played_matches(competition, matches_per_competition, seed)
+    ]
+    size = len(matches)
+
+    cases = [
+        ("nested scan", lambda: nested_scan(matches)),
+        ("one pass", lambda: aggregate_careers(matches)),
+        ("one pass by season/format/split", lambda: aggregate_careers(matches, ("season", "format", "split"))),
+        (f"{max_workers} workers", lambda: aggregate_careers(matches, max_workers=max_workers)),
+    ]
+    baseline = None
+    rows = []
+    for name, func in cases:
+        elapsed = best_of(func, repeat)
+        baseline = baseline or elapsed
+        rows.append((name, f"{elapsed:.2f}", f"{size / elapsed:,.0f}", f"{baseline / elapsed:.1f}x"))
+
+    print_table(
+        f"Career aggregation over {size:,} matches in {len(competitions)} competitions",
+        ("strategy", "seconds", "matches/s", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark cross-competition career aggregation.")
+    parser.add_argument("--matches-per-competition", type=int, default=20_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    main(arguments.matches_per_competition, arguments.max_workers, arguments.repeat)
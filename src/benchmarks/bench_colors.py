@@ -0,0 +1,97 @@
+import argparse
+import tracemalloc
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_extra_types.color import Color
+
+from benchmarks.data import generate_teams
+from benchmarks.timing import best_of, print_table
+from enums import Region
+from models.team import Team
+from utils import UUIDMixin
+from utils.color import color_to_str, parse_color, unpack_color
+
+
+class LegacyTeam(BaseModel, UUIDMixin):
+    kings_name: str
+    queens_name: str
+    acronym: str = Field(pattern=r"^[A-Z0-9]{2,3}$")
+    region: Region
+    first_color: Color
+    second_color: Color | None = None
+
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+
+
+def allocated_bytes(func) -> int:
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return size
+
+
+def main(size: int, repeat: int) -> None:
+    rows = [team.model_dump(mode="json") for team in generate_teams(size)]
+    legacy_teams = [LegacyTeam(**row) for row in rows]
+    teams = [Team(**row) for row in rows]
+
+    def clear_caches():
+        parse_color.cache_clear()
+        unpack_color.cache_clear()
+        color_to_str.cache_clear()
+
+    cases = [
+        ("construct", lambda: [LegacyTeam(**row) for row in rows], lambda: [Team(**row) for row in rows]),
+        ("from_trusted", None, lambda: [Team.from_trusted(**row) for row in rows]),
+        (
+            "model_dump_json",
+            lambda: [team.model_dump_json() for team in legacy_teams],
+            lambda: [team.model_dump_json() for team in teams],
+        ),
+        (
+            "first_color access",
+            lambda: [team.first_color for team in legacy_teams],
+            lambda: [team.first_color for team in teams],
+        ),
+    ]
+
+    table = []
+    for name, legacy, packed in cases:
+        clear_caches()
+        packed_time = best_of(packed, repeat)
+        if legacy is None:
+            table.append((name, "", f"{size / packed_time:,.0f}", ""))
+            continue
+        legacy_time = best_of(legacy, repeat)
+        table.append(
+            (name, f"{size / legacy_time:,.0f}", f"{size / packed_time:,.0f}", f"{legacy_time / packed_time:.1f}x")
+        )
+
+    legacy_bytes = allocated_bytes(lambda: [LegacyTeam(**row) for row in rows])
+    packed_bytes = allocated_bytes(lambda: [Team(**row) for row in rows])
+    table.append(
+        (
+            "bytes per team",
+            f"{legacy_bytes / size:,.0f}",
+            f"{packed_bytes / size:,.0f}",
+            f"{legacy_bytes / packed_bytes:.1f}x",
+        )
+    )
+
+    print_table(
+        f"Team colors over {size:,} teams (teams/second)",
+        ("operation", "Color fields", "packed RGBA", "speedup"),
+        table,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark memoized, packed team colors against plain Color fields.")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    main(arguments.size, arguments.repeat)
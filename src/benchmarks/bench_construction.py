@@ -0,0 +1,85 @@
+import argparse
+import warnings
+
+from benchmarks.data import generate_competition, generate_match_table
+from benchmarks.timing import best_of_interleaved, print_table
+from models.competition import Competition
+from models.match import Match, PlayedMatch
+from models.team import Team
+
+
+def match_rows(table, played: bool) -> list[dict]:
+    rows = []
+    for match in table:
+        row = {
+            "uuid": match.uuid_str,
+            "competition": table.competition,
+            "matchday_round": match.matchday_round,
+            "home_team": match.home_team.uuid_str,
+            "away_team": match.away_team.uuid_str,
+        }
+        if played:
+            row.update(
+                home_goals=match.home_goals,
+                away_goals=match.away_goals,
+                home_shootout_goals=match.home_shootout_goals,
+                away_shootout_goals=match.away_shootout_goals,
+            )
+        rows.append(row)
+
+    return rows
+
+
+def validated(model, rows: list[dict]) -> list:
+    return [model(**model.resolve_row(row)) for row in rows]
+
+
+def main(size: int, repeat: int, verify_sample: float) -> None:
+    competition = generate_competition()
+    table = generate_match_table(competition, size)
+    competition_row = competition.model_dump(mode="json")
+
+    cases = {
+        "Team": (Team, competition_row["teams"] * (size // len(competition_row["teams"]))),
+        "Competition": (Competition, [competition_row] * (size // 100)),
+        "Match": (Match, match_rows(table, played=False)),
+        "PlayedMatch": (PlayedMatch, match_rows(table, played=True)),
+    }
+
+    rows = []
+    for name, (model, model_rows) in cases.items():
+        validated_time, trusted_time, sampled_time = best_of_interleaved(
+            [
+                lambda: validated(model, model_rows),
+                lambda: model.from_rows(model_rows),
+                lambda: model.from_rows(model_rows, verify_sample=verify_sample),
+            ],
+            repeat,
+        )
+        rows.append(
+            (
+                name,
+                f"{len(model_rows):,}",
+                f"{len(model_rows) / validated_time:,.0f}",
+                f"{len(model_rows) / trusted_time:,.0f}",
+                f"{len(model_rows) / sampled_time:,.0f}",
+                f"{validated_time / trusted_time:.1f}x",
+            )
+        )
+
+    print_table(
+        "Construction throughput (rows/second)",
+        ("model", "rows", "validated", "from_rows", f"from_rows ({verify_sample:.0%} verified)", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark validated versus trusted model construction.")
+    parser.add_argument("--size", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--verify-sample", type=float, default=0.05)
+    arguments = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    main(arguments.size, arguments.repeat, arguments.verify_sample)
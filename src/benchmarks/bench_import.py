@@ -0,0 +1,91 @@
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.timing import print_table
+
+SOURCE_ROOT = Path(__file__).resolve().parent.parent
+
+BUDGETS_MS = {
+    "enums": 25.0,
+    "exceptions": 50.0,
+    "utils": 50.0,
+    "utils.uuid_intern": 80.0,
+    "models": 50.0,
+    "models.team": 500.0,
+    "models.match": 600.0,
+}
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SOURCE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times.setdefault(name.strip(), (int(self_us), int(cumulative_us)))
+
+    return times
+
+
+def cold_start(module: str, repeat: int) -> tuple[float, dict[str, tuple[int, int]]]:
+    runs = [import_times(module) for _ in range(repeat)]
+    best = min(runs, key=lambda times: times[module][1])
+
+    return best[module][1] / 1000, best
+
+
+def main(modules: list[str], repeat: int, top: int, budget_scale: float) -> int:
+    rows, over_budget = [], []
+    heaviest = {}
+    for module in modules:
+        milliseconds, times = cold_start(module, repeat)
+        budget = BUDGETS_MS.get(module)
+        if budget is None:
+            status = ""
+        else:
+            budget *= budget_scale
+            status = "ok" if milliseconds <= budget else "OVER"
+            if milliseconds > budget:
+                over_budget.append(module)
+        rows.append((module, f"{milliseconds:.1f}", "" if budget is None else f"{budget:.1f}", status, len(times)))
+        heaviest[module] = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:top]
+
+    print_table(
+        f"Cold import time (best of {repeat} fresh interpreters, ms)",
+        ("module", "import", "budget", "status", "modules loaded"),
+        rows,
+    )
+
+    if top:
+        for module, imports in heaviest.items():
+            print_table(
+                f"Heaviest imports for {module} (self time, ms)",
+                ("module", "self", "cumulative"),
+                [
+                    (name, f"{self_us / 1000:.1f}", f"{cumulative_us / 1000:.1f}")
+                    for name, (self_us, cumulative_us) in imports
+                ],
+            )
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure cold import time of package entry points against budgets.")
+    parser.add_argument("modules", nargs="*", default=list(BUDGETS_MS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=0, help="Show the N heaviest imports for each module.")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply every budget, e.g. on slow CI.")
+    arguments = parser.parse_args()
+
+    sys.exit(main(arguments.modules, arguments.repeat, arguments.top, arguments.budget_scale))
@@ -0,0 +1,62 @@
+import argparse
+
+from benchmarks.data import generate_competition, generate_match_records, repeat_to_size
+from benchmarks.timing import best_of, print_table
+from models.competition import Competition
+from models.match import PlayedMatch
+from utils.instrumentation import instrument
+
+
+def main(size: int, repeat: int) -> None:
+    competition = generate_competition()
+    records = generate_match_records(competition, size)
+    for record in records:
+        record["competition"] = competition
+    team_uuids = repeat_to_size([team.uuid for team in competition.teams], size)
+    raw_get_team = Competition.get_team.__wrapped__
+
+    cases = [
+        ("get_team", lambda: [competition.get_team(uuid) for uuid in team_uuids]),
+        ("PlayedMatch(**row)", lambda: [PlayedMatch(**PlayedMatch.resolve_row(record)) for record in records]),
+    ]
+
+    rows = []
+    for name, func in cases:
+        disabled_time = best_of(func, repeat)
+        with instrument() as instrumentation:
+            enabled_time = best_of(func, repeat)
+        rows.append(
+            (
+                name,
+                f"{size / disabled_time:,.0f}",
+                f"{size / enabled_time:,.0f}",
+                f"{enabled_time / disabled_time - 1:+.1%}",
+            )
+        )
+
+    raw_time = best_of(lambda: [raw_get_team(competition, uuid) for uuid in team_uuids], repeat)
+    disabled_time = best_of(cases[0][1], repeat)
+    rows.append(("get_team (undecorated)", f"{size / raw_time:,.0f}", "", f"{disabled_time / raw_time - 1:+.1%}"))
+
+    print_table(
+        f"Instrumentation overhead over {size:,} calls (calls/second)",
+        ("operation", "disabled", "enabled", "overhead"),
+        rows,
+    )
+    print_table(
+        "Recorded while enabled",
+        ("function", "calls", "mean (us)"),
+        [
+            (name, f"{metrics['count']:,}", f"{metrics['mean_seconds'] * 1e6:.2f}")
+            for name, metrics in instrumentation.snapshot().items()
+        ],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the cost of instrumentation hooks on hot paths.")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    main(arguments.size, arguments.repeat)
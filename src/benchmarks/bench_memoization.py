@@ -0,0 +1,69 @@
+import argparse
+
+from benchmarks.data import generate_competition, generate_played_matches
+from benchmarks.timing import best_of, print_table
+from utils.memoization import clear_memo
+
+DUMP_EXCLUDE = {"competition"}
+
+
+def cold(matches, func):
+    def run():
+        results = []
+        for match in matches:
+            clear_memo(match)
+            clear_memo(match.home_team)
+            clear_memo(match.away_team)
+            results.append(func(match))
+
+        return results
+
+    return run
+
+
+def warm(matches, func):
+    def run():
+        return [func(match) for match in matches]
+
+    return run
+
+
+def main(size: int, repeat: int) -> None:
+    competition = generate_competition()
+    matches = generate_played_matches(competition, size)
+
+    cases = [
+        ("winner", lambda match: (match.winner, match.regular_time_winner)),
+        ("uuid_str", lambda match: match.uuid_str),
+        ("str()", str),
+        ("model_dump(json)", lambda match: match.model_dump(mode="json", exclude=DUMP_EXCLUDE)),
+    ]
+
+    rows = []
+    for name, func in cases:
+        cold_time = best_of(cold(matches, func), repeat)
+        warm(matches, func)()
+        warm_time = best_of(warm(matches, func), repeat)
+        rows.append(
+            (
+                name,
+                f"{size / cold_time:,.0f}",
+                f"{size / warm_time:,.0f}",
+                f"{cold_time / warm_time:.1f}x",
+            )
+        )
+
+    print_table(
+        f"Memoized properties over {size:,} matches (matches/second)",
+        ("operation", "cold", "memoized", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark memoized computed properties on played matches.")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    main(arguments.size, arguments.repeat)
@@ -0,0 +1,38 @@
+import argparse
+import os
+
+from benchmarks.data import generate_history, generate_match_records
+from benchmarks.timing import best_of, print_table
+from ingestion import validate_records
+
+
+def main(matches_per_competition: int, max_workers: int, repeat: int) -> None:
+    competitions = generate_history()
+    records = [
+        record
+        for seed, competition in enumerate(competitions)
+        for record in generate_match_records(competition, matches_per_competition, seed)
+    ]
+
+    rows = []
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        elapsed = best_of(lambda: validate_records(records, competitions, max_workers=workers), repeat)
+        baseline = baseline or elapsed
+        rows.append((workers, f"{elapsed:.3f}", f"{len(records) / elapsed:,.0f}", f"{baseline / elapsed:.2f}x"))
+
+    print_table(
+        f"Batch validation of {len(records):,} records across {len(competitions)} competitions",
+        ("workers", "seconds", "records/second", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark process pool validation scaling.")
+    parser.add_argument("--matches-per-competition", type=int, default=10_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--repeat", type=int, default=1)
+    arguments = parser.parse_args()
+
+    main(arguments.matches_per_competition, arguments.max_workers, arguments.repeat)
@@ -0,0 +1,50 @@
+import argparse
+from time import perf_counter
+
+from benchmarks.data import generate_history, generate_match_table
+from benchmarks.timing import print_table
+from ratings import EloRatings
+
+
+def main(size: int, objects: int) -> None:
+    competitions = generate_history()
+    tables = [
+        generate_match_table(competition, size // len(competitions), seed)
+        for seed, competition in enumerate(competitions)
+    ]
+    matches = list(tables[0])[:objects]
+    table_size = sum(len(table) for table in tables)
+
+    rows = []
+
+    ratings = EloRatings()
+    start = perf_counter()
+    for match in matches:
+        ratings.apply(match)
+    rows.append(("apply() per match", len(matches), perf_counter() - start))
+
+    ratings = EloRatings()
+    start = perf_counter()
+    ratings.replay(matches)
+    rows.append(("replay(PlayedMatch)", len(matches), perf_counter() - start))
+
+    ratings = EloRatings()
+    start = perf_counter()
+    for table in tables:
+        ratings.replay(table)
+    rows.append(("replay(MatchTable)", table_size, perf_counter() - start))
+
+    print_table(
+        f"Elo replay across {len(competitions)} competitions, {len(ratings)} teams",
+        ("method", "matches", "seconds", "matches/second"),
+        [(name, f"{count:,}", f"{elapsed:.2f}", f"{count / elapsed:,.0f}") for name, count, elapsed in rows],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark replaying a match history into Elo ratings.")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--objects", type=int, default=50_000)
+    arguments = parser.parse_args()
+
+    main(arguments.size, arguments.objects)
@@ -0,0 +1,57 @@
+import argparse
+
+from benchmarks.data import generate_competition, generate_played_matches
+from benchmarks.timing import best_of, print_table
+from enums import Kingdom
+from serialization import render_matches
+
+
+def legacy_team_name(team, kingdom: str) -> str:
+    return team.queens_name if Kingdom(kingdom) == Kingdom.QUEENS else team.kings_name
+
+
+def legacy_str(match) -> str:
+    home_team_name = legacy_team_name(match.home_team, match.competition.kingdom)
+    away_team_name = legacy_team_name(match.away_team, match.competition.kingdom)
+    if match.home_goals != match.away_goals:
+        return f"{home_team_name} {match.home_goals} - {match.away_goals} {away_team_name}"
+
+    return (
+        f"{home_team_name} {match.home_goals} ({match.home_shootout_goals}) - "
+        f"({match.away_shootout_goals}) {match.away_goals} {away_team_name}"
+    )
+
+
+def main(size: int, repeat: int) -> None:
+    rows = []
+    for kingdom in Kingdom:
+        matches = generate_played_matches(generate_competition(kingdom=kingdom), size)
+        assert "\n".join(legacy_str(match) for match in matches) == render_matches(matches)
+
+        legacy_time = best_of(lambda: "\n".join(legacy_str(match) for match in matches), repeat)
+        str_time = best_of(lambda: "\n".join(str(match) for match in matches), repeat)
+        bulk_time = best_of(lambda: render_matches(matches), repeat)
+        rows.append(
+            (
+                kingdom.value,
+                f"{size / legacy_time:,.0f}",
+                f"{size / str_time:,.0f}",
+                f"{size / bulk_time:,.0f}",
+                f"{legacy_time / bulk_time:.1f}x",
+            )
+        )
+
+    print_table(
+        f"Rendering {size:,} matches (matches/second)",
+        ("kingdom", "enum parsing", "str()", "render_matches", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark bulk match rendering against per-call enum parsing.")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    main(arguments.size, arguments.repeat)
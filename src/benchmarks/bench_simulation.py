@@ -0,0 +1,65 @@
+import argparse
+import os
+from time import perf_counter
+
+import numpy as np
+
+from benchmarks.data import generate_competition
+from benchmarks.timing import print_table
+from scheduling import round_robin
+from simulation import SeasonSimulator
+
+
+def split_fixtures(played_rounds: int, seed: int = 0) -> tuple:
+    competition = generate_competition(team_count=12)
+    rng = np.random.default_rng(seed)
+
+    matches = []
+    for match in round_robin(competition):
+        if match.matchday_round > played_rounds:
+            matches.append(match)
+            continue
+
+        home_goals, away_goals = (int(goals) for goals in rng.poisson((3.0, 2.7)))
+        shootout = (None, None) if home_goals != away_goals else (3, 2) if rng.random() < 0.5 else (2, 3)
+        matches.append(match.to_played_match(home_goals, away_goals, *shootout))
+
+    return competition, matches
+
+
+def main(simulations: int, played_rounds: int, workers: int) -> None:
+    competition, matches = split_fixtures(played_rounds)
+    simulator = SeasonSimulator(competition, matches)
+
+    rows = []
+    for max_workers in sorted({1, workers}):
+        start = perf_counter()
+        result = simulator.run(simulations, seed=0, max_workers=max_workers)
+        elapsed = perf_counter() - start
+        rows.append((max_workers, f"{elapsed:.2f}", f"{simulations / elapsed:,.0f}"))
+
+    print_table(
+        f"{simulations:,} simulations of a 12-team split, {len(simulator.home_team)} matches remaining",
+        ("workers", "seconds", "simulations/second"),
+        rows,
+    )
+
+    probabilities = sorted(
+        zip(result.teams, result.title_probabilities(), result.top_probabilities(4), result.expected_points()),
+        key=lambda row: -row[1],
+    )
+    print_table(
+        "Projected standings",
+        ("team", "title", "top 4", "points"),
+        [(team.acronym, f"{title:.3f}", f"{top:.3f}", f"{points:.1f}") for team, title, top, points in probabilities],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Monte Carlo simulation of the remaining split fixtures.")
+    parser.add_argument("--simulations", type=int, default=100_000)
+    parser.add_argument("--played-rounds", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    arguments = parser.parse_args()
+
+    main(arguments.simulations, arguments.played_rounds, arguments.workers)
@@ -0,0 +1,52 @@
+import argparse
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from benchmarks.data import generate_competition, generate_played_matches
+from benchmarks.timing import print_table
+from storage import SQLiteRepository
+from storage.sqlite_repository import UPSERT_MATCH, _match_row
+
+
+def row_by_row(repository: SQLiteRepository, matches) -> None:
+    repository.save_competitions({match.competition for match in matches})
+    for match in matches:
+        with repository.connection:
+            repository.connection.execute(UPSERT_MATCH, _match_row(match))
+
+
+def main(size: int, row_by_row_size: int) -> None:
+    matches = generate_played_matches(generate_competition(), size)
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        with SQLiteRepository(Path(directory) / "row_by_row.db") as repository:
+            start = perf_counter()
+            row_by_row(repository, matches[:row_by_row_size])
+            rows.append(("row by row", row_by_row_size, perf_counter() - start))
+
+        with SQLiteRepository(Path(directory) / "bulk.db") as repository:
+            start = perf_counter()
+            repository.save_matches(matches)
+            rows.append(("save_matches", size, perf_counter() - start))
+
+        with SQLiteRepository(Path(directory) / "bulk.db") as repository:
+            start = perf_counter()
+            loaded = sum(1 for _ in repository.matches())
+            rows.append(("matches() stream", loaded, perf_counter() - start))
+
+    print_table(
+        "SQLite repository on disk",
+        ("operation", "matches", "seconds", "matches/second"),
+        [(name, f"{count:,}", f"{elapsed:.2f}", f"{count / elapsed:,.0f}") for name, count, elapsed in rows],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark SQLite repository writes and streaming loads.")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--row-by-row-size", type=int, default=2_000)
+    arguments = parser.parse_args()
+
+    main(arguments.size, arguments.row_by_row_size)
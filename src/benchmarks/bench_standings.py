@@ -0,0 +1,70 @@
+import argparse
+
+from benchmarks.data import generate_competition, generate_match_table, repeat_to_size
+from benchmarks.timing import best_of, print_table
+from models.competition import Competition
+from models.match import PlayedMatch
+from standings import PointsSystem, StandingsEngine
+
+POOL_SIZE = 10_000
+
+
+def naive_points(competition: Competition, matches: list[PlayedMatch], points_system: PointsSystem) -> dict:
+    points = {team.uuid: 0 for team in competition.teams}
+    goals_for = {team.uuid: 0 for team in competition.teams}
+    goals_against = {team.uuid: 0 for team in competition.teams}
+
+    for match in matches:
+        winner = match.winner
+        loser = match.away_team if winner.uuid == match.home_team.uuid else match.home_team
+        if match.regular_time_winner:
+            points[winner.uuid] += points_system.regulation_win
+            points[loser.uuid] += points_system.regulation_loss
+        else:
+            points[winner.uuid] += points_system.shootout_win
+            points[loser.uuid] += points_system.shootout_loss
+        goals_for[match.home_team.uuid] += match.home_goals
+        goals_for[match.away_team.uuid] += match.away_goals
+        goals_against[match.home_team.uuid] += match.away_goals
+        goals_against[match.away_team.uuid] += match.home_goals
+
+    return {"points": points, "goals_for": goals_for, "goals_against": goals_against}
+
+
+def main(sizes: list[int], repeat: int) -> None:
+    competition = generate_competition()
+    engine = StandingsEngine()
+    pool = list(generate_match_table(competition, POOL_SIZE))
+
+    rows = []
+    for size in sizes:
+        matches = repeat_to_size(pool, size)
+        table = generate_match_table(competition, size)
+
+        naive = best_of(lambda: naive_points(competition, matches, engine.points_system), repeat)
+        from_models = best_of(lambda: engine.compute(competition, matches), repeat)
+        from_table = best_of(lambda: engine.compute(competition, table), repeat)
+        rows.append(
+            (
+                f"{size:,}",
+                f"{naive:.4f}",
+                f"{from_models:.4f}",
+                f"{from_table:.4f}",
+                f"{naive / from_table:.0f}x",
+            )
+        )
+
+    print_table(
+        "Standings: naive PlayedMatch loop vs StandingsEngine (seconds, best of runs)",
+        ("matches", "naive loop", "engine (models)", "engine (MatchTable)", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the standings engine against a naive loop.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    main(arguments.sizes, arguments.repeat)
@@ -0,0 +1,65 @@
+import argparse
+from uuid import UUID
+
+from benchmarks.data import generate_competition
+from benchmarks.timing import best_of, print_table
+from utils.uuid_intern import intern_uuid, uuid_to_str
+
+
+def legacy_has_team(competition, team_uuid: str) -> bool:
+    return UUID(team_uuid) in competition._teams_dict
+
+
+def main(lookups: int, repeat: int) -> None:
+    competition = generate_competition()
+    teams = sorted(competition.teams, key=lambda team: team.uuid)
+    uuid_strings = [str(team.uuid) for team in teams] * (lookups // len(teams))
+    uuids = [intern_uuid(value) for value in uuid_strings]
+
+    cases = [
+        (
+            "parse",
+            lambda: [UUID(value) for value in uuid_strings],
+            lambda: [intern_uuid(value) for value in uuid_strings],
+        ),
+        ("to str", lambda: [str(value) for value in uuids], lambda: [uuid_to_str(value) for value in uuids]),
+        (
+            "has_team(str)",
+            lambda: [legacy_has_team(competition, value) for value in uuid_strings],
+            lambda: [competition.has_team(value) for value in uuid_strings],
+        ),
+        (
+            "has_team(UUID)",
+            lambda: [legacy_has_team(competition, str(value)) for value in uuids],
+            lambda: [competition.has_team(value) for value in uuids],
+        ),
+        (
+            "get_team(UUID)",
+            lambda: [competition._teams_dict[UUID(str(value))] for value in uuids],
+            lambda: [competition.get_team(value) for value in uuids],
+        ),
+    ]
+
+    rows = []
+    for name, before, after in cases:
+        before_time = best_of(before, repeat)
+        after_time = best_of(after, repeat)
+        rows.append(
+            (
+                name,
+                f"{len(uuids) / before_time:,.0f}",
+                f"{len(uuids) / after_time:,.0f}",
+                f"{before_time / after_time:.1f}x",
+            )
+        )
+
+    print_table("UUID lookups (operations/second)", ("operation", "before", "interned", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark UUID interning against per-call parsing.")
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    main(arguments.lookups, arguments.repeat)
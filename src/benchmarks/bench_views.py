@@ -0,0 +1,52 @@
+import argparse
+import gc
+import tracemalloc
+
+from benchmarks.data import generate_competition, generate_match_table
+from benchmarks.timing import best_of, print_table
+from models.views import from_views, to_views
+
+
+def main(size: int, repeat: int) -> None:
+    table = generate_match_table(generate_competition(), size)
+
+    gc.collect()
+    tracemalloc.start()
+    matches = list(table)
+    model_bytes, _ = tracemalloc.get_traced_memory()
+
+    views = to_views(matches)
+    del matches
+    gc.collect()
+    view_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    matches = list(from_views(views))
+    to_views_time = best_of(lambda: to_views(matches), repeat)
+    from_views_time = best_of(lambda: list(from_views(views)), repeat)
+    winner_time = best_of(lambda: [match.winner for match in matches], repeat)
+    view_winner_time = best_of(lambda: [view.winner for view in views], repeat)
+
+    print_table(
+        f"Read-only views over {size:,} played matches",
+        ("measure", "PlayedMatch", "PlayedMatchView", "ratio"),
+        [
+            (
+                "bytes per match",
+                f"{model_bytes / size:,.0f}",
+                f"{view_bytes / size:,.0f}",
+                f"{model_bytes / view_bytes:.1f}x",
+            ),
+            ("winner (matches/s)", f"{size / winner_time:,.0f}", f"{size / view_winner_time:,.0f}", ""),
+            ("convert into (matches/s)", f"{size / from_views_time:,.0f}", f"{size / to_views_time:,.0f}", ""),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare memory of pydantic matches against slot-based views.")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    main(arguments.size, arguments.repeat)
@@ -0,0 +1,124 @@
+from uuid import UUID
+
+import numpy as np
+
+from enums import CompetitionFormat, Kingdom, Region
+from models.competition import Competition
+from models.match import PlayedMatch
+from models.team import Team
+from storage.match_table import NULL_GOALS, UUID_DTYPE, MatchTable
+
+COLORS = ("red", "blue", "white", "black", "green", "yellow", "orange", "purple")
+
+
+def generate_teams(count: int, region: Region = Region.ESP, offset: int = 0) -> list[Team]:
+    return [
+        Team(
+            uuid=str(UUID(int=offset + index + 1)),
+            kings_name=f"Kings Team {offset + index + 1}",
+            queens_name=f"Queens Team {offset + index + 1}",
+            acronym=f"T{(offset + index) % 100:02d}",
+            region=region,
+            first_color=COLORS[index % len(COLORS)],
+            second_color=COLORS[(index + 1) % len(COLORS)],
+        )
+        for index in range(count)
+    ]
+
+
+def generate_competition(
+    team_count: int = 12,
+    region: Region = Region.ESP,
+    kingdom: Kingdom = Kingdom.KINGS,
+    season: int = 2024,
+    split: int = 1,
+) -> Competition:
+    region_index = list(Region).index(region)
+    kingdom_index = list(Kingdom).index(kingdom)
+
+    return Competition(
+        uuid=str(UUID(int=(1 << 64) + region_index * 1_000_000 + kingdom_index * 100_000 + season * 10 + split)),
+        region=region,
+        kingdom=kingdom,
+        format=CompetitionFormat.LEAGUE,
+        season=season,
+        split=split,
+        teams=generate_teams(team_count, region, offset=region_index * 1_000),
+    )
+
+
+def generate_history(team_count: int = 12, seasons: tuple[int, ...] = (2023, 2024, 2025)) -> list[Competition]:
+    return [
+        generate_competition(team_count, region, kingdom, season)
+        for region in Region
+        for kingdom in Kingdom
+        for season in seasons
+    ]
+
+
+def generate_match_table(competition: Competition, count: int, seed: int = 0) -> MatchTable:
+    rng = np.random.default_rng(seed)
+    team_count = len(competition.teams)
+
+    home_team = rng.integers(0, team_count, count)
+    away_team = (home_team + rng.integers(1, team_count, count)) % team_count
+    home_goals = rng.poisson(3.0, count)
+    away_goals = rng.poisson(2.7, count)
+
+    draw = home_goals == away_goals
+    home_shootout_goals = rng.integers(0, 6, count)
+    away_shootout_goals = rng.integers(0, 5, count)
+    away_shootout_goals = np.where(
+        away_shootout_goals >= home_shootout_goals, away_shootout_goals + 1, away_shootout_goals
+    )
+
+    uuids = np.zeros((count, 2), dtype=">u8")
+    uuids[:, 0] = (2 << 60) + (competition.uuid.int & 0xFFFF_FFFF)
+    uuids[:, 1] = np.arange(count)
+
+    return MatchTable(
+        competition=competition,
+        uuids=uuids.view(UUID_DTYPE).ravel(),
+        matchday_round=rng.integers(1, 12, count),
+        home_team=home_team,
+        away_team=away_team,
+        home_goals=home_goals,
+        away_goals=away_goals,
+        home_shootout_goals=np.where(draw, home_shootout_goals, NULL_GOALS),
+        away_shootout_goals=np.where(draw, away_shootout_goals, NULL_GOALS),
+    )
+
+
+def generate_played_matches(competition: Competition, count: int, seed: int = 0) -> list[PlayedMatch]:
+    return list(generate_match_table(competition, count, seed))
+
+
+def generate_match_records(competition: Competition, count: int, seed: int = 0) -> list[dict]:
+    table = generate_match_table(competition, count, seed)
+    competition_uuid = competition.uuid_str
+    team_uuids = [team.uuid_str for team in table.teams]
+    match_uuids = [str(UUID(bytes=value.tobytes())) for value in table.uuids]
+
+    return [
+        {
+            "uuid": match_uuids[index],
+            "competition": competition_uuid,
+            "matchday_round": int(table.matchday_round[index]),
+            "home_team": team_uuids[table.home_team[index]],
+            "away_team": team_uuids[table.away_team[index]],
+            "home_goals": int(table.home_goals[index]),
+            "away_goals": int(table.away_goals[index]),
+            "home_shootout_goals": (
+                None if table.home_shootout_goals[index] == NULL_GOALS else int(table.home_shootout_goals[index])
+            ),
+            "away_shootout_goals": (
+                None if table.away_shootout_goals[index] == NULL_GOALS else int(table.away_shootout_goals[index])
+            ),
+        }
+        for index in range(count)
+    ]
+
+
+def repeat_to_size(items: list, count: int) -> list:
+    repeats, remainder = divmod(count, len(items))
+    return items * repeats + items[:remainder]
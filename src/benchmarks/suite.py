@@ -0,0 +1,225 @@
+import argparse
+import json
+import platform
+import sys
+import warnings
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from benchmarks.data import generate_competition, generate_match_records, repeat_to_size
+from benchmarks.timing import best_of, best_of_interleaved, print_table
+from models.competition import Competition
+from models.match import Match, PlayedMatch
+from models.team import Team
+from serialization import dump_matches_json, load_matches_json
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+MATCH_FIELDS = ("uuid", "competition", "matchday_round", "home_team", "away_team")
+REFERENCE = "reference workload"
+
+Case = tuple[str, int, Callable[[], object]]
+Results = dict[str, dict[str, float]]
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    case: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def slowdown(self) -> float:
+        return self.current / self.baseline
+
+
+def reference_workload(size: int) -> Callable[[], object]:
+    values = list(range(size))
+
+    def run() -> object:
+        table = {value: (value, str(value)) for value in values}
+        return sorted(table.values(), key=lambda item: -item[0])
+
+    return run
+
+
+def build_cases(size: int) -> list[Case]:
+    competition = generate_competition()
+    competition_row = competition.model_dump(mode="json")
+    team_rows = repeat_to_size(competition_row["teams"], size)
+    competition_rows = [competition_row] * max(1, size // 100)
+
+    records = generate_match_records(competition, size)
+    for record in records:
+        record["competition"] = competition
+    fixture_records = [{field: record[field] for field in MATCH_FIELDS} for record in records]
+
+    matches = [PlayedMatch(**PlayedMatch.resolve_row(record)) for record in records]
+    team_uuids = repeat_to_size([team.uuid for team in competition.teams], size)
+    lookup_uuids = repeat_to_size([team.uuid for team in competition.teams] + [UUID(int=0)], size)
+
+    adapter = TypeAdapter(list[PlayedMatch])
+    matches_json = adapter.dump_json(matches)
+    normalized_json = dump_matches_json(matches)
+
+    return [
+        ("construct Team", len(team_rows), lambda: [Team(**row) for row in team_rows]),
+        ("construct Competition", len(competition_rows), lambda: [Competition(**row) for row in competition_rows]),
+        ("construct Match", size, lambda: [Match(**Match.resolve_row(row)) for row in fixture_records]),
+        ("construct PlayedMatch", size, lambda: [PlayedMatch(**PlayedMatch.resolve_row(row)) for row in records]),
+        ("Competition.get_team", size, lambda: [competition.get_team(uuid) for uuid in team_uuids]),
+        ("Competition.has_team", size, lambda: [competition.has_team(uuid) for uuid in lookup_uuids]),
+        ("model_dump(json)", size, lambda: [match.model_dump(mode="json") for match in matches]),
+        ("model_dump_json", size, lambda: [match.model_dump_json() for match in matches]),
+        ("dump_json (list)", size, lambda: adapter.dump_json(matches)),
+        ("validate_json (list)", size, lambda: adapter.validate_json(matches_json)),
+        ("load_matches_json", size, lambda: load_matches_json(normalized_json)),
+        ("__str__", size, lambda: [str(match) for match in matches]),
+    ]
+
+
+def run_suite(size: int, repeat: int, only: str | None = None, names: Collection[str] | None = None) -> Results:
+    reference = reference_workload(size)
+    results = {}
+    reference_timings = []
+    for name, items, func in build_cases(size):
+        if (only is not None and only not in name) or (names is not None and name not in names):
+            continue
+        seconds, reference_seconds = best_of_interleaved([func, reference], repeat)
+        reference_timings.append(reference_seconds)
+        results[name] = {
+            "items": items,
+            "seconds": seconds,
+            "per_item": seconds / items,
+            "relative": seconds / reference_seconds * size / items,
+        }
+
+    reference_seconds = min(reference_timings, default=best_of(reference, repeat))
+    return {REFERENCE: {"items": size, "seconds": reference_seconds, "per_item": reference_seconds / size}, **results}
+
+
+def record_baseline(size: int, repeat: int, runs: int, only: str | None = None) -> Results:
+    # The noise of each case is the spread of its relative cost over several runs. Comparisons allow at least
+    # twice that much drift, so cases that swing a lot between runs do not fail on an unchanged tree.
+    history = [run_suite(size, repeat, only) for _ in range(runs)]
+    results = history[0]
+    for name, result in results.items():
+        relatives = [run[name]["relative"] for run in history if "relative" in run[name]]
+        if relatives:
+            result["relative"] = sorted(relatives)[len(relatives) // 2]
+            result["noise"] = max(relatives) / min(relatives) - 1
+
+    return results
+
+
+def save_results(path: Path, size: int, repeat: int, results: Results) -> None:
+    document = {
+        "size": size,
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def case_threshold(baseline: dict[str, float], threshold: float) -> float:
+    return max(threshold, 2 * baseline.get("noise", 0.0))
+
+
+def find_regressions(baseline: Results, results: Results, threshold: float) -> list[Regression]:
+    regressions = []
+    for name, result in results.items():
+        if "relative" not in result or "relative" not in baseline.get(name, {}):
+            continue
+        limit = case_threshold(baseline[name], threshold)
+        if result["relative"] > baseline[name]["relative"] * (1 + limit):
+            regressions.append(Regression(name, baseline[name]["relative"], result["relative"], limit))
+
+    return regressions
+
+
+def main(
+    size: int,
+    repeat: int,
+    runs: int,
+    save: Path | None,
+    compare: Path | None,
+    threshold: float,
+    only: str | None,
+) -> int:
+    results = record_baseline(size, repeat, runs, only) if save is not None else run_suite(size, repeat, only)
+    baseline = json.loads(compare.read_text(encoding="utf-8"))["results"] if compare is not None else {}
+
+    rows = []
+    for name, result in results.items():
+        relative = result.get("relative")
+        change = limit = ""
+        if relative is not None and "relative" in baseline.get(name, {}):
+            change = f"{relative / baseline[name]['relative'] - 1:+.1%}"
+            limit = f"+{case_threshold(baseline[name], threshold):.0%}"
+        rows.append(
+            (
+                name,
+                f"{result['items']:,}",
+                f"{result['items'] / result['seconds']:,.0f}",
+                "" if relative is None else f"{relative:.3f}",
+                change,
+                limit,
+            )
+        )
+    print_table(
+        f"Model benchmark suite, size {size:,} (items/second, cost relative to the reference workload)",
+        ("case", "items", "throughput", "relative", "vs baseline", "allowed"),
+        rows,
+    )
+
+    if save is not None:
+        save_results(save, size, repeat, results)
+        print(f"Saved results to {save}")
+
+    regressions = find_regressions(baseline, results, threshold)
+    if regressions:
+        # A single slow run on a shared machine is not a regression: time the suspects again and keep only the
+        # cases that are slower twice.
+        retry = run_suite(size, repeat, names={regression.case for regression in regressions})
+        regressions = find_regressions(baseline, retry, threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.case}: {regression.slowdown:.2f}x slower than baseline "
+            f"(allowed {1 + regression.threshold:.2f}x)"
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run the model benchmark suite and compare its cost, relative to a pure-Python reference "
+        "workload timed in the same run, against a baseline."
+    )
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=3, help="Suite runs used to measure noise when saving.")
+    parser.add_argument("--save", type=Path, nargs="?", const=DEFAULT_BASELINE, default=None)
+    parser.add_argument("--compare", type=Path, nargs="?", const=DEFAULT_BASELINE, default=None)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--only", default=None, help="Run only cases whose name contains this text.")
+    arguments = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    sys.exit(
+        main(
+            arguments.size,
+            arguments.repeat,
+            arguments.runs,
+            arguments.save,
+            arguments.compare,
+            arguments.threshold,
+            arguments.only,
+        )
+    )
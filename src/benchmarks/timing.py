@@ -0,0 +1,31 @@
+from collections.abc import Callable
+from time import perf_counter
+
+
+def best_of(func: Callable[[], object], repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+
+    return min(timings)
+
+
+def best_of_interleaved(funcs: list[Callable[[], object]], repeat: int = 3) -> list[float]:
+    timings = [[] for _ in funcs]
+    for _ in range(repeat):
+        for func, func_timings in zip(funcs, timings):
+            start = perf_counter()
+            func()
+            func_timings.append(perf_counter() - start)
+
+    return [min(func_timings) for func_timings in timings]
+
+
+def print_table(title: str, header: tuple[str, ...], rows: list[tuple]) -> None:
+    widths = [max(len(str(value)) for value in column) for column in zip(header, *rows)]
+    print(title)
+    for row in (header, *rows):
+        print("  ".join(str(value).rjust(width) for value, width in zip(row, widths)))
+    print()
@@ -0,0 +1,60 @@
+from utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "ColumnLengthMismatchException": ".match_table_exceptions",
+    "CompetitionException": ".competition_exceptions",
+    "CompetitionMismatchException": ".match_exceptions",
+    "CompetitionNotInSeasonFileException": ".serialization_exceptions",
+    "CompetitionNotRegisteredException": ".registry_exceptions",
+    "DuplicateSeedException": ".scheduling_exceptions",
+    "DuplicateTeamUUIDException": ".competition_exceptions",
+    "EqualShootoutGoalsException": ".match_exceptions",
+    "IdenticalTeamsException": ".match_exceptions",
+    "IncompatibleAggregateException": ".standings_exceptions",
+    "IndexException": ".index_exceptions",
+    "IngestionException": ".ingestion_exceptions",
+    "InvalidEnumValueError": ".enum_exceptions",
+    "InvalidFieldValueException": ".validation_exceptions",
+    "InvalidGroupFieldException": ".standings_exceptions",
+    "InvalidMatchFilterException": ".index_exceptions",
+    "InvalidRegistryFilterException": ".registry_exceptions",
+    "InvalidRepositoryFilterException": ".repository_exceptions",
+    "InvalidSampleRateException": ".shared_exceptions",
+    "InvalidSeasonFileException": ".serialization_exceptions",
+    "InvalidSimulationCountException": ".simulation_exceptions",
+    "InvalidSplitException": ".competition_exceptions",
+    "InvalidUUIDException": ".shared_exceptions",
+    "MatchException": ".match_exceptions",
+    "MatchNotIndexedException": ".index_exceptions",
+    "MatchTableException": ".match_table_exceptions",
+    "MissingBracketResultException": ".scheduling_exceptions",
+    "MissingShootoutGoalsException": ".match_exceptions",
+    "NonDrawShootoutGoalsException": ".match_exceptions",
+    "NotEnoughTeamsException": ".scheduling_exceptions",
+    "PlayedMatchException": ".match_exceptions",
+    "RatingException": ".rating_exceptions",
+    "RecordNotFoundException": ".repository_exceptions",
+    "RegionMismatchException": ".competition_exceptions",
+    "RegistryException": ".registry_exceptions",
+    "RepositoryException": ".repository_exceptions",
+    "ResultAlreadyAppliedException": ".standings_exceptions",
+    "ResultNotFoundException": ".standings_exceptions",
+    "SchedulingException": ".scheduling_exceptions",
+    "SeasonFileInUseException": ".serialization_exceptions",
+    "SerializationException": ".serialization_exceptions",
+    "SimulationException": ".simulation_exceptions",
+    "StandingsException": ".standings_exceptions",
+    "TeamIndexOutOfRangeException": ".match_table_exceptions",
+    "TeamNotFoundException": ".competition_exceptions",
+    "TeamNotInCompetitionException": ".match_exceptions",
+    "TeamNotRatedException": ".rating_exceptions",
+    "UnknownCompetitionException": ".ingestion_exceptions",
+    "UnknownMatchException": ".ingestion_exceptions",
+    "UnplayedMatchException": ".match_table_exceptions",
+    "UnsupportedSeasonFileVersionException": ".serialization_exceptions",
+    "ValidationException": ".validation_exceptions",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
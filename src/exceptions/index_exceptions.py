@@ -0,0 +1,14 @@
+class IndexException(Exception):
+    pass
+
+
+class MatchNotIndexedException(IndexException):
+    def __init__(self, match_uuid: str):
+        self.message = f"Match '{match_uuid}' is not indexed."
+        super().__init__(self.message)
+
+
+class InvalidMatchFilterException(IndexException):
+    def __init__(self, field: str, valid_fields: tuple[str, ...]):
+        self.message = f"Cannot filter matches by '{field}'. Must be one of {valid_fields}."
+        super().__init__(self.message)
@@ -0,0 +1,14 @@
+class IngestionException(Exception):
+    pass
+
+
+class UnknownCompetitionException(IngestionException):
+    def __init__(self, competition_uuid: str):
+        self.message = f"Competition '{competition_uuid}' is not in the competition registry."
+        super().__init__(self.message)
+
+
+class UnknownMatchException(IngestionException):
+    def __init__(self, match_uuid: str):
+        self.message = f"Match '{match_uuid}' is not a known fixture."
+        super().__init__(self.message)
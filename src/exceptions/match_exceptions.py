@@ -13,6 +13,12 @@ class TeamNotInCompetitionException(MatchException):
         super().__init__(self.message)
 
 
+class CompetitionMismatchException(MatchException):
+    def __init__(self, match_uuid: str, competition_uuid: str):
+        self.message = f"Match '{match_uuid}' does not belong to competition '{competition_uuid}'."
+        super().__init__(self.message)
+
+
 class PlayedMatchException(MatchException):
     pass
 
@@ -0,0 +1,20 @@
+class MatchTableException(Exception):
+    pass
+
+
+class ColumnLengthMismatchException(MatchTableException):
+    def __init__(self, lengths: dict[str, int]):
+        self.message = f"All match table columns must have the same length, got: {lengths}."
+        super().__init__(self.message)
+
+
+class TeamIndexOutOfRangeException(MatchTableException):
+    def __init__(self, team_count: int):
+        self.message = f"Team indices must be between 0 and {team_count - 1}."
+        super().__init__(self.message)
+
+
+class UnplayedMatchException(MatchTableException):
+    def __init__(self, match_uuid: str):
+        self.message = f"Match '{match_uuid}' has not been played yet."
+        super().__init__(self.message)
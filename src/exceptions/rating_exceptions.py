@@ -0,0 +1,8 @@
+class RatingException(Exception):
+    pass
+
+
+class TeamNotRatedException(RatingException):
+    def __init__(self, team_uuid: str):
+        self.message = f"Team '{team_uuid}' has no rating yet."
+        super().__init__(self.message)
@@ -0,0 +1,14 @@
+class RegistryException(Exception):
+    pass
+
+
+class CompetitionNotRegisteredException(RegistryException):
+    def __init__(self, competition_uuid: str):
+        self.message = f"Competition '{competition_uuid}' is not registered."
+        super().__init__(self.message)
+
+
+class InvalidRegistryFilterException(RegistryException):
+    def __init__(self, field: str, valid_fields: tuple[str, ...]):
+        self.message = f"Cannot filter competitions by '{field}'. Must be one of {valid_fields}."
+        super().__init__(self.message)
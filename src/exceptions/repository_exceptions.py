@@ -0,0 +1,14 @@
+class RepositoryException(Exception):
+    pass
+
+
+class RecordNotFoundException(RepositoryException):
+    def __init__(self, table: str, uuid: str):
+        self.message = f"No record with ID '{uuid}' in table '{table}'."
+        super().__init__(self.message)
+
+
+class InvalidRepositoryFilterException(RepositoryException):
+    def __init__(self, field: str, valid_fields: tuple[str, ...]):
+        self.message = f"Cannot filter stored matches by '{field}'. Must be one of {valid_fields}."
+        super().__init__(self.message)
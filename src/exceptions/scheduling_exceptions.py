@@ -0,0 +1,20 @@
+class SchedulingException(Exception):
+    pass
+
+
+class NotEnoughTeamsException(SchedulingException):
+    def __init__(self, team_count: int):
+        self.message = f"At least two teams are needed to build fixtures, got {team_count}."
+        super().__init__(self.message)
+
+
+class MissingBracketResultException(SchedulingException):
+    def __init__(self, home_team_name: str, away_team_name: str):
+        self.message = f"No played match found for bracket pairing '{home_team_name} - {away_team_name}'."
+        super().__init__(self.message)
+
+
+class DuplicateSeedException(SchedulingException):
+    def __init__(self, team_name: str):
+        self.message = f"Team '{team_name}' appears more than once in the seeds."
+        super().__init__(self.message)
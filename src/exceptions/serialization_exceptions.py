@@ -0,0 +1,26 @@
+class SerializationException(Exception):
+    pass
+
+
+class InvalidSeasonFileException(SerializationException):
+    def __init__(self, reason: str):
+        self.message = f"Invalid season file: {reason}."
+        super().__init__(self.message)
+
+
+class UnsupportedSeasonFileVersionException(SerializationException):
+    def __init__(self, version: int, supported_version: int):
+        self.message = f"Season file version {version} is not supported (expected {supported_version})."
+        super().__init__(self.message)
+
+
+class CompetitionNotInSeasonFileException(SerializationException):
+    def __init__(self, competition_uuid: str):
+        self.message = f"Competition '{competition_uuid}' is not stored in the season file."
+        super().__init__(self.message)
+
+
+class SeasonFileInUseException(SerializationException):
+    def __init__(self):
+        self.message = "Season file cannot be closed while views of its records are still referenced."
+        super().__init__(self.message)
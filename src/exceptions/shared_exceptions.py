@@ -2,3 +2,9 @@ class InvalidUUIDException(ValueError):
     def __init__(self, value: str):
         self.message = f"The provided ID '{value}' is not a valid UUID."
         super().__init__(self.message)
+
+
+class InvalidSampleRateException(ValueError):
+    def __init__(self, value: float):
+        self.message = f"The sample rate must be between 0 and 1, got {value}."
+        super().__init__(self.message)
@@ -0,0 +1,8 @@
+class SimulationException(Exception):
+    pass
+
+
+class InvalidSimulationCountException(SimulationException, ValueError):
+    def __init__(self, simulations: int):
+        self.message = f"The number of simulations must be positive, got {simulations}."
+        super().__init__(self.message)
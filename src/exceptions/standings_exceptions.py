@@ -0,0 +1,26 @@
+class StandingsException(Exception):
+    pass
+
+
+class ResultAlreadyAppliedException(StandingsException):
+    def __init__(self, match_uuid: str):
+        self.message = f"A result for match '{match_uuid}' has already been applied."
+        super().__init__(self.message)
+
+
+class ResultNotFoundException(StandingsException):
+    def __init__(self, match_uuid: str):
+        self.message = f"No result has been applied for match '{match_uuid}'."
+        super().__init__(self.message)
+
+
+class InvalidGroupFieldException(StandingsException):
+    def __init__(self, invalid_fields: list[str], valid_fields: tuple[str, ...]):
+        self.message = f"Cannot group by {', '.join(invalid_fields)}. Valid fields are: {', '.join(valid_fields)}."
+        super().__init__(self.message)
+
+
+class IncompatibleAggregateException(StandingsException):
+    def __init__(self, group_by: tuple[str, ...], other_group_by: tuple[str, ...]):
+        self.message = f"Cannot merge an aggregate grouped by {other_group_by} into one grouped by {group_by}."
+        super().__init__(self.message)
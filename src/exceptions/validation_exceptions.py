@@ -0,0 +1,14 @@
+class ValidationException(Exception):
+    pass
+
+
+class InvalidFieldValueException(ValidationException):
+    def __init__(self, field: str, value, expected: str):
+        self.message = f"Field '{field}' has invalid value {value!r}: expected {expected}."
+        super().__init__(self.message)
+
+
+class MissingFieldException(ValidationException):
+    def __init__(self, field: str):
+        self.message = f"Field '{field}' is required."
+        super().__init__(self.message)
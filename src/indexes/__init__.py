@@ -0,0 +1,4 @@
+from .competition_registry import CompetitionRegistry
+from .match_index import MatchIndex
+
+__all__ = ["CompetitionRegistry", "MatchIndex"]
@@ -0,0 +1,99 @@
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from enum import Enum
+from itertools import count
+from typing import Any
+from uuid import UUID
+
+from exceptions.registry_exceptions import (
+    CompetitionNotRegisteredException,
+    InvalidRegistryFilterException,
+)
+from models.competition import Competition
+from models.team import Team
+from utils import UUIDMixin
+
+
+class CompetitionRegistry(Mapping[UUID, Competition]):
+    INDEXED_FIELDS = ("region", "kingdom", "format", "season", "split")
+    FILTERS = (*INDEXED_FIELDS, "team")
+
+    def __init__(self, competitions: Iterable[Competition] = ()):
+        self._competitions: dict[UUID, Competition] = {}
+        self._order: dict[UUID, int] = {}
+        self._counter = count()
+        self._indexes: dict[str, dict[Any, set[UUID]]] = {field: defaultdict(set) for field in self.INDEXED_FIELDS}
+        self._team_index: dict[UUID, set[UUID]] = defaultdict(set)
+
+        for competition in competitions:
+            self.add(competition)
+
+    def add(self, competition: Competition) -> None:
+        if competition.uuid in self._competitions:
+            self.remove(competition.uuid)
+
+        self._competitions[competition.uuid] = competition
+        self._order[competition.uuid] = next(self._counter)
+        for field, index in self._indexes.items():
+            index[getattr(competition, field)].add(competition.uuid)
+        for team in competition.teams:
+            self._team_index[team.uuid].add(competition.uuid)
+
+    def remove(self, competition_uuid: str | UUID) -> Competition:
+        competition_uuid = UUIDMixin.validate_uuid(competition_uuid)
+        competition = self._competitions.pop(competition_uuid, None)
+        if competition is None:
+            raise CompetitionNotRegisteredException(str(competition_uuid))
+
+        del self._order[competition_uuid]
+        for field, index in self._indexes.items():
+            self._discard(index, getattr(competition, field), competition_uuid)
+        for team in competition.teams:
+            self._discard(self._team_index, team.uuid, competition_uuid)
+
+        return competition
+
+    def find(self, **filters: Any) -> list[Competition]:
+        postings = []
+        for field, value in filters.items():
+            if field not in self.FILTERS:
+                raise InvalidRegistryFilterException(field, self.FILTERS)
+            postings.append(self._postings(field, value))
+
+        if not postings:
+            return list(self._competitions.values())
+
+        postings.sort(key=len)
+        matches = set(postings[0])
+        for posting in postings[1:]:
+            if not matches:
+                break
+            matches.intersection_update(posting)
+
+        return [self._competitions[uuid] for uuid in sorted(matches, key=self._order.__getitem__)]
+
+    def competitions_for_team(self, team: Team | str | UUID) -> list[Competition]:
+        return self.find(team=team)
+
+    def _postings(self, field: str, value: Any) -> set[UUID]:
+        if field == "team":
+            team_uuid = value.uuid if isinstance(value, Team) else UUIDMixin.validate_uuid(value)
+            return self._team_index.get(team_uuid, set())
+
+        return self._indexes[field].get(value.value if isinstance(value, Enum) else value, set())
+
+    @staticmethod
+    def _discard(index: dict[Any, set[UUID]], key: Any, competition_uuid: UUID) -> None:
+        posting = index[key]
+        posting.discard(competition_uuid)
+        if not posting:
+            del index[key]
+
+    def __getitem__(self, competition_uuid: str | UUID) -> Competition:
+        return self._competitions[UUIDMixin.validate_uuid(competition_uuid)]
+
+    def __iter__(self) -> Iterator[UUID]:
+        return iter(self._competitions)
+
+    def __len__(self) -> int:
+        return len(self._competitions)
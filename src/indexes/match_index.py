@@ -0,0 +1,236 @@
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+
+from exceptions.index_exceptions import (
+    InvalidMatchFilterException,
+    MatchNotIndexedException,
+)
+from models.competition import Competition
+from models.match import Match, PlayedMatch
+from models.team import Team
+from utils import UUIDMixin
+
+Postings = dict[int, int]
+
+CHUNK_SHIFT = 12
+CHUNK_MASK = (1 << CHUNK_SHIFT) - 1
+CHUNK_BYTES = (1 << CHUNK_SHIFT) // 8
+COMPACT_MIN_REMOVED = 1_024
+
+
+class MatchIndex(Mapping[UUID, Match]):
+    INDEXED_FIELDS = ("competition", "matchday_round", "home_team", "away_team")
+    FILTERS = (*INDEXED_FIELDS, "team", "played")
+
+    def __init__(self, matches: Iterable[Match] = ()):
+        self._reset()
+        for match in matches:
+            self.add(match)
+
+    def add(self, match: Match) -> None:
+        position = self._positions.get(match.uuid)
+        if position is None:
+            position = self._positions[match.uuid] = len(self._matches)
+            self._matches.append(match)
+            _set(self._live, position)
+        else:
+            self._unlink(position)
+            self._matches[position] = match
+
+        for field, key in self._keys(match):
+            _set(self._postings[field][key], position)
+        _set(self._pairs[match.home_team.uuid, match.away_team.uuid], position)
+        if match.is_played():
+            _set(self._played, position)
+
+    def remove(self, match_uuid: str | UUID) -> Match:
+        position = self._positions.pop(UUIDMixin.validate_uuid(match_uuid), None)
+        if position is None:
+            raise MatchNotIndexedException(str(match_uuid))
+
+        match = self._unlink(position)
+        _unset(self._live, position)
+        self._matches[position] = None
+
+        removed = len(self._matches) - len(self._positions)
+        if removed >= COMPACT_MIN_REMOVED and removed * 2 >= len(self._matches):
+            self._compact()
+
+        return match
+
+    def play(
+        self,
+        match_uuid: str | UUID,
+        home_goals: int,
+        away_goals: int,
+        home_shootout_goals: int | None = None,
+        away_shootout_goals: int | None = None,
+    ) -> PlayedMatch:
+        played_match = self[match_uuid].to_played_match(
+            home_goals, away_goals, home_shootout_goals, away_shootout_goals
+        )
+        self.add(played_match)
+
+        return played_match
+
+    def postings(self, **filters: Any) -> Postings:
+        included, excluded = [], []
+        for field, value in filters.items():
+            if field == "played" and not value:
+                excluded.append(self._played)
+            else:
+                included.append(self._filter_postings(field, value))
+
+        return intersect(*(included or [self._live]), excluded=excluded)
+
+    def find(self, **filters: Any) -> list[Match]:
+        return self.matches(self.postings(**filters))
+
+    def head_to_head(self, first_team: Team | str | UUID, second_team: Team | str | UUID) -> list[Match]:
+        first_uuid, second_uuid = _team_uuid(first_team), _team_uuid(second_team)
+        pairs = self._pairs
+
+        return self.matches(union(pairs.get((first_uuid, second_uuid), {}), pairs.get((second_uuid, first_uuid), {})))
+
+    def matches(self, postings: Postings) -> list[Match]:
+        return [self._matches[position] for position in positions(postings)]
+
+    def _filter_postings(self, field: str, value: Any) -> Postings:
+        if field == "played":
+            return self._played
+        if field == "team":
+            return union(self._filter_postings("home_team", value), self._filter_postings("away_team", value))
+        if field not in self.INDEXED_FIELDS:
+            raise InvalidMatchFilterException(field, self.FILTERS)
+
+        postings = self._postings[field]
+        values = value if isinstance(value, range | list | tuple | set | frozenset) else (value,)
+
+        return union(*(postings.get(self._key(field, item), {}) for item in values))
+
+    @staticmethod
+    def _key(field: str, value: Any) -> Any:
+        if field == "matchday_round":
+            return value
+        if field == "competition":
+            return _competition_uuid(value)
+
+        return _team_uuid(value)
+
+    def _keys(self, match: Match) -> tuple[tuple[str, Any], ...]:
+        return (
+            ("competition", match.competition.uuid),
+            ("matchday_round", match.matchday_round),
+            ("home_team", match.home_team.uuid),
+            ("away_team", match.away_team.uuid),
+        )
+
+    def _unlink(self, position: int) -> Match:
+        match = self._matches[position]
+
+        for field, key in self._keys(match):
+            _discard(self._postings[field], key, position)
+        _discard(self._pairs, (match.home_team.uuid, match.away_team.uuid), position)
+        _unset(self._played, position)
+
+        return match
+
+    def _reset(self) -> None:
+        self._matches: list[Match | None] = []
+        self._positions: dict[UUID, int] = {}
+        self._postings: dict[str, dict[Any, Postings]] = {field: defaultdict(dict) for field in self.INDEXED_FIELDS}
+        self._pairs: dict[tuple[UUID, UUID], Postings] = defaultdict(dict)
+        self._live: Postings = {}
+        self._played: Postings = {}
+
+    def _compact(self) -> None:
+        matches = [match for match in self._matches if match is not None]
+        self._reset()
+        for match in matches:
+            self.add(match)
+
+    def __getitem__(self, match_uuid: str | UUID) -> Match:
+        position = self._positions.get(UUIDMixin.validate_uuid(match_uuid))
+        if position is None:
+            raise KeyError(match_uuid)
+
+        return self._matches[position]
+
+    def __iter__(self) -> Iterator[UUID]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+def positions(postings: Postings) -> np.ndarray:
+    if not postings:
+        return np.empty(0, dtype=np.intp)
+
+    chunks = sorted(postings)
+    data = np.frombuffer(b"".join(postings[chunk].to_bytes(CHUNK_BYTES, "little") for chunk in chunks), dtype=np.uint8)
+    bits = np.flatnonzero(np.unpackbits(data, bitorder="little"))
+
+    return np.array(chunks, dtype=np.intp)[bits >> CHUNK_SHIFT] << CHUNK_SHIFT | bits & CHUNK_MASK
+
+
+def intersect(*postings: Postings, excluded: Iterable[Postings] = ()) -> Postings:
+    if not postings:
+        return {}
+
+    smallest = min(postings, key=len)
+    others = [other for other in postings if other is not smallest]
+    excluded = list(excluded)
+    result: Postings = {}
+    for chunk, bits in smallest.items():
+        for other in others:
+            bits &= other.get(chunk, 0)
+            if not bits:
+                break
+        for other in excluded:
+            bits &= ~other.get(chunk, 0)
+        if bits:
+            result[chunk] = bits
+
+    return result
+
+
+def union(*postings: Postings) -> Postings:
+    result: Postings = {}
+    for chunk_bitmaps in postings:
+        for chunk, bits in chunk_bitmaps.items():
+            result[chunk] = result.get(chunk, 0) | bits
+
+    return result
+
+
+def _set(postings: Postings, position: int) -> None:
+    chunk = position >> CHUNK_SHIFT
+    postings[chunk] = postings.get(chunk, 0) | 1 << (position & CHUNK_MASK)
+
+
+def _unset(postings: Postings, position: int) -> None:
+    chunk = position >> CHUNK_SHIFT
+    bits = postings.get(chunk, 0) & ~(1 << (position & CHUNK_MASK))
+    if bits:
+        postings[chunk] = bits
+    else:
+        postings.pop(chunk, None)
+
+
+def _discard(postings: dict[Any, Postings], key: Any, position: int) -> None:
+    _unset(postings[key], position)
+    if not postings[key]:
+        del postings[key]
+
+
+def _team_uuid(team: Team | str | UUID) -> UUID:
+    return team.uuid if isinstance(team, Team) else UUIDMixin.validate_uuid(team)
+
+
+def _competition_uuid(competition: Competition | str | UUID) -> UUID:
+    return competition.uuid if isinstance(competition, Competition) else UUIDMixin.validate_uuid(competition)
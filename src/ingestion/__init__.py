@@ -0,0 +1,22 @@
+from .ndjson import (
+    RowError,
+    parse_played_match,
+    read_played_match_batches,
+    read_played_matches,
+)
+from .parallel import BatchValidationResult, RowFailure, validate_records
+from .pipeline import IngestionPipeline, NDJSONSink, StageMetrics, StandingsSink
+
+__all__ = [
+    "BatchValidationResult",
+    "IngestionPipeline",
+    "NDJSONSink",
+    "RowError",
+    "RowFailure",
+    "StageMetrics",
+    "StandingsSink",
+    "parse_played_match",
+    "read_played_match_batches",
+    "read_played_matches",
+    "validate_records",
+]
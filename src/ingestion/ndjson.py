@@ -0,0 +1,75 @@
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, TextIO
+from uuid import UUID
+
+from exceptions.ingestion_exceptions import UnknownCompetitionException
+from models.competition import Competition
+from models.match import PlayedMatch
+from utils.uuid_intern import intern_uuid
+
+Source = str | Path | TextIO | Iterable[str]
+Competitions = Mapping[UUID, Competition] | Iterable[Competition]
+
+
+@dataclass(frozen=True, slots=True)
+class RowError:
+    line_number: int
+    line: str
+    exception: Exception
+
+
+ErrorSink = Callable[[RowError], Any]
+
+
+def read_played_matches(
+    source: Source, competitions: Competitions, errors: ErrorSink | None = None
+) -> Iterator[PlayedMatch]:
+    registry = _registry(competitions)
+
+    for line_number, line in _lines(source):
+        if not line.strip():
+            continue
+        try:
+            yield parse_played_match(line, registry)
+        except Exception as exception:
+            if errors is None:
+                raise
+            errors(RowError(line_number, line, exception))
+
+
+def read_played_match_batches(
+    source: Source, competitions: Competitions, batch_size: int = 1_000, errors: ErrorSink | None = None
+) -> Iterator[list[PlayedMatch]]:
+    matches = read_played_matches(source, competitions, errors)
+    while batch := list(islice(matches, batch_size)):
+        yield batch
+
+
+def parse_played_match(line: str | bytes, competitions: Mapping[UUID, Competition]) -> PlayedMatch:
+    row = json.loads(line)
+
+    competition = competitions.get(intern_uuid(row["competition"]))
+    if competition is None:
+        raise UnknownCompetitionException(row["competition"])
+    row["competition"] = competition
+
+    return PlayedMatch(**PlayedMatch.resolve_row(row))
+
+
+def _registry(competitions: Competitions) -> Mapping[UUID, Competition]:
+    if isinstance(competitions, Mapping):
+        return competitions
+
+    return {competition.uuid: competition for competition in competitions}
+
+
+def _lines(source: Source) -> Iterator[tuple[int, str]]:
+    if isinstance(source, str | Path):
+        with open(source, encoding="utf-8") as file:
+            yield from enumerate(file, start=1)
+    else:
+        yield from enumerate(source, start=1)
@@ -0,0 +1,149 @@
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from exceptions.ingestion_exceptions import UnknownCompetitionException
+from models.competition import Competition
+from models.match import PlayedMatch
+from utils.uuid_intern import intern_uuid
+
+ValidatedRow = tuple[int, int, int, int, int | None, int | None]
+
+_worker_competitions: dict[UUID, Competition] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class RowFailure:
+    row: int
+    exception_type: str
+    message: str
+
+
+@dataclass(slots=True)
+class BatchValidationResult:
+    matches: list[PlayedMatch] = field(default_factory=list)
+    rows: list[int] = field(default_factory=list)
+    failures: list[RowFailure] = field(default_factory=list)
+
+    @property
+    def failures_by_type(self) -> dict[str, list[RowFailure]]:
+        grouped = defaultdict(list)
+        for failure in self.failures:
+            grouped[failure.exception_type].append(failure)
+
+        return dict(grouped)
+
+
+def validate_records(
+    records: Sequence[Mapping[str, Any]],
+    competitions: Iterable[Competition],
+    max_workers: int | None = None,
+    chunk_size: int = 5_000,
+) -> BatchValidationResult:
+    registry = {competition.uuid: competition for competition in competitions}
+    chunks, failures = _split_by_competition(records, registry, chunk_size)
+
+    if max_workers == 1:
+        outcomes = [_validate_rows(registry[competition_uuid], rows) for competition_uuid, rows in chunks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(list(registry.values()),)
+        ) as executor:
+            outcomes = list(executor.map(_validate_chunk, *zip(*chunks))) if chunks else []
+
+    validated: list[tuple[ValidatedRow, Competition]] = []
+    for competition_uuid, (rows, chunk_failures) in zip((chunk[0] for chunk in chunks), outcomes):
+        validated.extend((row, registry[competition_uuid]) for row in rows)
+        failures.extend(chunk_failures)
+
+    validated.sort(key=lambda item: item[0][0])
+    failures.sort(key=lambda failure: failure.row)
+
+    result = BatchValidationResult(failures=failures)
+    for values, competition in validated:
+        row, matchday_round, home_goals, away_goals, home_shootout_goals, away_shootout_goals = values
+        record = records[row]
+        result.rows.append(row)
+        result.matches.append(
+            PlayedMatch.from_trusted(
+                uuid=record["uuid"],
+                competition=competition,
+                matchday_round=matchday_round,
+                home_team=record["home_team"],
+                away_team=record["away_team"],
+                home_goals=home_goals,
+                away_goals=away_goals,
+                home_shootout_goals=home_shootout_goals,
+                away_shootout_goals=away_shootout_goals,
+            )
+        )
+
+    return result
+
+
+def _split_by_competition(
+    records: Sequence[Mapping[str, Any]], registry: Mapping[UUID, Competition], chunk_size: int
+) -> tuple[list[tuple[UUID, list[tuple[int, Mapping[str, Any]]]]], list[RowFailure]]:
+    grouped: dict[UUID, list[tuple[int, Mapping[str, Any]]]] = defaultdict(list)
+    failures = []
+
+    for index, record in enumerate(records):
+        try:
+            competition_uuid = intern_uuid(record["competition"])
+            if competition_uuid not in registry:
+                raise UnknownCompetitionException(str(record["competition"]))
+        except Exception as exception:
+            failures.append(_failure(index, exception))
+            continue
+        grouped[competition_uuid].append((index, record))
+
+    chunks = []
+    for competition_uuid, rows in grouped.items():
+        for start in range(0, len(rows), chunk_size):
+            end = start + chunk_size
+            chunks.append((competition_uuid, rows[start:end]))
+
+    return chunks, failures
+
+
+def _init_worker(competitions: list[Competition]) -> None:
+    _worker_competitions.clear()
+    _worker_competitions.update((competition.uuid, competition) for competition in competitions)
+
+
+def _validate_chunk(
+    competition_uuid: UUID, rows: list[tuple[int, Mapping[str, Any]]]
+) -> tuple[list[ValidatedRow], list[RowFailure]]:
+    return _validate_rows(_worker_competitions[competition_uuid], rows)
+
+
+def _validate_rows(
+    competition: Competition, rows: list[tuple[int, Mapping[str, Any]]]
+) -> tuple[list[ValidatedRow], list[RowFailure]]:
+    validated, failures = [], []
+
+    for index, record in rows:
+        try:
+            match = PlayedMatch(**PlayedMatch.resolve_row({**record, "competition": competition}))
+        except Exception as exception:
+            failures.append(_failure(index, exception))
+            continue
+        validated.append(
+            (
+                index,
+                match.matchday_round,
+                match.home_goals,
+                match.away_goals,
+                match.home_shootout_goals,
+                match.away_shootout_goals,
+            )
+        )
+
+    return validated, failures
+
+
+def _failure(row: int, exception: Exception) -> RowFailure:
+    return RowFailure(row, type(exception).__name__, str(exception))
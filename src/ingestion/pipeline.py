@@ -0,0 +1,295 @@
+import asyncio
+import inspect
+import json
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable, Mapping
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, TextIO
+from uuid import UUID
+
+from exceptions.ingestion_exceptions import UnknownMatchException
+from exceptions.match_exceptions import CompetitionMismatchException
+from ingestion.ndjson import ErrorSink, RowError
+from models.match import Match, PlayedMatch
+from serialization.normalized import PLAYED_MATCH_FIELDS
+from standings.incremental import IncrementalStandings
+from utils.uuid_intern import intern_uuid
+
+RawRecord = str | bytes | Mapping[str, Any]
+Sink = Callable[[list[PlayedMatch]], Awaitable[Any] | Any]
+Update = tuple[int, float, RawRecord, Match, tuple[int, int, int | None, int | None]]
+
+STAGES = ("parse", "validate", "sink")
+
+_DONE = object()
+
+
+@dataclass(slots=True)
+class StageMetrics:
+    items: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.items / self.busy_seconds if self.busy_seconds else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.items if self.items else 0.0
+
+    def record(self, started: float, arrivals: Iterable[float]) -> None:
+        finished = perf_counter()
+        self.batches += 1
+        self.busy_seconds += finished - started
+        for arrival in arrivals:
+            latency = finished - arrival
+            self.items += 1
+            self.total_latency += latency
+            if latency > self.max_latency:
+                self.max_latency = latency
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "items": self.items,
+            "batches": self.batches,
+            "busy_seconds": self.busy_seconds,
+            "throughput": self.throughput,
+            "mean_latency": self.mean_latency,
+            "max_latency": self.max_latency,
+        }
+
+
+class StandingsSink:
+    def __init__(self, standings: Iterable[IncrementalStandings]):
+        self.standings = {table.competition.uuid: table for table in standings}
+
+    def __call__(self, matches: list[PlayedMatch]) -> None:
+        for match in matches:
+            table = self.standings.get(match.competition.uuid)
+            if table is None:
+                continue
+            if match.uuid in table:
+                table.correct(match)
+            else:
+                table.apply(match)
+
+
+class NDJSONSink:
+    def __init__(self, target: str | Path | TextIO):
+        self._owned = isinstance(target, str | Path)
+        self.file: TextIO = open(target, "a", encoding="utf-8") if self._owned else target
+
+    def __call__(self, matches: list[PlayedMatch]) -> None:
+        self.file.writelines(json.dumps(_result_row(match), separators=(",", ":")) + "\n" for match in matches)
+        self.file.flush()
+
+    def close(self) -> None:
+        if self._owned:
+            self.file.close()
+
+
+class IngestionPipeline:
+    def __init__(
+        self,
+        fixtures: Mapping[UUID, Match],
+        sinks: Iterable[Sink],
+        batch_size: int = 500,
+        batch_timeout: float = 0.05,
+        queue_size: int = 10_000,
+        executor: Executor | None = None,
+        errors: ErrorSink | None = None,
+    ):
+        self.fixtures = fixtures
+        self.sinks = list(sinks)
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.executor = executor
+        self.errors: list[RowError] = []
+        self._error_sink = errors or self.errors.append
+        self.metrics = {stage: StageMetrics() for stage in STAGES}
+
+        self._queue_size = queue_size
+        self._sequence = 0
+        self._tasks: list[asyncio.Task] = []
+        self._failure: BaseException | None = None
+
+    async def start(self) -> None:
+        self._raw: asyncio.Queue = asyncio.Queue(self._queue_size)
+        self._parsed: asyncio.Queue = asyncio.Queue(self._queue_size)
+        self._validated: asyncio.Queue = asyncio.Queue(max(1, self._queue_size // self.batch_size))
+        self._tasks = [
+            asyncio.create_task(self._parse_stage()),
+            asyncio.create_task(self._validate_stage()),
+            asyncio.create_task(self._sink_stage()),
+        ]
+        for task in self._tasks:
+            task.add_done_callback(self._stop_on_failure)
+
+    async def submit(self, record: RawRecord) -> None:
+        if self._failure is not None:
+            await self._join()
+        self._sequence += 1
+        await self._raw.put((self._sequence, perf_counter(), record))
+
+    async def close(self) -> None:
+        if self._failure is None:
+            await self._raw.put(_DONE)
+        await self._join()
+
+    async def run(self, records: Iterable[RawRecord] | AsyncIterable[RawRecord]) -> None:
+        async with self:
+            if isinstance(records, AsyncIterable):
+                async for record in records:
+                    await self.submit(record)
+            else:
+                for record in records:
+                    await self.submit(record)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        return {stage: metrics.snapshot() for stage, metrics in self.metrics.items()}
+
+    async def __aenter__(self) -> "IngestionPipeline":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            await self.close()
+        else:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+
+    async def _parse_stage(self) -> None:
+        metrics = self.metrics["parse"]
+        while (item := await self._raw.get()) is not _DONE:
+            started = perf_counter()
+            sequence, arrival, record = item
+            try:
+                match, goals = self._parse(record)
+            except Exception as exception:
+                self._fail(sequence, record, exception)
+                continue
+            metrics.record(started, (arrival,))
+            await self._parsed.put((sequence, arrival, record, match, goals))
+
+        await self._parsed.put(_DONE)
+
+    async def _validate_stage(self) -> None:
+        metrics = self.metrics["validate"]
+        loop = asyncio.get_running_loop()
+        done = False
+
+        while not done:
+            batch, done = await self._next_batch()
+            if not batch:
+                continue
+
+            started = perf_counter()
+            outcomes = await loop.run_in_executor(self.executor, _validate_batch, [update[3:] for update in batch])
+
+            validated, arrivals = [], []
+            for (sequence, arrival, record, _, _), outcome in zip(batch, outcomes):
+                if isinstance(outcome, Exception):
+                    self._fail(sequence, record, outcome)
+                else:
+                    validated.append(outcome)
+                    arrivals.append(arrival)
+            metrics.record(started, arrivals)
+
+            if validated:
+                await self._validated.put((validated, arrivals))
+
+        await self._validated.put(_DONE)
+
+    async def _next_batch(self) -> tuple[list[Update], bool]:
+        batch: list[Update] = []
+        loop = asyncio.get_running_loop()
+        deadline = None
+
+        while len(batch) < self.batch_size:
+            if deadline is None:
+                item = await self._parsed.get()
+                deadline = loop.time() + self.batch_timeout
+            else:
+                try:
+                    item = await asyncio.wait_for(self._parsed.get(), max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    async def _sink_stage(self) -> None:
+        metrics = self.metrics["sink"]
+        while (item := await self._validated.get()) is not _DONE:
+            started = perf_counter()
+            matches, arrivals = item
+            for sink in self.sinks:
+                result = sink(matches)
+                if inspect.isawaitable(result):
+                    await result
+            metrics.record(started, arrivals)
+
+    def _parse(self, record: RawRecord) -> tuple[Match, tuple[int, int, int | None, int | None]]:
+        row = json.loads(record) if isinstance(record, str | bytes) else record
+
+        match = self.fixtures.get(intern_uuid(row["uuid"]))
+        if match is None:
+            raise UnknownMatchException(str(row["uuid"]))
+        if "competition" in row and intern_uuid(row["competition"]) != match.competition.uuid:
+            raise CompetitionMismatchException(match.uuid_str, str(row["competition"]))
+
+        return match, tuple(row.get(field) for field in PLAYED_MATCH_FIELDS)
+
+    async def _join(self) -> None:
+        try:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        finally:
+            self._tasks = []
+        if self._failure is not None:
+            raise self._failure
+
+    def _stop_on_failure(self, task: asyncio.Task) -> None:
+        if task.cancelled() or task.exception() is None or self._failure is not None:
+            return
+
+        self._failure = task.exception()
+        for other in self._tasks:
+            other.cancel()
+        while not self._raw.empty():
+            self._raw.get_nowait()
+
+    def _fail(self, sequence: int, record: RawRecord, exception: Exception) -> None:
+        line = record if isinstance(record, str) else record.decode() if isinstance(record, bytes) else repr(record)
+        self._error_sink(RowError(sequence, line, exception))
+
+
+def _validate_batch(updates: list[tuple[Match, tuple]]) -> list[PlayedMatch | Exception]:
+    outcomes: list[PlayedMatch | Exception] = []
+    for match, goals in updates:
+        try:
+            outcomes.append(match.to_played_match(*goals))
+        except Exception as exception:
+            outcomes.append(exception)
+
+    return outcomes
+
+
+def _result_row(match: PlayedMatch) -> dict[str, Any]:
+    return {
+        "uuid": match.uuid_str,
+        "competition": match.competition.uuid_str,
+        "matchday_round": match.matchday_round,
+        "home_team": match.home_team.uuid_str,
+        "away_team": match.away_team.uuid_str,
+        **{field: getattr(match, field) for field in PLAYED_MATCH_FIELDS},
+    }
@@ -1,5 +1,24 @@
-from .competition import Competition
-from .match import Match, PlayedMatch
-from .team import Team
+from typing import TYPE_CHECKING
 
-__all__ = ["Competition", "PlayedMatch", "Match", "Team"]
+from utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .competition import Competition
+    from .match import Match, PlayedMatch
+    from .team import Team
+    from .views import MatchView, PlayedMatchView, TeamView
+
+__all__ = ["Competition", "PlayedMatch", "Match", "Team", "MatchView", "PlayedMatchView", "TeamView"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Competition": ".competition",
+        "Match": ".match",
+        "PlayedMatch": ".match",
+        "Team": ".team",
+        "MatchView": ".views",
+        "PlayedMatchView": ".views",
+        "TeamView": ".views",
+    },
+)
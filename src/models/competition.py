@@ -1,4 +1,5 @@
-from typing import Self
+from collections.abc import Iterable
+from typing import Any, Self
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, PositiveInt, model_validator
@@ -10,11 +11,17 @@ from exceptions.competition_exceptions import (
     RegionMismatchException,
     TeamNotFoundException,
 )
-from models.team import Team
-from utils import UUIDMixin
+from models.team import Team, get_kingdom_index
+from utils import TrustedConstructionMixin, UUIDMixin
+from utils.instrumentation import instrumented
+from utils.memoization import MEMO_SLOT, memoized_property
+from utils.trusted_construction_mixin import construct_trusted, trusted_enum_value
+from utils.uuid_intern import intern_uuid
 
 
-class Competition(BaseModel, UUIDMixin):
+class Competition(BaseModel, UUIDMixin, TrustedConstructionMixin):
+    __slots__ = (MEMO_SLOT,)
+
     region: Region
     kingdom: Kingdom
     format: CompetitionFormat
@@ -22,15 +29,31 @@ class Competition(BaseModel, UUIDMixin):
     split: PositiveInt | None = None
     teams: frozenset[Team]
 
-    model_config = ConfigDict(frozen=True, use_enum_values=True)
+    model_config = ConfigDict(frozen=True, use_enum_values=True, ignored_types=(memoized_property,), defer_build=True)
 
     _teams_dict: dict[UUID, Team] = {}
 
-    def __init__(self, **data):
-        super().__init__(**data)
+    def model_post_init(self, __context: Any) -> None:
         self._teams_dict = {team.uuid: team for team in self.teams}
 
+    @classmethod
+    def from_trusted(cls, **data) -> Self:
+        data["uuid"] = intern_uuid(data["uuid"])
+        data["region"] = trusted_enum_value(Region, data["region"])
+        data["kingdom"] = trusted_enum_value(Kingdom, data["kingdom"])
+        data["format"] = trusted_enum_value(CompetitionFormat, data["format"])
+        data["teams"] = frozenset(cls._trusted_teams(data["teams"]))
+
+        return construct_trusted(cls, data)
+
+    @staticmethod
+    def _trusted_teams(teams: Iterable[Team | dict]) -> Iterable[Team]:
+        from_trusted = Team.from_trusted
+        for team in teams:
+            yield team if isinstance(team, Team) else from_trusted(**team)
+
     @model_validator(mode="after")
+    @instrumented("Competition.validate_split")
     def validate_split(self) -> Self:
         if self.split is None and self.format == CompetitionFormat.LEAGUE.value:
             raise InvalidSplitException("Split cannot be None for a league competition.")
@@ -40,6 +63,7 @@ class Competition(BaseModel, UUIDMixin):
         return self
 
     @model_validator(mode="after")
+    @instrumented("Competition.validate_unique_team_uuids")
     def validate_unique_team_uuids(self) -> Self:
         seen_uuids = {}
         duplicate_teams = []
@@ -59,6 +83,7 @@ class Competition(BaseModel, UUIDMixin):
         return self
 
     @model_validator(mode="after")
+    @instrumented("Competition.validate_teams_region")
     def validate_teams_region(self) -> Self:
         invalid_teams = [team.acronym for team in self.teams if team.region != self.region]
         if invalid_teams:
@@ -66,8 +91,10 @@ class Competition(BaseModel, UUIDMixin):
 
         return self
 
-    def get_team(self, team_uuid: str) -> Team:
-        team_uuid = self.validate_uuid(team_uuid)
+    @instrumented("Competition.get_team")
+    def get_team(self, team_uuid: str | UUID) -> Team:
+        if not isinstance(team_uuid, UUID):
+            team_uuid = self.validate_uuid(team_uuid)
 
         team = self._teams_dict.get(team_uuid)
         if not team:
@@ -75,7 +102,16 @@ class Competition(BaseModel, UUIDMixin):
 
         return team
 
-    def has_team(self, team_uuid: str) -> bool:
-        team_uuid = self.validate_uuid(team_uuid)
+    @memoized_property
+    def kingdom_index(self) -> int:
+        return get_kingdom_index(self.kingdom)
+
+    def team_name(self, team: Team) -> str:
+        return team.team_names[self.kingdom_index]
+
+    @instrumented("Competition.has_team")
+    def has_team(self, team_uuid: str | UUID) -> bool:
+        if not isinstance(team_uuid, UUID):
+            team_uuid = self.validate_uuid(team_uuid)
 
         return team_uuid in self._teams_dict
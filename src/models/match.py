@@ -1,4 +1,6 @@
-from typing import Self
+from collections.abc import Mapping
+from typing import Any, Self
+from uuid import UUID
 
 from pydantic import (
     BaseModel,
@@ -18,27 +20,59 @@ from exceptions.match_exceptions import (
 )
 from models.competition import Competition
 from models.team import Team
-from utils import UUIDMixin
+from utils import TrustedConstructionMixin, UUIDMixin
+from utils.instrumentation import instrumented
+from utils.memoization import MEMO_SLOT, memoized_property
+from utils.trusted_construction_mixin import construct_trusted
+from utils.uuid_intern import intern_uuid
 
 
-class Match(BaseModel, UUIDMixin):
+class Match(BaseModel, UUIDMixin, TrustedConstructionMixin):
+    __slots__ = (MEMO_SLOT,)
+
     competition: Competition
     matchday_round: PositiveInt
     home_team: Team
     away_team: Team
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    @classmethod
+    def from_trusted(cls, **data) -> Self:
+        data = dict(cls.resolve_row(data))
+        data["uuid"] = intern_uuid(data["uuid"])
+
+        return construct_trusted(cls, data)
+
+    @classmethod
+    def resolve_row(cls, row: Mapping[str, Any]) -> Mapping[str, Any]:
+        competition = row["competition"]
+        if not isinstance(competition, Competition):
+            competition = Competition.from_trusted(**competition)
+            row = {**row, "competition": competition}
+
+        home_team, away_team = row["home_team"], row["away_team"]
+        if isinstance(home_team, Team) and isinstance(away_team, Team):
+            return row
+
+        return {
+            **row,
+            "home_team": home_team if isinstance(home_team, Team) else competition.get_team(_team_reference(home_team)),
+            "away_team": away_team if isinstance(away_team, Team) else competition.get_team(_team_reference(away_team)),
+        }
 
     @model_validator(mode="after")
+    @instrumented("Match.validate_teams_in_competition")
     def validate_teams_in_competition(self) -> Self:
-        if not self.competition.has_team(self.home_team.uuid_str):
+        if not self.competition.has_team(self.home_team.uuid):
             raise TeamNotInCompetitionException(self.home_team.get_team_name(self.competition.kingdom))
-        if not self.competition.has_team(self.away_team.uuid_str):
+        if not self.competition.has_team(self.away_team.uuid):
             raise TeamNotInCompetitionException(self.away_team.get_team_name(self.competition.kingdom))
 
         return self
 
     @model_validator(mode="after")
+    @instrumented("Match.validate_different_teams")
     def validate_different_teams(self) -> Self:
         if self.home_team == self.away_team:
             raise IdenticalTeamsException(self.home_team.get_team_name(self.competition.kingdom))
@@ -56,7 +90,7 @@ class Match(BaseModel, UUIDMixin):
         away_shootout_goals: NonNegativeInt | None = None,
     ) -> "PlayedMatch":
         return PlayedMatch(
-            uuid=self.uuid_str,
+            uuid=self.uuid,
             competition=self.competition,
             matchday_round=self.matchday_round,
             home_team=self.home_team,
@@ -67,11 +101,13 @@ class Match(BaseModel, UUIDMixin):
             away_shootout_goals=away_shootout_goals,
         )
 
+    def render(self, home_team_name: str, away_team_name: str) -> str:
+        return f"{home_team_name} - {away_team_name}"
+
     def __str__(self) -> str:
-        home_team_name = self.home_team.get_team_name(self.competition.kingdom)
-        away_team_name = self.away_team.get_team_name(self.competition.kingdom)
+        kingdom_index = self.competition.kingdom_index
 
-        return f"{home_team_name} - {away_team_name}"
+        return self.render(self.home_team.team_names[kingdom_index], self.away_team.team_names[kingdom_index])
 
 
 class PlayedMatch(Match):
@@ -81,6 +117,7 @@ class PlayedMatch(Match):
     away_shootout_goals: NonNegativeInt | None = None
 
     @model_validator(mode="after")
+    @instrumented("PlayedMatch.validate_shootout_goals")
     def validate_shootout_goals(self) -> Self:
         if self.home_goals == self.away_goals:
             if self.home_shootout_goals is None or self.away_shootout_goals is None:
@@ -94,7 +131,7 @@ class PlayedMatch(Match):
         return self
 
     @computed_field
-    @property
+    @memoized_property
     def regular_time_winner(self) -> Team | None:
         if self.home_goals > self.away_goals:
             return self.home_team
@@ -103,7 +140,7 @@ class PlayedMatch(Match):
         return None
 
     @computed_field
-    @property
+    @memoized_property
     def winner(self) -> Team:
         if self.regular_time_winner:
             return self.regular_time_winner
@@ -113,13 +150,33 @@ class PlayedMatch(Match):
         else:
             return self.away_team
 
-    def __str__(self) -> str:
-        home_team_name = self.home_team.get_team_name(self.competition.kingdom)
-        away_team_name = self.away_team.get_team_name(self.competition.kingdom)
-        home_goals = self.home_goals
-        away_goals = self.away_goals
+    def render(self, home_team_name: str, away_team_name: str) -> str:
+        return render_result(
+            home_team_name,
+            away_team_name,
+            self.home_goals,
+            self.away_goals,
+            self.home_shootout_goals,
+            self.away_shootout_goals,
+        )
+
+
+def render_result(
+    home_team_name: str,
+    away_team_name: str,
+    home_goals: int,
+    away_goals: int,
+    home_shootout_goals: int | None,
+    away_shootout_goals: int | None,
+) -> str:
+    if home_goals != away_goals:
+        return f"{home_team_name} {home_goals} - {away_goals} {away_team_name}"
+
+    home_score = f"{home_goals} ({home_shootout_goals})"
+    away_score = f"({away_shootout_goals}) {away_goals}"
+
+    return f"{home_team_name} {home_score} - {away_score} {away_team_name}"
 
-        if self.regular_time_winner:
-            return f"{home_team_name} {home_goals} - {away_goals} {away_team_name}"
 
-        return f"{home_team_name} {home_goals} ({self.home_shootout_goals}) - ({self.away_shootout_goals}) {away_goals} {away_team_name}"  # noqa: E501
+def _team_reference(team: Mapping[str, Any] | str | UUID) -> str | UUID:
+    return team["uuid"] if isinstance(team, Mapping) else team
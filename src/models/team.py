@@ -1,29 +1,86 @@
+from collections.abc import Iterator
+from typing import Any, Self
+
 from pydantic import BaseModel, ConfigDict, Field
-from pydantic_extra_types.color import Color
 
 from enums import Kingdom, Region
 from exceptions.enum_exceptions import InvalidEnumValueError
-from utils import UUIDMixin
+from utils import TrustedConstructionMixin, UUIDMixin
+from utils.color import ColorField, PackedColor, parse_color, to_packed_color
+from utils.memoization import MEMO_SLOT, memoized_property
+from utils.trusted_construction_mixin import construct_trusted, trusted_enum_value
+from utils.uuid_intern import intern_uuid
+
+COLOR_FIELDS = ("first_color", "second_color")
+KINGDOMS = tuple(Kingdom)
+_KINGDOM_INDEXES = {
+    **{kingdom: index for index, kingdom in enumerate(KINGDOMS)},
+    **{kingdom.value: index for index, kingdom in enumerate(KINGDOMS)},
+}
+
+
+def _packed_colors(values: dict[str, Any]) -> dict[str, Any]:
+    for name in COLOR_FIELDS:
+        value = values.get(name)
+        if type(value) is str:
+            values[name] = parse_color(value)
+        elif value is not None and type(value) is not int:
+            values[name] = to_packed_color(value)
+
+    return values
+
+
+def get_kingdom_index(kingdom: str | Kingdom) -> int:
+    try:
+        return _KINGDOM_INDEXES[kingdom]
+    except (KeyError, TypeError):
+        raise InvalidEnumValueError(Kingdom, kingdom)
+
 
+class Team(BaseModel, UUIDMixin, TrustedConstructionMixin):
+    __slots__ = (MEMO_SLOT,)
 
-class Team(BaseModel, UUIDMixin):
     kings_name: str
     queens_name: str
     acronym: str = Field(pattern=r"^[A-Z0-9]{2,3}$")
     region: Region
-    first_color: Color
-    second_color: Color | None = None
+    first_color: PackedColor
+    second_color: PackedColor | None = None
 
-    model_config = ConfigDict(frozen=True, use_enum_values=True)
+    model_config = ConfigDict(frozen=True, use_enum_values=True, ignored_types=(memoized_property,), defer_build=True)
+
+    @classmethod
+    def from_trusted(cls, **data) -> Self:
+        data["uuid"] = intern_uuid(data["uuid"])
+        data["region"] = trusted_enum_value(Region, data["region"])
+
+        return construct_trusted(cls, _packed_colors(data))
+
+    @classmethod
+    def model_construct(cls, _fields_set: set[str] | None = None, **values: Any) -> Self:
+        return super().model_construct(_fields_set, **_packed_colors(values))
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> Self:
+        return super().model_copy(update=update and _packed_colors(dict(update)), deep=deep)
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        for name, value in super().__iter__():
+            yield name, getattr(self, name) if name in COLOR_FIELDS else value
+
+    def __repr_args__(self):
+        for name, value in super().__repr_args__():
+            yield name, getattr(self, name) if name in COLOR_FIELDS else value
+
+    @memoized_property
+    def team_names(self) -> tuple[str, ...]:
+        return tuple(self.queens_name if kingdom == Kingdom.QUEENS else self.kings_name for kingdom in KINGDOMS)
 
     def get_team_name(self, kingdom: str | Kingdom | None = None) -> str:
-        if kingdom:
-            try:
-                kingdom_enum = Kingdom(kingdom)
-            except ValueError:
-                raise InvalidEnumValueError(Kingdom, kingdom)
+        if not kingdom:
+            return self.kings_name
+
+        return self.team_names[get_kingdom_index(kingdom)]
 
-            if kingdom_enum == Kingdom.QUEENS:
-                return self.queens_name
 
-        return self.kings_name
+for color_field in COLOR_FIELDS:
+    setattr(Team, color_field, ColorField(color_field))
@@ -0,0 +1,256 @@
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from enums import Kingdom
+from models.competition import Competition
+from models.match import Match, PlayedMatch, render_result
+from models.team import KINGDOMS, Team, get_kingdom_index
+from utils.color import unpack_color
+from utils.trusted_construction_mixin import construct_trusted
+from utils.uuid_intern import uuid_to_str
+
+if TYPE_CHECKING:
+    from pydantic_extra_types.color import Color
+
+_object_setattr = object.__setattr__
+
+
+class _FrozenView:
+    __slots__ = ()
+    _fields: tuple[str, ...] = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    @property
+    def uuid_str(self) -> str:
+        return uuid_to_str(self.uuid)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.uuid))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+class TeamView(_FrozenView):
+    __slots__ = ("uuid", "kings_name", "queens_name", "acronym", "region", "_first_color", "_second_color")
+    _fields = ("uuid", "kings_name", "queens_name", "acronym", "region", "first_color", "second_color")
+
+    def __init__(
+        self,
+        uuid: UUID,
+        kings_name: str,
+        queens_name: str,
+        acronym: str,
+        region: str,
+        first_color: int,
+        second_color: int | None = None,
+    ):
+        _object_setattr(self, "uuid", uuid)
+        _object_setattr(self, "kings_name", kings_name)
+        _object_setattr(self, "queens_name", queens_name)
+        _object_setattr(self, "acronym", acronym)
+        _object_setattr(self, "region", region)
+        _object_setattr(self, "_first_color", first_color)
+        _object_setattr(self, "_second_color", second_color)
+
+    @classmethod
+    def from_model(cls, team: Team) -> "TeamView":
+        fields = team.__dict__
+        return cls(
+            fields["uuid"],
+            fields["kings_name"],
+            fields["queens_name"],
+            fields["acronym"],
+            fields["region"],
+            fields["first_color"],
+            fields["second_color"],
+        )
+
+    def to_model(self) -> Team:
+        return construct_trusted(
+            Team,
+            {
+                "uuid": self.uuid,
+                "kings_name": self.kings_name,
+                "queens_name": self.queens_name,
+                "acronym": self.acronym,
+                "region": self.region,
+                "first_color": self._first_color,
+                "second_color": self._second_color,
+            },
+        )
+
+    @property
+    def first_color(self) -> "Color":
+        return unpack_color(self._first_color)
+
+    @property
+    def second_color(self) -> "Color | None":
+        return None if self._second_color is None else unpack_color(self._second_color)
+
+    @property
+    def team_names(self) -> tuple[str, ...]:
+        return tuple(self.queens_name if kingdom == Kingdom.QUEENS else self.kings_name for kingdom in KINGDOMS)
+
+    def get_team_name(self, kingdom: str | Kingdom | None = None) -> str:
+        if not kingdom:
+            return self.kings_name
+
+        return self.team_names[get_kingdom_index(kingdom)]
+
+
+class MatchView(_FrozenView):
+    __slots__ = ("uuid", "competition", "matchday_round", "home_team", "away_team")
+    _fields = __slots__
+
+    def __init__(
+        self, uuid: UUID, competition: Competition, matchday_round: int, home_team: TeamView, away_team: TeamView
+    ):
+        _object_setattr(self, "uuid", uuid)
+        _object_setattr(self, "competition", competition)
+        _object_setattr(self, "matchday_round", matchday_round)
+        _object_setattr(self, "home_team", home_team)
+        _object_setattr(self, "away_team", away_team)
+
+    @classmethod
+    def from_model(cls, match: Match, team_views: dict[UUID, TeamView] | None = None) -> "MatchView":
+        return cls(*_match_fields(match, {} if team_views is None else team_views))
+
+    def to_model(self) -> Match:
+        return construct_trusted(Match, self._model_fields())
+
+    def is_played(self) -> bool:
+        return False
+
+    def render(self, home_team_name: str, away_team_name: str) -> str:
+        return f"{home_team_name} - {away_team_name}"
+
+    def __str__(self) -> str:
+        kingdom = self.competition.kingdom
+
+        return self.render(self.home_team.get_team_name(kingdom), self.away_team.get_team_name(kingdom))
+
+    def _model_fields(self) -> dict[str, Any]:
+        return {
+            "uuid": self.uuid,
+            "competition": self.competition,
+            "matchday_round": self.matchday_round,
+            "home_team": self.competition.get_team(self.home_team.uuid),
+            "away_team": self.competition.get_team(self.away_team.uuid),
+        }
+
+
+class PlayedMatchView(MatchView):
+    __slots__ = ("home_goals", "away_goals", "home_shootout_goals", "away_shootout_goals")
+    _fields = MatchView._fields + __slots__
+
+    def __init__(
+        self,
+        uuid: UUID,
+        competition: Competition,
+        matchday_round: int,
+        home_team: TeamView,
+        away_team: TeamView,
+        home_goals: int,
+        away_goals: int,
+        home_shootout_goals: int | None = None,
+        away_shootout_goals: int | None = None,
+    ):
+        super().__init__(uuid, competition, matchday_round, home_team, away_team)
+        _object_setattr(self, "home_goals", home_goals)
+        _object_setattr(self, "away_goals", away_goals)
+        _object_setattr(self, "home_shootout_goals", home_shootout_goals)
+        _object_setattr(self, "away_shootout_goals", away_shootout_goals)
+
+    @classmethod
+    def from_model(cls, match: PlayedMatch, team_views: dict[UUID, TeamView] | None = None) -> "PlayedMatchView":
+        fields = match.__dict__
+        return cls(
+            *_match_fields(match, {} if team_views is None else team_views),
+            fields["home_goals"],
+            fields["away_goals"],
+            fields["home_shootout_goals"],
+            fields["away_shootout_goals"],
+        )
+
+    def to_model(self) -> PlayedMatch:
+        return construct_trusted(
+            PlayedMatch,
+            {
+                **self._model_fields(),
+                "home_goals": self.home_goals,
+                "away_goals": self.away_goals,
+                "home_shootout_goals": self.home_shootout_goals,
+                "away_shootout_goals": self.away_shootout_goals,
+            },
+        )
+
+    def is_played(self) -> bool:
+        return True
+
+    @property
+    def regular_time_winner(self) -> TeamView | None:
+        if self.home_goals > self.away_goals:
+            return self.home_team
+        elif self.away_goals > self.home_goals:
+            return self.away_team
+        return None
+
+    @property
+    def winner(self) -> TeamView:
+        if self.home_goals != self.away_goals:
+            return self.home_team if self.home_goals > self.away_goals else self.away_team
+
+        return self.home_team if self.home_shootout_goals > self.away_shootout_goals else self.away_team
+
+    def render(self, home_team_name: str, away_team_name: str) -> str:
+        return render_result(
+            home_team_name,
+            away_team_name,
+            self.home_goals,
+            self.away_goals,
+            self.home_shootout_goals,
+            self.away_shootout_goals,
+        )
+
+
+def to_view(match: Match, team_views: dict[UUID, TeamView] | None = None) -> MatchView:
+    view_class = PlayedMatchView if isinstance(match, PlayedMatch) else MatchView
+    return view_class.from_model(match, team_views)
+
+
+def to_views(matches: Iterable[Match]) -> list[MatchView]:
+    team_views: dict[UUID, TeamView] = {}
+    return [to_view(match, team_views) for match in matches]
+
+
+def from_views(views: Iterable[MatchView]) -> Iterator[Match]:
+    for view in views:
+        yield view.to_model()
+
+
+def _match_fields(match: Match, team_views: dict[UUID, TeamView]) -> tuple:
+    fields = match.__dict__
+    home_team, away_team = fields["home_team"], fields["away_team"]
+
+    home_view = team_views.get(home_team.uuid)
+    if home_view is None:
+        home_view = team_views[home_team.uuid] = TeamView.from_model(home_team)
+    away_view = team_views.get(away_team.uuid)
+    if away_view is None:
+        away_view = team_views[away_team.uuid] = TeamView.from_model(away_team)
+
+    return fields["uuid"], fields["competition"], fields["matchday_round"], home_view, away_view
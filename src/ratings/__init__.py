@@ -0,0 +1,3 @@
+from .elo import EloRatings, EloSystem, RatingsCheckpoint
+
+__all__ = ["EloRatings", "EloSystem", "RatingsCheckpoint"]
@@ -0,0 +1,169 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import UUID
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PositiveFloat
+
+from exceptions.rating_exceptions import TeamNotRatedException
+from models.match import PlayedMatch
+from models.team import Team
+from storage.match_table import UUID_DTYPE, MatchTable
+from utils import UUIDMixin
+
+
+class EloSystem(BaseModel):
+    initial_rating: float = 1500.0
+    k_factor: PositiveFloat = 32.0
+    home_advantage: float = 50.0
+    scale: PositiveFloat = 400.0
+    shootout_win_score: float = Field(default=2 / 3, ge=0.5, le=1.0)
+
+    model_config = ConfigDict(frozen=True)
+
+    def expected_score(self, home_rating: float, away_rating: float) -> float:
+        return 1.0 / (1.0 + 10.0 ** ((away_rating - home_rating - self.home_advantage) / self.scale))
+
+
+@dataclass(frozen=True, slots=True)
+class RatingsCheckpoint:
+    uuids: tuple[UUID, ...]
+    ratings: np.ndarray
+    played: np.ndarray
+    applied: int
+
+    def save(self, path: str | Path) -> None:
+        with open(path, "wb") as file:
+            np.savez(
+                file,
+                uuids=np.frombuffer(b"".join(uuid.bytes for uuid in self.uuids), dtype=UUID_DTYPE),
+                ratings=self.ratings,
+                played=self.played,
+                applied=self.applied,
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "RatingsCheckpoint":
+        with np.load(path) as data:
+            return cls(
+                uuids=tuple(UUIDMixin.validate_uuid(UUID(bytes=value.tobytes())) for value in data["uuids"]),
+                ratings=data["ratings"],
+                played=data["played"],
+                applied=int(data["applied"]),
+            )
+
+
+class EloRatings:
+    def __init__(self, system: EloSystem | None = None, checkpoint: RatingsCheckpoint | None = None):
+        self.system = system or EloSystem()
+        self.uuids: list[UUID] = []
+        self.team_index: dict[UUID, int] = {}
+        self.applied = 0
+        self._ratings = np.empty(0, dtype=np.float64)
+        self._played = np.empty(0, dtype=np.int64)
+
+        if checkpoint is not None:
+            self.restore(checkpoint)
+
+    @property
+    def ratings(self) -> np.ndarray:
+        return self._ratings[: len(self.uuids)]
+
+    @property
+    def played(self) -> np.ndarray:
+        return self._played[: len(self.uuids)]
+
+    def apply(self, match: PlayedMatch) -> None:
+        home, away = self._index(match.home_team.uuid), self._index(match.away_team.uuid)
+        home_rating, away_rating = self._ratings[home], self._ratings[away]
+
+        delta = self.system.k_factor * (self._home_score(match) - self.system.expected_score(home_rating, away_rating))
+        self._ratings[home] = home_rating + delta
+        self._ratings[away] = away_rating - delta
+        self._played[home] += 1
+        self._played[away] += 1
+        self.applied += 1
+
+    def replay(self, matches: MatchTable | Iterable[PlayedMatch]) -> None:
+        if isinstance(matches, MatchTable):
+            table_index = np.array([self._index(team.uuid) for team in matches.teams], dtype=np.intp)
+            home_won = matches.winner == matches.home_team
+            score = np.where(matches.is_regular_time_draw, self.system.shootout_win_score, 1.0)
+            self._replay(
+                table_index[matches.home_team].tolist(),
+                table_index[matches.away_team].tolist(),
+                np.where(home_won, score, 1.0 - score).tolist(),
+            )
+            return
+
+        home, away, home_score = [], [], []
+        for match in matches:
+            home.append(self._index(match.home_team.uuid))
+            away.append(self._index(match.away_team.uuid))
+            home_score.append(self._home_score(match))
+        self._replay(home, away, home_score)
+
+    def rating(self, team: Team | str | UUID) -> float:
+        team_uuid = team.uuid if isinstance(team, Team) else UUIDMixin.validate_uuid(team)
+        if team_uuid not in self.team_index:
+            raise TeamNotRatedException(str(team_uuid))
+
+        return float(self._ratings[self.team_index[team_uuid]])
+
+    def top(self, count: int) -> list[tuple[UUID, float]]:
+        order = np.argsort(-self.ratings, kind="stable")[:count]
+        return [(self.uuids[index], float(self._ratings[index])) for index in order]
+
+    def checkpoint(self) -> RatingsCheckpoint:
+        return RatingsCheckpoint(tuple(self.uuids), self.ratings.copy(), self.played.copy(), self.applied)
+
+    def restore(self, checkpoint: RatingsCheckpoint) -> None:
+        self.uuids = list(checkpoint.uuids)
+        self.team_index = {uuid: index for index, uuid in enumerate(self.uuids)}
+        self._ratings = np.array(checkpoint.ratings, dtype=np.float64)
+        self._played = np.array(checkpoint.played, dtype=np.int64)
+        self.applied = checkpoint.applied
+
+    def __contains__(self, team: Team | str | UUID) -> bool:
+        return (team.uuid if isinstance(team, Team) else UUIDMixin.validate_uuid(team)) in self.team_index
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def _home_score(self, match: PlayedMatch) -> float:
+        if match.regular_time_winner is not None:
+            return 1.0 if match.regular_time_winner is match.home_team else 0.0
+
+        shootout_win_score = self.system.shootout_win_score
+        return shootout_win_score if match.winner is match.home_team else 1.0 - shootout_win_score
+
+    def _index(self, team_uuid: UUID) -> int:
+        index = self.team_index.get(team_uuid)
+        if index is None:
+            index = self.team_index[team_uuid] = len(self.uuids)
+            self.uuids.append(team_uuid)
+            if index == len(self._ratings):
+                capacity = max(16, 2 * index)
+                self._ratings = np.resize(self._ratings, capacity)
+                self._played = np.resize(self._played, capacity)
+            self._ratings[index] = self.system.initial_rating
+            self._played[index] = 0
+
+        return index
+
+    def _replay(self, home: list[int], away: list[int], home_score: list[float]) -> None:
+        ratings = self._ratings.tolist()
+        k_factor, scale = self.system.k_factor, self.system.scale
+        home_advantage = self.system.home_advantage
+
+        for home_index, away_index, score in zip(home, away, home_score):
+            home_rating, away_rating = ratings[home_index], ratings[away_index]
+            delta = k_factor * (score - 1.0 / (1.0 + 10.0 ** ((away_rating - home_rating - home_advantage) / scale)))
+            ratings[home_index] = home_rating + delta
+            ratings[away_index] = away_rating - delta
+
+        self._ratings[:] = ratings
+        capacity = len(self._played)
+        self._played += np.bincount(home, minlength=capacity) + np.bincount(away, minlength=capacity)
+        self.applied += len(home)
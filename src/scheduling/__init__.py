@@ -0,0 +1,9 @@
+from .fixtures import (
+    generate_fixtures,
+    knockout_round,
+    next_bracket,
+    round_robin,
+    seeded_bracket,
+)
+
+__all__ = ["generate_fixtures", "knockout_round", "next_bracket", "round_robin", "seeded_bracket"]
@@ -0,0 +1,122 @@
+from collections.abc import Iterable, Iterator, Sequence
+from uuid import uuid5
+
+from enums import CompetitionFormat
+from exceptions.match_exceptions import TeamNotInCompetitionException
+from exceptions.scheduling_exceptions import (
+    DuplicateSeedException,
+    MissingBracketResultException,
+    NotEnoughTeamsException,
+)
+from models.competition import Competition
+from models.match import Match, PlayedMatch
+from models.team import Team
+from storage.match_table import sorted_teams
+
+Bracket = list[Team | None]
+
+
+def generate_fixtures(
+    competition: Competition, double_round_robin: bool = False, seeds: Sequence[Team] | None = None
+) -> Iterator[Match]:
+    if competition.format == CompetitionFormat.LEAGUE.value:
+        return round_robin(competition, double_round_robin, teams=seeds)
+
+    return knockout_round(competition, seeded_bracket(competition, seeds))
+
+
+def round_robin(
+    competition: Competition, double_round_robin: bool = False, teams: Sequence[Team] | None = None
+) -> Iterator[Match]:
+    return _round_robin(competition, _competition_teams(competition, teams), double_round_robin)
+
+
+def _round_robin(competition: Competition, teams: list[Team], double_round_robin: bool) -> Iterator[Match]:
+    slots: list[Team | None] = [None, *teams] if len(teams) % 2 else list(teams)
+    round_count = len(slots) - 1
+
+    for index in range(round_count):
+        for home_team, away_team in _circle_round(slots, index):
+            yield fixture(competition, index + 1, home_team, away_team)
+        slots = [slots[0], slots[-1], *slots[1:-1]]
+
+    if double_round_robin:
+        for first_leg in _round_robin(competition, teams, False):
+            yield fixture(competition, first_leg.matchday_round + round_count, first_leg.away_team, first_leg.home_team)
+
+
+def seeded_bracket(competition: Competition, seeds: Sequence[Team] | None = None) -> Bracket:
+    seeds = _competition_teams(competition, seeds)
+    size = 1 << (len(seeds) - 1).bit_length()
+
+    positions = [1]
+    while len(positions) < size:
+        mirror = 2 * len(positions) + 1
+        positions = [seed for position in positions for seed in (position, mirror - position)]
+
+    return [seeds[position - 1] if position <= len(seeds) else None for position in positions]
+
+
+def knockout_round(competition: Competition, bracket: Bracket, matchday_round: int = 1) -> Iterator[Match]:
+    for index in range(0, len(bracket) - 1, 2):
+        home_team, away_team = bracket[index], bracket[index + 1]
+        if home_team is not None and away_team is not None:
+            yield fixture(competition, matchday_round, home_team, away_team)
+
+
+def next_bracket(competition: Competition, bracket: Bracket, results: Iterable[PlayedMatch]) -> Bracket:
+    if len(bracket) < 2:
+        return list(bracket)
+
+    winners = {frozenset((match.home_team.uuid, match.away_team.uuid)): match.winner for match in results}
+
+    advancing = []
+    for index in range(0, len(bracket), 2):
+        home_team, away_team = bracket[index], bracket[index + 1]
+        if home_team is None or away_team is None:
+            advancing.append(away_team if home_team is None else home_team)
+            continue
+
+        winner = winners.get(frozenset((home_team.uuid, away_team.uuid)))
+        if winner is None:
+            raise MissingBracketResultException(competition.team_name(home_team), competition.team_name(away_team))
+        advancing.append(winner)
+
+    return advancing
+
+
+def fixture(competition: Competition, matchday_round: int, home_team: Team, away_team: Team) -> Match:
+    return Match.from_trusted(
+        uuid=uuid5(competition.uuid, f"{matchday_round}:{home_team.uuid}:{away_team.uuid}"),
+        competition=competition,
+        matchday_round=matchday_round,
+        home_team=home_team,
+        away_team=away_team,
+    )
+
+
+def _circle_round(slots: list[Team | None], index: int) -> Iterator[tuple[Team, Team]]:
+    last = len(slots) - 1
+    for position in range(len(slots) // 2):
+        home_team, away_team = slots[position], slots[last - position]
+        if (index % 2 if position == 0 else position % 2) == 1:
+            home_team, away_team = away_team, home_team
+        if home_team is not None and away_team is not None:
+            yield home_team, away_team
+
+
+def _competition_teams(competition: Competition, teams: Sequence[Team] | None) -> list[Team]:
+    if teams is None:
+        teams = sorted_teams(competition)
+
+    seen = set()
+    for team in teams:
+        if not competition.has_team(team.uuid):
+            raise TeamNotInCompetitionException(competition.team_name(team))
+        if team.uuid in seen:
+            raise DuplicateSeedException(competition.team_name(team))
+        seen.add(team.uuid)
+    if len(teams) < 2:
+        raise NotEnoughTeamsException(len(teams))
+
+    return list(teams)
@@ -0,0 +1,4 @@
+from .normalized import dump_matches, dump_matches_json, load_matches, load_matches_json
+from .text import render_matches
+
+__all__ = ["dump_matches", "dump_matches_json", "load_matches", "load_matches_json", "render_matches"]
@@ -0,0 +1,362 @@
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from uuid import UUID
+
+import numpy as np
+
+from enums import CompetitionFormat, Kingdom, Region
+from exceptions.serialization_exceptions import (
+    CompetitionNotInSeasonFileException,
+    InvalidSeasonFileException,
+    SeasonFileInUseException,
+    UnsupportedSeasonFileVersionException,
+)
+from models.competition import Competition
+from models.match import Match, PlayedMatch
+from models.team import Team
+from storage.match_table import NULL_GOALS, UUID_DTYPE, MatchTable, sorted_teams
+
+MAGIC = b"KDSB"
+VERSION = 1
+NULL_INDEX = -1
+
+SECTIONS = ("string_offsets", "string_data", "teams", "competitions", "memberships", "matches")
+HEADER = struct.Struct("<4sHH" + "QQ" * len(SECTIONS))
+
+STRING_OFFSET_DTYPE = np.dtype("<u4")
+MEMBERSHIP_DTYPE = np.dtype("<u4")
+TEAM_DTYPE = np.dtype(
+    [
+        ("uuid", UUID_DTYPE),
+        ("kings_name", "<u4"),
+        ("queens_name", "<u4"),
+        ("acronym", "<u4"),
+        ("first_color", "<u4"),
+        ("second_color", "<i4"),
+        ("region", "u1"),
+    ]
+)
+COMPETITION_DTYPE = np.dtype(
+    [
+        ("uuid", UUID_DTYPE),
+        ("first_team", "<u4"),
+        ("team_count", "<u4"),
+        ("season", "<u2"),
+        ("split", "<i2"),
+        ("region", "u1"),
+        ("kingdom", "u1"),
+        ("format", "u1"),
+    ]
+)
+MATCH_DTYPE = np.dtype(
+    [
+        ("uuid", UUID_DTYPE),
+        ("competition", "<u4"),
+        ("home_team", "<u4"),
+        ("away_team", "<u4"),
+        ("matchday_round", "<u2"),
+        ("home_goals", "<i2"),
+        ("away_goals", "<i2"),
+        ("home_shootout_goals", "<i2"),
+        ("away_shootout_goals", "<i2"),
+    ]
+)
+
+REGIONS = tuple(region.value for region in Region)
+KINGDOMS = tuple(kingdom.value for kingdom in Kingdom)
+FORMATS = tuple(competition_format.value for competition_format in CompetitionFormat)
+
+
+class _StringTable:
+    def __init__(self):
+        self.indexes: dict[str, int] = {}
+
+    def add(self, value: str | None) -> int:
+        if value is None:
+            return NULL_INDEX
+
+        return self.indexes.setdefault(value, len(self.indexes))
+
+    def encode(self) -> tuple[bytes, bytes]:
+        encoded = [value.encode() for value in self.indexes]
+        offsets = np.zeros(len(encoded) + 1, dtype=STRING_OFFSET_DTYPE)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+
+        return offsets.tobytes(), b"".join(encoded)
+
+
+def encode_matches(matches: Iterable[Match]) -> bytes:
+    strings = _StringTable()
+    team_indexes: dict[UUID, int] = {}
+    competition_indexes: dict[UUID, int] = {}
+    team_records, competition_records, memberships, match_records = [], [], [], []
+
+    def add_team(team: Team) -> int:
+        if team.uuid not in team_indexes:
+            team_indexes[team.uuid] = len(team_records)
+            team_records.append(
+                (
+                    team.uuid.bytes,
+                    strings.add(team.kings_name),
+                    strings.add(team.queens_name),
+                    strings.add(team.acronym),
+                    strings.add(str(team.first_color)),
+                    strings.add(None if team.second_color is None else str(team.second_color)),
+                    REGIONS.index(team.region),
+                )
+            )
+
+        return team_indexes[team.uuid]
+
+    def add_competition(competition: Competition) -> int:
+        if competition.uuid not in competition_indexes:
+            competition_indexes[competition.uuid] = len(competition_records)
+            competition_records.append(
+                (
+                    competition.uuid.bytes,
+                    len(memberships),
+                    len(competition.teams),
+                    competition.season,
+                    NULL_INDEX if competition.split is None else competition.split,
+                    REGIONS.index(competition.region),
+                    KINGDOMS.index(competition.kingdom),
+                    FORMATS.index(competition.format),
+                )
+            )
+            memberships.extend(add_team(team) for team in sorted_teams(competition))
+
+        return competition_indexes[competition.uuid]
+
+    for match in matches:
+        played = match.is_played()
+        match_records.append(
+            (
+                match.uuid.bytes,
+                add_competition(match.competition),
+                team_indexes[match.home_team.uuid],
+                team_indexes[match.away_team.uuid],
+                match.matchday_round,
+                match.home_goals if played else NULL_GOALS,
+                match.away_goals if played else NULL_GOALS,
+                _nullable_goals(match.home_shootout_goals) if played else NULL_GOALS,
+                _nullable_goals(match.away_shootout_goals) if played else NULL_GOALS,
+            )
+        )
+
+    string_offsets, string_data = strings.encode()
+    sections = [
+        string_offsets,
+        string_data,
+        np.array(team_records, dtype=TEAM_DTYPE).tobytes(),
+        np.array(competition_records, dtype=COMPETITION_DTYPE).tobytes(),
+        np.array(memberships, dtype=MEMBERSHIP_DTYPE).tobytes(),
+        np.array(match_records, dtype=MATCH_DTYPE).tobytes(),
+    ]
+    counts = [
+        len(strings.indexes) + 1,
+        len(string_data),
+        len(team_records),
+        len(competition_records),
+        len(memberships),
+        len(match_records),
+    ]
+
+    offsets, offset = [], HEADER.size
+    for section in sections:
+        offsets.append(offset)
+        offset += len(section)
+
+    header = HEADER.pack(MAGIC, VERSION, 0, *(value for pair in zip(offsets, counts) for value in pair))
+    return header + b"".join(sections)
+
+
+def write_season(path: str | Path, matches: Iterable[Match]) -> None:
+    Path(path).write_bytes(encode_matches(matches))
+
+
+def decode_matches(data: bytes) -> list[Match]:
+    return list(SeasonFile(data))
+
+
+class SeasonFile:
+    def __init__(self, buffer: bytes | memoryview | mmap.mmap):
+        self._buffer = buffer
+        self._mmap = buffer if isinstance(buffer, mmap.mmap) else None
+
+        if len(buffer) < HEADER.size:
+            raise InvalidSeasonFileException("file is shorter than the header")
+        magic, version, _, *section_values = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise InvalidSeasonFileException(f"unexpected magic bytes {magic!r}")
+        if version != VERSION:
+            raise UnsupportedSeasonFileVersionException(version, VERSION)
+
+        self._sections = dict(zip(SECTIONS, zip(section_values[::2], section_values[1::2])))
+        self._map_sections()
+
+        self._teams: list[Team] | None = None
+        self._competitions: list[Competition] | None = None
+
+    @classmethod
+    def open(cls, path: str | Path) -> "SeasonFile":
+        with open(path, "rb") as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _map_sections(self) -> None:
+        sections = self._sections
+        self.string_offsets = self._section(sections["string_offsets"], STRING_OFFSET_DTYPE)
+        string_data_start, string_data_size = sections["string_data"]
+        string_data_end = string_data_start + string_data_size
+        self.string_data = memoryview(self._buffer)[string_data_start:string_data_end]
+        self.team_records = self._section(sections["teams"], TEAM_DTYPE)
+        self.competition_records = self._section(sections["competitions"], COMPETITION_DTYPE)
+        self.memberships = self._section(sections["memberships"], MEMBERSHIP_DTYPE)
+        self.match_records = self._section(sections["matches"], MATCH_DTYPE)
+
+    def _section(self, section: tuple[int, int], dtype: np.dtype) -> np.ndarray:
+        offset, count = section
+        if offset + count * dtype.itemsize > len(self._buffer):
+            raise InvalidSeasonFileException("section extends past the end of the file")
+        if not count:
+            return np.empty(0, dtype=dtype)
+
+        return np.frombuffer(self._buffer, dtype=dtype, count=count, offset=offset)
+
+    def string(self, index: int) -> str | None:
+        if index == NULL_INDEX:
+            return None
+
+        start, end = self.string_offsets[index], self.string_offsets[index + 1]
+        return str(self.string_data[start:end], "utf-8")
+
+    @property
+    def teams(self) -> list[Team]:
+        if self._teams is None:
+            self._teams = [
+                Team.from_trusted(
+                    uuid=UUID(bytes=record["uuid"].tobytes()),
+                    kings_name=self.string(record["kings_name"]),
+                    queens_name=self.string(record["queens_name"]),
+                    acronym=self.string(record["acronym"]),
+                    region=REGIONS[record["region"]],
+                    first_color=self.string(record["first_color"]),
+                    second_color=self.string(record["second_color"]),
+                )
+                for record in self.team_records
+            ]
+
+        return self._teams
+
+    @property
+    def competitions(self) -> list[Competition]:
+        if self._competitions is None:
+            teams = self.teams
+            self._competitions = [
+                Competition.from_trusted(
+                    uuid=UUID(bytes=record["uuid"].tobytes()),
+                    region=REGIONS[record["region"]],
+                    kingdom=KINGDOMS[record["kingdom"]],
+                    format=FORMATS[record["format"]],
+                    season=int(record["season"]),
+                    split=None if record["split"] == NULL_INDEX else int(record["split"]),
+                    teams=[teams[index] for index in self._competition_teams(record)],
+                )
+                for record in self.competition_records
+            ]
+
+        return self._competitions
+
+    def _competition_teams(self, record: np.void) -> np.ndarray:
+        first_team = record["first_team"]
+        last_team = first_team + record["team_count"]
+
+        return self.memberships[first_team:last_team]
+
+    def match(self, index: int) -> Match:
+        record = self.match_records[index]
+        data = {
+            "uuid": UUID(bytes=record["uuid"].tobytes()),
+            "competition": self.competitions[record["competition"]],
+            "matchday_round": int(record["matchday_round"]),
+            "home_team": self.teams[record["home_team"]],
+            "away_team": self.teams[record["away_team"]],
+        }
+        if record["home_goals"] == NULL_GOALS:
+            return Match.from_trusted(**data)
+
+        return PlayedMatch.from_trusted(
+            **data,
+            home_goals=int(record["home_goals"]),
+            away_goals=int(record["away_goals"]),
+            home_shootout_goals=_optional_goals(record["home_shootout_goals"]),
+            away_shootout_goals=_optional_goals(record["away_shootout_goals"]),
+        )
+
+    def match_table(self, competition: Competition) -> MatchTable:
+        competition_indexes = {candidate.uuid: index for index, candidate in enumerate(self.competitions)}
+        if competition.uuid not in competition_indexes:
+            raise CompetitionNotInSeasonFileException(competition.uuid_str)
+
+        records = self.match_records[
+            (self.match_records["competition"] == competition_indexes[competition.uuid])
+            & (self.match_records["home_goals"] != NULL_GOALS)
+        ]
+
+        table_index = {team.uuid: index for index, team in enumerate(sorted_teams(competition))}
+        file_to_table = np.full(len(self.team_records), NULL_INDEX, dtype=np.int32)
+        for index, team in enumerate(self.teams):
+            file_to_table[index] = table_index.get(team.uuid, NULL_INDEX)
+
+        return MatchTable(
+            competition=competition,
+            uuids=records["uuid"],
+            matchday_round=records["matchday_round"],
+            home_team=file_to_table[records["home_team"]],
+            away_team=file_to_table[records["away_team"]],
+            home_goals=records["home_goals"],
+            away_goals=records["away_goals"],
+            home_shootout_goals=records["home_shootout_goals"],
+            away_shootout_goals=records["away_shootout_goals"],
+        )
+
+    def close(self) -> None:
+        # The record arrays and the string view export the mapped buffer, so they must be dropped before the mmap
+        # can close. If a caller still holds one of them (or a slice of it), mmap.close() raises BufferError: the
+        # sections are then mapped again and SeasonFileInUseException is raised, so close() can be retried.
+        if self.string_data is None:
+            return
+
+        self.string_data.release()
+        self.string_offsets = self.string_data = self.team_records = None
+        self.competition_records = self.memberships = self.match_records = None
+        if self._mmap is None:
+            return
+
+        try:
+            self._mmap.close()
+        except BufferError:
+            self._map_sections()
+            raise SeasonFileInUseException()
+
+    def __enter__(self) -> "SeasonFile":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Match]:
+        for index in range(len(self)):
+            yield self.match(index)
+
+    def __len__(self) -> int:
+        return len(self.match_records)
+
+
+def _nullable_goals(goals: int | None) -> int:
+    return NULL_GOALS if goals is None else goals
+
+
+def _optional_goals(goals: int) -> int | None:
+    return None if goals == NULL_GOALS else int(goals)
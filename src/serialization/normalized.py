@@ -0,0 +1,75 @@
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from models.competition import Competition
+from models.match import Match, PlayedMatch
+from models.team import Team
+
+PLAYED_MATCH_FIELDS = ("home_goals", "away_goals", "home_shootout_goals", "away_shootout_goals")
+
+
+def dump_matches(matches: Iterable[Match]) -> dict[str, list[dict[str, Any]]]:
+    teams: dict[str, dict[str, Any]] = {}
+    competitions: dict[str, dict[str, Any]] = {}
+    match_rows = []
+
+    for match in matches:
+        competition = match.competition
+        if competition.uuid_str not in competitions:
+            competitions[competition.uuid_str] = _competition_row(competition, teams)
+
+        row = {
+            "uuid": match.uuid_str,
+            "competition": competition.uuid_str,
+            "matchday_round": match.matchday_round,
+            "home_team": match.home_team.uuid_str,
+            "away_team": match.away_team.uuid_str,
+        }
+        if match.is_played():
+            row.update({field: getattr(match, field) for field in PLAYED_MATCH_FIELDS})
+        match_rows.append(row)
+
+    return {"teams": list(teams.values()), "competitions": list(competitions.values()), "matches": match_rows}
+
+
+def dump_matches_json(matches: Iterable[Match]) -> str:
+    return json.dumps(dump_matches(matches), separators=(",", ":"))
+
+
+def load_matches(data: dict[str, list[dict[str, Any]]], verify_sample: float = 1.0) -> list[Match]:
+    teams = {team.uuid: team for team in Team.from_rows(data["teams"], verify_sample=verify_sample)}
+    competition_rows = [
+        {**row, "teams": [teams[Team.validate_uuid(team_uuid)] for team_uuid in row["teams"]]}
+        for row in data["competitions"]
+    ]
+    competitions = {
+        competition.uuid: competition
+        for competition in Competition.from_rows(competition_rows, verify_sample=verify_sample)
+    }
+
+    match_rows = [
+        {**row, "competition": competitions[Competition.validate_uuid(row["competition"])]} for row in data["matches"]
+    ]
+    matches: list[Match | None] = [None] * len(match_rows)
+    for model in (Match, PlayedMatch):
+        indices = [index for index, row in enumerate(match_rows) if ("home_goals" in row) == (model is PlayedMatch)]
+        rows = [match_rows[index] for index in indices]
+        for index, match in zip(indices, model.from_rows(rows, verify_sample=verify_sample)):
+            matches[index] = match
+
+    return matches
+
+
+def load_matches_json(data: str | bytes, verify_sample: float = 1.0) -> list[Match]:
+    return load_matches(json.loads(data), verify_sample=verify_sample)
+
+
+def _competition_row(competition: Competition, teams: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    team_uuids = []
+    for team in sorted(competition.teams, key=lambda team: team.uuid):
+        if team.uuid_str not in teams:
+            teams[team.uuid_str] = team.model_dump(mode="json")
+        team_uuids.append(team.uuid_str)
+
+    return {**competition.model_dump(mode="json", exclude={"teams"}), "teams": team_uuids}
@@ -0,0 +1,33 @@
+from collections.abc import Iterable
+
+from models.competition import Competition
+from models.match import Match
+
+
+def render_matches(matches: Iterable[Match], separator: str = "\n") -> str:
+    lines = []
+    competition: Competition | None = None
+    # Keyed by id() for speed. Each value keeps its competition (and so its teams) alive, so no id can be reused
+    # by another object while the cache exists.
+    competition_names: dict[int, tuple[Competition, int, dict[int, str]]] = {}
+    kingdom_index, team_names = 0, {}
+
+    for match in matches:
+        if match.competition is not competition:
+            competition = match.competition
+            if id(competition) not in competition_names:
+                competition_names[id(competition)] = (competition, *_team_names(competition))
+            _, kingdom_index, team_names = competition_names[id(competition)]
+
+        home_team, away_team = match.home_team, match.away_team
+        home_team_name = team_names.get(id(home_team)) or home_team.team_names[kingdom_index]
+        away_team_name = team_names.get(id(away_team)) or away_team.team_names[kingdom_index]
+        lines.append(match.render(home_team_name, away_team_name))
+
+    return separator.join(lines)
+
+
+def _team_names(competition: Competition) -> tuple[int, dict[int, str]]:
+    kingdom_index = competition.kingdom_index
+
+    return kingdom_index, {id(team): team.team_names[kingdom_index] for team in competition.teams}
@@ -0,0 +1,3 @@
+from .monte_carlo import GoalModel, SeasonSimulator, SimulationResult
+
+__all__ = ["GoalModel", "SeasonSimulator", "SimulationResult"]
@@ -0,0 +1,195 @@
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, NonNegativeFloat, PositiveFloat, PositiveInt
+
+from exceptions.match_exceptions import CompetitionMismatchException
+from exceptions.simulation_exceptions import InvalidSimulationCountException
+from models.competition import Competition
+from models.match import Match
+from models.team import Team
+from standings.engine import StandingsEngine
+from standings.stats import PointsSystem, TeamStats
+from standings.tiebreakers import DEFAULT_TIEBREAKERS, Tiebreaker
+from storage.match_table import MatchTable
+
+
+class GoalModel(BaseModel):
+    home_goals: PositiveFloat = 3.0
+    away_goals: PositiveFloat = 2.7
+    max_shootout_goals: PositiveInt = 5
+    prior_matches: NonNegativeFloat = 5.0
+
+    model_config = ConfigDict(frozen=True)
+
+    def expected_goals(
+        self, stats: TeamStats, home_team: np.ndarray, away_team: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        average = (self.home_goals + self.away_goals) / 2
+        prior_goals = self.prior_matches * average
+        games = stats.played + self.prior_matches
+        if not np.all(games):
+            return np.full(len(home_team), self.home_goals), np.full(len(away_team), self.away_goals)
+
+        attack = (stats.goals_for + prior_goals) / games / average
+        defense = (stats.goals_against + prior_goals) / games / average
+
+        return (
+            self.home_goals * attack[home_team] * defense[away_team],
+            self.away_goals * attack[away_team] * defense[home_team],
+        )
+
+
+@dataclass(slots=True)
+class SimulationResult:
+    teams: tuple[Team, ...]
+    positions: np.ndarray
+    points: np.ndarray
+
+    @property
+    def simulations(self) -> int:
+        return len(self.positions)
+
+    def position_probabilities(self) -> np.ndarray:
+        team_count = len(self.teams)
+        counts = np.zeros((team_count, team_count), dtype=np.int64)
+        for team_index in range(team_count):
+            counts[team_index] = np.bincount(self.positions[:, team_index] - 1, minlength=team_count)
+
+        return counts / self.simulations
+
+    def top_probabilities(self, count: int) -> np.ndarray:
+        return (self.positions <= count).mean(axis=0)
+
+    def title_probabilities(self) -> np.ndarray:
+        return self.top_probabilities(1)
+
+    def expected_points(self) -> np.ndarray:
+        return self.points.mean(axis=0)
+
+
+class SeasonSimulator:
+    def __init__(
+        self,
+        competition: Competition,
+        matches: Iterable[Match] = (),
+        goal_model: GoalModel | None = None,
+        points_system: PointsSystem | None = None,
+        tiebreakers: Sequence[Tiebreaker] = DEFAULT_TIEBREAKERS,
+    ):
+        played, remaining = [], []
+        for match in matches:
+            if match.competition.uuid != competition.uuid:
+                raise CompetitionMismatchException(match.uuid_str, competition.uuid_str)
+            (played if match.is_played() else remaining).append(match)
+
+        table = MatchTable.from_matches(competition, played)
+        self.competition = competition
+        self.teams = table.teams
+        self.goal_model = goal_model or GoalModel()
+        self.engine = StandingsEngine(points_system, tiebreakers)
+        self.played_stats = self.engine.compute_stats(table)
+
+        self.home_team = np.array([table.team_index[match.home_team.uuid] for match in remaining], dtype=np.intp)
+        self.away_team = np.array([table.team_index[match.away_team.uuid] for match in remaining], dtype=np.intp)
+        self.home_rate, self.away_rate = self.goal_model.expected_goals(
+            self.played_stats, self.home_team, self.away_team
+        )
+
+    def run(
+        self, simulations: int, seed: int | None = None, max_workers: int | None = 1, chunk_size: int = 10_000
+    ) -> SimulationResult:
+        if simulations <= 0:
+            raise InvalidSimulationCountException(simulations)
+
+        chunk_sizes = [min(chunk_size, simulations - start) for start in range(0, simulations, chunk_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+
+        if max_workers == 1:
+            outcomes = [self.simulate_chunk(size, chunk_seed) for size, chunk_seed in zip(chunk_sizes, seeds)]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(self.simulate_chunk, chunk_sizes, seeds))
+
+        positions, points = zip(*outcomes)
+        return SimulationResult(self.teams, np.concatenate(positions), np.concatenate(points))
+
+    def simulate_chunk(
+        self, simulations: int, seed: np.random.SeedSequence | int | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        rng = np.random.default_rng(seed)
+        shape = (simulations, len(self.home_team))
+        max_shootout_goals = self.goal_model.max_shootout_goals
+
+        home_goals = rng.poisson(self.home_rate, shape)
+        away_goals = rng.poisson(self.away_rate, shape)
+        home_shootout_goals = rng.integers(0, max_shootout_goals + 1, shape)
+        away_shootout_goals = rng.integers(0, max_shootout_goals, shape)
+        away_shootout_goals += away_shootout_goals >= home_shootout_goals
+
+        stats = self._simulated_stats(home_goals, away_goals, home_shootout_goals, away_shootout_goals)
+        order = self.engine.rank(stats)
+        positions = np.empty_like(order, dtype=np.int16)
+        np.put_along_axis(positions, order, np.arange(1, len(self.teams) + 1, dtype=np.int16), axis=1)
+
+        return positions, stats.points
+
+    def _simulated_stats(
+        self,
+        home_goals: np.ndarray,
+        away_goals: np.ndarray,
+        home_shootout_goals: np.ndarray,
+        away_shootout_goals: np.ndarray,
+    ) -> TeamStats:
+        simulations, team_count = len(home_goals), len(self.teams)
+        offsets = (np.arange(simulations) * team_count)[:, None]
+        home_team = np.broadcast_to(self.home_team + offsets, home_goals.shape)
+        away_team = np.broadcast_to(self.away_team + offsets, home_goals.shape)
+
+        shootout = home_goals == away_goals
+        regulation = ~shootout
+        home_won = np.where(shootout, home_shootout_goals > away_shootout_goals, home_goals > away_goals)
+        winner = np.where(home_won, home_team, away_team)
+        loser = home_team + away_team - winner
+
+        def count(indices: np.ndarray) -> np.ndarray:
+            return np.bincount(indices.ravel(), minlength=simulations * team_count).reshape(simulations, team_count)
+
+        def total(indices: np.ndarray, weights: np.ndarray) -> np.ndarray:
+            totals = np.bincount(indices.ravel(), weights=weights.ravel(), minlength=simulations * team_count)
+            return totals.astype(np.int64).reshape(simulations, team_count)
+
+        played = self.played_stats
+        regulation_wins = played.regulation_wins + count(winner[regulation])
+        shootout_wins = played.shootout_wins + count(winner[shootout])
+        shootout_losses = played.shootout_losses + count(loser[shootout])
+        regulation_losses = played.regulation_losses + count(loser[regulation])
+
+        points_system = self.engine.points_system
+        return TeamStats(
+            played=played.played + count(home_team) + count(away_team),
+            regulation_wins=regulation_wins,
+            shootout_wins=shootout_wins,
+            shootout_losses=shootout_losses,
+            regulation_losses=regulation_losses,
+            goals_for=played.goals_for + total(home_team, home_goals) + total(away_team, away_goals),
+            goals_against=played.goals_against + total(home_team, away_goals) + total(away_team, home_goals),
+            shootout_goals_for=(
+                played.shootout_goals_for
+                + total(home_team[shootout], home_shootout_goals[shootout])
+                + total(away_team[shootout], away_shootout_goals[shootout])
+            ),
+            shootout_goals_against=(
+                played.shootout_goals_against
+                + total(home_team[shootout], away_shootout_goals[shootout])
+                + total(away_team[shootout], home_shootout_goals[shootout])
+            ),
+            points=(
+                regulation_wins * points_system.regulation_win
+                + shootout_wins * points_system.shootout_win
+                + shootout_losses * points_system.shootout_loss
+                + regulation_losses * points_system.regulation_loss
+            ),
+        )
@@ -0,0 +1,15 @@
+from .career import CareerAggregate, CareerRow, aggregate_careers
+from .engine import StandingsEngine
+from .incremental import IncrementalStandings
+from .stats import PointsSystem, StandingsRow, TeamStats
+
+__all__ = [
+    "CareerAggregate",
+    "CareerRow",
+    "IncrementalStandings",
+    "PointsSystem",
+    "StandingsEngine",
+    "StandingsRow",
+    "TeamStats",
+    "aggregate_careers",
+]
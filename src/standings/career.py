@@ -0,0 +1,223 @@
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields, replace
+from itertools import islice, repeat
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, NonNegativeInt, computed_field
+
+from enums import CompetitionFormat
+from exceptions.standings_exceptions import (
+    IncompatibleAggregateException,
+    InvalidGroupFieldException,
+)
+from models.competition import Competition
+from models.match import PlayedMatch
+from models.team import Team
+from standings.stats import PointsSystem, TeamStats
+
+GROUP_FIELDS = ("season", "format", "split", "kingdom", "region")
+
+GroupKey = tuple[Any, ...]
+
+
+class CareerRow(BaseModel):
+    team: Team
+    season: int | None = None
+    format: CompetitionFormat | None = None
+    split: int | None = None
+    kingdom: str | None = None
+    region: str | None = None
+    played: NonNegativeInt
+    regulation_wins: NonNegativeInt
+    shootout_wins: NonNegativeInt
+    shootout_losses: NonNegativeInt
+    regulation_losses: NonNegativeInt
+    goals_for: NonNegativeInt
+    goals_against: NonNegativeInt
+    shootout_goals_for: NonNegativeInt
+    shootout_goals_against: NonNegativeInt
+    points: NonNegativeInt
+
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+
+    @computed_field
+    @property
+    def wins(self) -> int:
+        return self.regulation_wins + self.shootout_wins
+
+    @computed_field
+    @property
+    def goal_difference(self) -> int:
+        return self.goals_for - self.goals_against
+
+    @computed_field
+    @property
+    def shootout_conversion(self) -> float | None:
+        shootouts = self.shootout_wins + self.shootout_losses
+        return self.shootout_wins / shootouts if shootouts else None
+
+
+class CareerAggregate:
+    def __init__(self, group_by: Sequence[str] = (), points_system: PointsSystem | None = None):
+        invalid_fields = [name for name in group_by if name not in GROUP_FIELDS]
+        if invalid_fields:
+            raise InvalidGroupFieldException(invalid_fields, GROUP_FIELDS)
+
+        self.group_by = tuple(group_by)
+        self.points_system = points_system or PointsSystem()
+        self.teams: dict[UUID, Team] = {}
+        self._stats: dict[tuple[GroupKey, UUID], TeamStats] = {}
+        self._groups: dict[UUID, GroupKey] = {}
+
+    def add(self, match: PlayedMatch) -> None:
+        fields_ = match.__dict__
+        home_goals, away_goals = fields_["home_goals"], fields_["away_goals"]
+        group = self._group(fields_["competition"])
+        home = self._team_stats(group, fields_["home_team"])
+        away = self._team_stats(group, fields_["away_team"])
+
+        home.played += 1
+        away.played += 1
+        home.goals_for += home_goals
+        home.goals_against += away_goals
+        away.goals_for += away_goals
+        away.goals_against += home_goals
+
+        if home_goals > away_goals:
+            home.regulation_wins += 1
+            away.regulation_losses += 1
+        elif away_goals > home_goals:
+            away.regulation_wins += 1
+            home.regulation_losses += 1
+        else:
+            home_shootout_goals, away_shootout_goals = fields_["home_shootout_goals"], fields_["away_shootout_goals"]
+            home.shootout_goals_for += home_shootout_goals
+            home.shootout_goals_against += away_shootout_goals
+            away.shootout_goals_for += away_shootout_goals
+            away.shootout_goals_against += home_shootout_goals
+            winner, loser = (home, away) if home_shootout_goals > away_shootout_goals else (away, home)
+            winner.shootout_wins += 1
+            loser.shootout_losses += 1
+
+    def update(self, matches: Iterable[PlayedMatch]) -> "CareerAggregate":
+        add = self.add
+        for match in matches:
+            add(match)
+
+        return self
+
+    def merge(self, other: "CareerAggregate") -> "CareerAggregate":
+        if other.group_by != self.group_by:
+            raise IncompatibleAggregateException(self.group_by, other.group_by)
+
+        self.teams.update(other.teams)
+        for key, other_stats in other._stats.items():
+            stats = self._stats.get(key)
+            if stats is None:
+                self._stats[key] = replace(other_stats)
+                continue
+            for field in fields(stats):
+                setattr(stats, field.name, getattr(stats, field.name) + getattr(other_stats, field.name))
+
+        return self
+
+    def groups(self) -> list[GroupKey]:
+        return sorted({group for group, _ in self._stats}, key=_group_sort_key)
+
+    def stats(self, team: Team | UUID, group: GroupKey = ()) -> TeamStats:
+        team_uuid = team.uuid if isinstance(team, Team) else team
+        stats = self._stats.get((tuple(group), team_uuid))
+        if stats is None:
+            return TeamStats()
+
+        return self._with_points(stats)
+
+    def table(self, group: GroupKey | None = None) -> list[CareerRow]:
+        keys = [key for key in self._stats if group is None or key[0] == tuple(group)]
+        rows = [self._row(key) for key in keys]
+        rows.sort(key=lambda row: (-row.points, -row.goal_difference, -row.goals_for, row.team.uuid_str))
+        rows.sort(key=lambda row: _group_sort_key(tuple(getattr(row, name) for name in self.group_by)))
+
+        return rows
+
+    def team_table(self, team: Team | UUID) -> list[CareerRow]:
+        team_uuid = team.uuid if isinstance(team, Team) else team
+        keys = sorted((key for key in self._stats if key[1] == team_uuid), key=lambda key: _group_sort_key(key[0]))
+
+        return [self._row(key) for key in keys]
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def _group(self, competition: Competition) -> GroupKey:
+        group = self._groups.get(competition.uuid)
+        if group is None:
+            values = competition.__dict__
+            group = self._groups[competition.uuid] = tuple(values[name] for name in self.group_by)
+
+        return group
+
+    def _team_stats(self, group: GroupKey, team: Team) -> TeamStats:
+        key = (group, team.uuid)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = TeamStats()
+            self.teams.setdefault(team.uuid, team)
+
+        return stats
+
+    def _with_points(self, stats: TeamStats) -> TeamStats:
+        points_system = self.points_system
+        stats.points = (
+            stats.regulation_wins * points_system.regulation_win
+            + stats.shootout_wins * points_system.shootout_win
+            + stats.shootout_losses * points_system.shootout_loss
+            + stats.regulation_losses * points_system.regulation_loss
+        )
+
+        return stats
+
+    def _row(self, key: tuple[GroupKey, UUID]) -> CareerRow:
+        group, team_uuid = key
+        stats = self._with_points(self._stats[key])
+
+        return CareerRow(
+            team=self.teams[team_uuid],
+            **dict(zip(self.group_by, group)),
+            **{field.name: getattr(stats, field.name) for field in fields(stats)},
+        )
+
+
+def aggregate_careers(
+    matches: Iterable[PlayedMatch],
+    group_by: Sequence[str] = (),
+    points_system: PointsSystem | None = None,
+    max_workers: int | None = 1,
+    chunk_size: int = 50_000,
+) -> CareerAggregate:
+    aggregate = CareerAggregate(group_by, points_system)
+    if max_workers == 1:
+        return aggregate.update(matches)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        partials = executor.map(_aggregate_chunk, _chunks(matches, chunk_size), repeat(aggregate.group_by))
+        for partial in partials:
+            aggregate.merge(partial)
+
+    return aggregate
+
+
+def _aggregate_chunk(matches: list[PlayedMatch], group_by: tuple[str, ...]) -> CareerAggregate:
+    return CareerAggregate(group_by).update(matches)
+
+
+def _chunks(matches: Iterable[PlayedMatch], chunk_size: int) -> Iterable[list[PlayedMatch]]:
+    iterator = iter(matches)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _group_sort_key(group: GroupKey) -> tuple:
+    return tuple((value is None, value) for value in group)
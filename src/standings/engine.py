@@ -0,0 +1,80 @@
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+from models.competition import Competition
+from models.match import PlayedMatch
+from standings.stats import PointsSystem, StandingsRow, TeamStats
+from standings.tiebreakers import DEFAULT_TIEBREAKERS, Tiebreaker
+from storage.match_table import MatchTable
+
+
+class StandingsEngine:
+    def __init__(
+        self,
+        points_system: PointsSystem | None = None,
+        tiebreakers: Sequence[Tiebreaker] = DEFAULT_TIEBREAKERS,
+    ):
+        self.points_system = points_system or PointsSystem()
+        self.tiebreakers = tuple(tiebreakers)
+
+    def compute_stats(self, table: MatchTable) -> TeamStats:
+        team_count = len(table.teams)
+        home_team = table.home_team.astype(np.intp)
+        away_team = table.away_team.astype(np.intp)
+        winner = table.winner.astype(np.intp)
+        loser = home_team + away_team - winner
+        shootout = table.is_regular_time_draw
+        regulation = ~shootout
+
+        def count(indices: np.ndarray) -> np.ndarray:
+            return np.bincount(indices, minlength=team_count)
+
+        def total(indices: np.ndarray, weights: np.ndarray) -> np.ndarray:
+            return np.bincount(indices, weights=weights, minlength=team_count).astype(np.int64)
+
+        regulation_wins = count(winner[regulation])
+        shootout_wins = count(winner[shootout])
+        shootout_losses = count(loser[shootout])
+        regulation_losses = count(loser[regulation])
+
+        points_system = self.points_system
+        points = (
+            regulation_wins * points_system.regulation_win
+            + shootout_wins * points_system.shootout_win
+            + shootout_losses * points_system.shootout_loss
+            + regulation_losses * points_system.regulation_loss
+        )
+
+        return TeamStats(
+            played=count(home_team) + count(away_team),
+            regulation_wins=regulation_wins,
+            shootout_wins=shootout_wins,
+            shootout_losses=shootout_losses,
+            regulation_losses=regulation_losses,
+            goals_for=total(home_team, table.home_goals) + total(away_team, table.away_goals),
+            goals_against=total(home_team, table.away_goals) + total(away_team, table.home_goals),
+            shootout_goals_for=(
+                total(home_team[shootout], table.home_shootout_goals[shootout])
+                + total(away_team[shootout], table.away_shootout_goals[shootout])
+            ),
+            shootout_goals_against=(
+                total(home_team[shootout], table.away_shootout_goals[shootout])
+                + total(away_team[shootout], table.home_shootout_goals[shootout])
+            ),
+            points=points,
+        )
+
+    def rank(self, stats: TeamStats) -> np.ndarray:
+        keys = [np.asarray(stats.points)] + [np.asarray(tiebreaker(stats)) for tiebreaker in self.tiebreakers]
+
+        return np.lexsort(tuple(-key for key in reversed(keys)))
+
+    def compute(self, competition: Competition, matches: MatchTable | Iterable[PlayedMatch] = ()) -> list[StandingsRow]:
+        table = matches if isinstance(matches, MatchTable) else MatchTable.from_matches(competition, matches)
+        stats = self.compute_stats(table)
+
+        return [
+            StandingsRow.from_stats(position, table.teams[index], stats.row(index))
+            for position, index in enumerate(self.rank(stats), start=1)
+        ]
@@ -0,0 +1,135 @@
+from bisect import bisect_left, insort
+from collections.abc import Sequence
+from uuid import UUID
+
+from exceptions.match_exceptions import CompetitionMismatchException
+from exceptions.standings_exceptions import (
+    ResultAlreadyAppliedException,
+    ResultNotFoundException,
+)
+from models.competition import Competition
+from models.match import PlayedMatch
+from models.team import Team
+from standings.stats import PointsSystem, StandingsRow, TeamStats
+from standings.tiebreakers import DEFAULT_TIEBREAKERS, Tiebreaker
+from storage.match_table import sorted_teams
+from utils import UUIDMixin
+
+Result = tuple[int, int, int, int, int | None, int | None]
+
+
+class IncrementalStandings:
+    def __init__(
+        self,
+        competition: Competition,
+        points_system: PointsSystem | None = None,
+        tiebreakers: Sequence[Tiebreaker] = DEFAULT_TIEBREAKERS,
+    ):
+        self.competition = competition
+        self.points_system = points_system or PointsSystem()
+        self.tiebreakers = tuple(tiebreakers)
+
+        self.teams = sorted_teams(competition)
+        self.team_index = {team.uuid: index for index, team in enumerate(self.teams)}
+
+        self._stats = [TeamStats() for _ in self.teams]
+        self._results: dict[UUID, Result] = {}
+        self._keys = [self._sort_key(index) for index in range(len(self.teams))]
+        self._ranking = sorted(self._keys)
+
+    def apply(self, match: PlayedMatch) -> None:
+        self._validate_competition(match)
+        if match.uuid in self._results:
+            raise ResultAlreadyAppliedException(match.uuid_str)
+
+        result = (
+            self.team_index[match.home_team.uuid],
+            self.team_index[match.away_team.uuid],
+            match.home_goals,
+            match.away_goals,
+            match.home_shootout_goals,
+            match.away_shootout_goals,
+        )
+        self._results[match.uuid] = result
+        self._update(result, 1)
+
+    def revoke(self, match_uuid: str | UUID) -> None:
+        result = self._results.pop(UUIDMixin.validate_uuid(match_uuid), None)
+        if result is None:
+            raise ResultNotFoundException(str(match_uuid))
+
+        self._update(result, -1)
+
+    def correct(self, match: PlayedMatch) -> None:
+        self._validate_competition(match)
+        self.revoke(match.uuid)
+        self.apply(match)
+
+    def stats(self, team: Team) -> TeamStats:
+        return self._stats[self.team_index[team.uuid]]
+
+    def top(self, count: int) -> list[StandingsRow]:
+        return [
+            StandingsRow.from_stats(position, self.teams[key[-1]], self._stats[key[-1]])
+            for position, key in enumerate(self._ranking[:count], start=1)
+        ]
+
+    def standings(self) -> list[StandingsRow]:
+        return self.top(len(self._ranking))
+
+    def __contains__(self, match_uuid: str | UUID) -> bool:
+        return UUIDMixin.validate_uuid(match_uuid) in self._results
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def _validate_competition(self, match: PlayedMatch) -> None:
+        if match.competition.uuid != self.competition.uuid:
+            raise CompetitionMismatchException(match.uuid_str, self.competition.uuid_str)
+
+    def _update(self, result: Result, sign: int) -> None:
+        home_index, away_index, home_goals, away_goals, home_shootout_goals, away_shootout_goals = result
+        home, away = self._stats[home_index], self._stats[away_index]
+
+        home.played += sign
+        away.played += sign
+        home.goals_for += sign * home_goals
+        home.goals_against += sign * away_goals
+        away.goals_for += sign * away_goals
+        away.goals_against += sign * home_goals
+
+        if home_goals > away_goals:
+            home.regulation_wins += sign
+            away.regulation_losses += sign
+        elif away_goals > home_goals:
+            away.regulation_wins += sign
+            home.regulation_losses += sign
+        else:
+            home.shootout_goals_for += sign * home_shootout_goals
+            home.shootout_goals_against += sign * away_shootout_goals
+            away.shootout_goals_for += sign * away_shootout_goals
+            away.shootout_goals_against += sign * home_shootout_goals
+            winner, loser = (home, away) if home_shootout_goals > away_shootout_goals else (away, home)
+            winner.shootout_wins += sign
+            loser.shootout_losses += sign
+
+        self._rerank(home_index)
+        self._rerank(away_index)
+
+    def _rerank(self, index: int) -> None:
+        stats = self._stats[index]
+        points_system = self.points_system
+        stats.points = (
+            stats.regulation_wins * points_system.regulation_win
+            + stats.shootout_wins * points_system.shootout_win
+            + stats.shootout_losses * points_system.shootout_loss
+            + stats.regulation_losses * points_system.regulation_loss
+        )
+
+        del self._ranking[bisect_left(self._ranking, self._keys[index])]
+        self._keys[index] = self._sort_key(index)
+        insort(self._ranking, self._keys[index])
+
+    def _sort_key(self, index: int) -> tuple:
+        stats = self._stats[index]
+        return (-stats.points, *(-tiebreaker(stats) for tiebreaker in self.tiebreakers), index)
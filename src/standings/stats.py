@@ -0,0 +1,70 @@
+from dataclasses import dataclass, fields
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, NonNegativeInt, PositiveInt, computed_field
+
+from models.team import Team
+
+
+class PointsSystem(BaseModel):
+    regulation_win: NonNegativeInt = 3
+    shootout_win: NonNegativeInt = 2
+    shootout_loss: NonNegativeInt = 1
+    regulation_loss: NonNegativeInt = 0
+
+    model_config = ConfigDict(frozen=True)
+
+
+@dataclass(slots=True)
+class TeamStats:
+    played: int | np.ndarray = 0
+    regulation_wins: int | np.ndarray = 0
+    shootout_wins: int | np.ndarray = 0
+    shootout_losses: int | np.ndarray = 0
+    regulation_losses: int | np.ndarray = 0
+    goals_for: int | np.ndarray = 0
+    goals_against: int | np.ndarray = 0
+    shootout_goals_for: int | np.ndarray = 0
+    shootout_goals_against: int | np.ndarray = 0
+    points: int | np.ndarray = 0
+
+    @property
+    def goal_difference(self) -> int | np.ndarray:
+        return self.goals_for - self.goals_against
+
+    @property
+    def wins(self) -> int | np.ndarray:
+        return self.regulation_wins + self.shootout_wins
+
+    @property
+    def losses(self) -> int | np.ndarray:
+        return self.regulation_losses + self.shootout_losses
+
+    def row(self, index: int) -> "TeamStats":
+        return TeamStats(**{field.name: int(getattr(self, field.name)[index]) for field in fields(self)})
+
+
+class StandingsRow(BaseModel):
+    position: PositiveInt
+    team: Team
+    played: NonNegativeInt
+    regulation_wins: NonNegativeInt
+    shootout_wins: NonNegativeInt
+    shootout_losses: NonNegativeInt
+    regulation_losses: NonNegativeInt
+    goals_for: NonNegativeInt
+    goals_against: NonNegativeInt
+    shootout_goals_for: NonNegativeInt
+    shootout_goals_against: NonNegativeInt
+    points: NonNegativeInt
+
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def from_stats(cls, position: int, team: Team, stats: TeamStats) -> "StandingsRow":
+        return cls(position=position, team=team, **{field.name: getattr(stats, field.name) for field in fields(stats)})
+
+    @computed_field
+    @property
+    def goal_difference(self) -> int:
+        return self.goals_for - self.goals_against
@@ -0,0 +1,33 @@
+from collections.abc import Callable
+from typing import Any
+
+from standings.stats import TeamStats
+
+Tiebreaker = Callable[[TeamStats], Any]
+
+
+def goal_difference(stats: TeamStats) -> Any:
+    return stats.goal_difference
+
+
+def goals_for(stats: TeamStats) -> Any:
+    return stats.goals_for
+
+
+def fewest_goals_against(stats: TeamStats) -> Any:
+    return -stats.goals_against
+
+
+def wins(stats: TeamStats) -> Any:
+    return stats.wins
+
+
+def regulation_wins(stats: TeamStats) -> Any:
+    return stats.regulation_wins
+
+
+def shootout_wins(stats: TeamStats) -> Any:
+    return stats.shootout_wins
+
+
+DEFAULT_TIEBREAKERS: tuple[Tiebreaker, ...] = (goal_difference, goals_for, regulation_wins)
@@ -0,0 +1,4 @@
+from .match_table import MatchTable
+from .sqlite_repository import SQLiteRepository
+
+__all__ = ["MatchTable", "SQLiteRepository"]
@@ -0,0 +1,190 @@
+from collections.abc import Iterable, Iterator
+from uuid import UUID
+
+import numpy as np
+
+from exceptions.match_exceptions import (
+    CompetitionMismatchException,
+    EqualShootoutGoalsException,
+    IdenticalTeamsException,
+    MissingShootoutGoalsException,
+    NonDrawShootoutGoalsException,
+)
+from exceptions.match_table_exceptions import (
+    ColumnLengthMismatchException,
+    TeamIndexOutOfRangeException,
+    UnplayedMatchException,
+)
+from models.competition import Competition
+from models.match import PlayedMatch
+from models.team import Team
+
+COLUMN_DTYPE = np.int16
+UUID_DTYPE = np.dtype("V16")
+
+NULL_GOALS = -1
+NULL_TEAM = -1
+
+
+def sorted_teams(competition: Competition) -> tuple[Team, ...]:
+    return tuple(sorted(competition.teams, key=lambda team: team.uuid))
+
+
+class MatchTable:
+    def __init__(
+        self,
+        competition: Competition,
+        uuids: np.ndarray,
+        matchday_round: np.ndarray,
+        home_team: np.ndarray,
+        away_team: np.ndarray,
+        home_goals: np.ndarray,
+        away_goals: np.ndarray,
+        home_shootout_goals: np.ndarray,
+        away_shootout_goals: np.ndarray,
+    ):
+        self.competition = competition
+        self.teams = sorted_teams(competition)
+        self.team_index = {team.uuid: index for index, team in enumerate(self.teams)}
+
+        self.uuids = np.asarray(uuids, dtype=UUID_DTYPE)
+        self.matchday_round = np.asarray(matchday_round, dtype=COLUMN_DTYPE)
+        self.home_team = np.asarray(home_team, dtype=COLUMN_DTYPE)
+        self.away_team = np.asarray(away_team, dtype=COLUMN_DTYPE)
+        self.home_goals = np.asarray(home_goals, dtype=COLUMN_DTYPE)
+        self.away_goals = np.asarray(away_goals, dtype=COLUMN_DTYPE)
+        self.home_shootout_goals = np.asarray(home_shootout_goals, dtype=COLUMN_DTYPE)
+        self.away_shootout_goals = np.asarray(away_shootout_goals, dtype=COLUMN_DTYPE)
+
+        self._validate_columns()
+
+    @classmethod
+    def from_matches(cls, competition: Competition, matches: Iterable[PlayedMatch]) -> "MatchTable":
+        team_index = {team.uuid: index for index, team in enumerate(sorted_teams(competition))}
+        uuids, rounds, home_team, away_team = [], [], [], []
+        home_goals, away_goals, home_shootout_goals, away_shootout_goals = [], [], [], []
+
+        for match in matches:
+            if not match.is_played():
+                raise UnplayedMatchException(match.uuid_str)
+            if match.competition.uuid != competition.uuid:
+                raise CompetitionMismatchException(match.uuid_str, competition.uuid_str)
+
+            uuids.append(match.uuid.bytes)
+            rounds.append(match.matchday_round)
+            home_team.append(team_index[match.home_team.uuid])
+            away_team.append(team_index[match.away_team.uuid])
+            home_goals.append(match.home_goals)
+            away_goals.append(match.away_goals)
+            home_shootout_goals.append(NULL_GOALS if match.home_shootout_goals is None else match.home_shootout_goals)
+            away_shootout_goals.append(NULL_GOALS if match.away_shootout_goals is None else match.away_shootout_goals)
+
+        return cls(
+            competition=competition,
+            uuids=np.frombuffer(b"".join(uuids), dtype=UUID_DTYPE),
+            matchday_round=rounds,
+            home_team=home_team,
+            away_team=away_team,
+            home_goals=home_goals,
+            away_goals=away_goals,
+            home_shootout_goals=home_shootout_goals,
+            away_shootout_goals=away_shootout_goals,
+        )
+
+    def _validate_columns(self) -> None:
+        lengths = {name: len(column) for name, column in self._columns().items()}
+        if len(set(lengths.values())) > 1:
+            raise ColumnLengthMismatchException(lengths)
+
+        for column in (self.home_team, self.away_team):
+            if column.size and (column.min() < 0 or column.max() >= len(self.teams)):
+                raise TeamIndexOutOfRangeException(len(self.teams))
+
+        identical = np.flatnonzero(self.home_team == self.away_team)
+        if identical.size:
+            raise IdenticalTeamsException(self.competition.team_name(self.teams[self.home_team[identical[0]]]))
+
+        draw = self.is_regular_time_draw
+        missing_shootout = (self.home_shootout_goals == NULL_GOALS) | (self.away_shootout_goals == NULL_GOALS)
+        if np.any(draw & missing_shootout):
+            raise MissingShootoutGoalsException
+        if np.any(draw & (self.home_shootout_goals == self.away_shootout_goals)):
+            raise EqualShootoutGoalsException
+        if np.any(~draw & ((self.home_shootout_goals != NULL_GOALS) | (self.away_shootout_goals != NULL_GOALS))):
+            raise NonDrawShootoutGoalsException
+
+    def _columns(self) -> dict[str, np.ndarray]:
+        return {
+            "uuids": self.uuids,
+            "matchday_round": self.matchday_round,
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "home_goals": self.home_goals,
+            "away_goals": self.away_goals,
+            "home_shootout_goals": self.home_shootout_goals,
+            "away_shootout_goals": self.away_shootout_goals,
+        }
+
+    @property
+    def goal_difference(self) -> np.ndarray:
+        return self.home_goals - self.away_goals
+
+    @property
+    def is_regular_time_draw(self) -> np.ndarray:
+        return self.home_goals == self.away_goals
+
+    @property
+    def regular_time_winner(self) -> np.ndarray:
+        return np.where(
+            self.home_goals > self.away_goals,
+            self.home_team,
+            np.where(self.away_goals > self.home_goals, self.away_team, NULL_TEAM),
+        ).astype(COLUMN_DTYPE)
+
+    @property
+    def winner(self) -> np.ndarray:
+        home_wins = (self.home_goals > self.away_goals) | (
+            self.is_regular_time_draw & (self.home_shootout_goals > self.away_shootout_goals)
+        )
+        return np.where(home_wins, self.home_team, self.away_team).astype(COLUMN_DTYPE)
+
+    def filter(self, mask: np.ndarray) -> "MatchTable":
+        columns = {name: column[mask] for name, column in self._columns().items()}
+        return MatchTable(competition=self.competition, **columns)
+
+    def row(self, index: int) -> PlayedMatch:
+        home_shootout_goals = int(self.home_shootout_goals[index])
+        away_shootout_goals = int(self.away_shootout_goals[index])
+
+        return PlayedMatch.from_trusted(
+            uuid=UUID(bytes=self.uuids[index].tobytes()),
+            competition=self.competition,
+            matchday_round=int(self.matchday_round[index]),
+            home_team=self.teams[self.home_team[index]],
+            away_team=self.teams[self.away_team[index]],
+            home_goals=int(self.home_goals[index]),
+            away_goals=int(self.away_goals[index]),
+            home_shootout_goals=None if home_shootout_goals == NULL_GOALS else home_shootout_goals,
+            away_shootout_goals=None if away_shootout_goals == NULL_GOALS else away_shootout_goals,
+        )
+
+    def team(self, index: int) -> Team:
+        return self.teams[index]
+
+    def to_played_matches(self) -> Iterator[PlayedMatch]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def __getitem__(self, index: int) -> PlayedMatch:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("MatchTable index out of range")
+
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[PlayedMatch]:
+        return self.to_played_matches()
+
+    def __len__(self) -> int:
+        return len(self.uuids)
@@ -0,0 +1,342 @@
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from exceptions.repository_exceptions import (
+    InvalidRepositoryFilterException,
+    RecordNotFoundException,
+)
+from models.competition import Competition
+from models.match import Match, PlayedMatch
+from models.team import Team
+from utils import UUIDMixin
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    uuid BLOB PRIMARY KEY,
+    kings_name TEXT NOT NULL,
+    queens_name TEXT NOT NULL,
+    acronym TEXT NOT NULL,
+    region TEXT NOT NULL,
+    first_color TEXT NOT NULL,
+    second_color TEXT
+);
+
+CREATE TABLE IF NOT EXISTS competitions (
+    uuid BLOB PRIMARY KEY,
+    region TEXT NOT NULL,
+    kingdom TEXT NOT NULL,
+    format TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    split INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS competition_teams (
+    competition BLOB NOT NULL REFERENCES competitions (uuid) ON DELETE CASCADE,
+    team BLOB NOT NULL REFERENCES teams (uuid),
+    PRIMARY KEY (competition, team)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS matches (
+    uuid BLOB PRIMARY KEY,
+    competition BLOB NOT NULL REFERENCES competitions (uuid),
+    matchday_round INTEGER NOT NULL,
+    home_team BLOB NOT NULL REFERENCES teams (uuid),
+    away_team BLOB NOT NULL REFERENCES teams (uuid),
+    home_goals INTEGER,
+    away_goals INTEGER,
+    home_shootout_goals INTEGER,
+    away_shootout_goals INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS competition_teams_team ON competition_teams (team);
+CREATE INDEX IF NOT EXISTS competitions_season ON competitions (season, split);
+CREATE INDEX IF NOT EXISTS matches_competition_round ON matches (competition, matchday_round);
+CREATE INDEX IF NOT EXISTS matches_home_team ON matches (home_team);
+CREATE INDEX IF NOT EXISTS matches_away_team ON matches (away_team);
+"""
+
+TEAM_COLUMNS = ("uuid", "kings_name", "queens_name", "acronym", "region", "first_color", "second_color")
+COMPETITION_COLUMNS = ("uuid", "region", "kingdom", "format", "season", "split")
+MATCH_COLUMNS = (
+    "uuid",
+    "competition",
+    "matchday_round",
+    "home_team",
+    "away_team",
+    "home_goals",
+    "away_goals",
+    "home_shootout_goals",
+    "away_shootout_goals",
+)
+MATCH_FILTERS = ("competition", "team", "matchday_round", "season", "played")
+
+
+def _upsert(table: str, columns: tuple[str, ...]) -> str:
+    updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+        f"ON CONFLICT (uuid) DO UPDATE SET {updates}"
+    )
+
+
+UPSERT_TEAM = _upsert("teams", TEAM_COLUMNS)
+UPSERT_COMPETITION = _upsert("competitions", COMPETITION_COLUMNS)
+UPSERT_MATCH = _upsert("matches", MATCH_COLUMNS)
+
+
+class SQLiteRepository:
+    def __init__(self, database: str | Path = ":memory:", batch_size: int = 1_000):
+        self.connection = sqlite3.connect(database)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        self.batch_size = batch_size
+
+        self._teams: dict[UUID, Team] = {}
+        self._competitions: dict[UUID, Competition] = {}
+
+    def save_teams(self, teams: Iterable[Team]) -> None:
+        teams = {team.uuid: team for team in teams}
+        with self.connection:
+            self.connection.executemany(UPSERT_TEAM, (_team_row(team) for team in teams.values()))
+        self._evict(teams.values())
+
+    def save_competitions(self, competitions: Iterable[Competition]) -> None:
+        competitions = {competition.uuid: competition for competition in competitions}
+        with self.connection:
+            teams = self._write_competitions(competitions)
+        self._evict(teams.values(), competitions.values())
+
+    def save_matches(self, matches: Iterable[Match]) -> None:
+        matches = list(matches)
+        competitions = {match.competition.uuid: match.competition for match in matches}
+
+        with self.connection:
+            teams = self._write_competitions(competitions)
+            self.connection.executemany(UPSERT_MATCH, (_match_row(match) for match in matches))
+        self._evict(teams.values(), competitions.values())
+
+    def get_team(self, team_uuid: str | UUID) -> Team:
+        team_uuid = UUIDMixin.validate_uuid(team_uuid)
+        if team_uuid not in self._teams:
+            self._load_teams("uuid = ?", (team_uuid.bytes,))
+        if team_uuid not in self._teams:
+            raise RecordNotFoundException("teams", str(team_uuid))
+
+        return self._teams[team_uuid]
+
+    def get_competition(self, competition_uuid: str | UUID) -> Competition:
+        competition_uuid = UUIDMixin.validate_uuid(competition_uuid)
+        competition = self._competitions.get(competition_uuid)
+        if competition is None:
+            row = self.connection.execute(
+                f"SELECT {', '.join(COMPETITION_COLUMNS)} FROM competitions WHERE uuid = ?", (competition_uuid.bytes,)
+            ).fetchone()
+            if row is None:
+                raise RecordNotFoundException("competitions", str(competition_uuid))
+            competition = self._build_competition(row)
+
+        return competition
+
+    def competitions(self, season: int | None = None) -> list[Competition]:
+        query, parameters = "SELECT uuid FROM competitions", ()
+        if season is not None:
+            query, parameters = f"{query} WHERE season = ?", (season,)
+
+        return [
+            self.get_competition(UUID(bytes=row[0]))
+            for row in self.connection.execute(f"{query} ORDER BY rowid", parameters)
+        ]
+
+    def matches(self, **filters: Any) -> Iterator[Match]:
+        query, parameters = self._match_query(filters)
+        cursor = self.connection.execute(query, parameters)
+        lookups: dict[bytes, tuple[Competition, dict[bytes, Team]]] = {}
+
+        while rows := cursor.fetchmany(self.batch_size):
+            for row in rows:
+                yield self._build_match(row, lookups)
+
+    def count_matches(self, **filters: Any) -> int:
+        query, parameters = self._match_query(filters)
+        return self.connection.execute(f"SELECT COUNT(*) FROM ({query})", parameters).fetchone()[0]
+
+    def delete_matches(self, match_uuids: Iterable[str | UUID]) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM matches WHERE uuid = ?",
+                ((UUIDMixin.validate_uuid(match_uuid).bytes,) for match_uuid in match_uuids),
+            )
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "SQLiteRepository":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _match_query(self, filters: dict[str, Any]) -> tuple[str, list[Any]]:
+        conditions, parameters = [], []
+        for field, value in filters.items():
+            if field == "competition":
+                conditions.append("matches.competition = ?")
+                parameters.append(_uuid_bytes(value))
+            elif field == "team":
+                conditions.append("(matches.home_team = ? OR matches.away_team = ?)")
+                parameters.extend([_uuid_bytes(value)] * 2)
+            elif field == "matchday_round":
+                conditions.append("matches.matchday_round = ?")
+                parameters.append(value)
+            elif field == "season":
+                conditions.append("matches.competition IN (SELECT uuid FROM competitions WHERE season = ?)")
+                parameters.append(value)
+            elif field == "played":
+                conditions.append(f"matches.home_goals IS {'NOT ' if value else ''}NULL")
+            else:
+                raise InvalidRepositoryFilterException(field, MATCH_FILTERS)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return f"SELECT {', '.join(MATCH_COLUMNS)} FROM matches{where} ORDER BY matches.rowid", parameters
+
+    def _build_match(self, row: tuple, lookups: dict[bytes, tuple[Competition, dict[bytes, Team]]]) -> Match:
+        uuid, competition_uuid, matchday_round, home_team, away_team, *goals = row
+        if competition_uuid not in lookups:
+            competition = self.get_competition(UUID(bytes=competition_uuid))
+            lookups[competition_uuid] = competition, {team.uuid.bytes: team for team in competition.teams}
+        competition, teams = lookups[competition_uuid]
+
+        data = {
+            "uuid": UUID(bytes=uuid),
+            "competition": competition,
+            "matchday_round": matchday_round,
+            "home_team": teams[home_team],
+            "away_team": teams[away_team],
+        }
+        if goals[0] is None:
+            return Match.from_trusted(**data)
+
+        return PlayedMatch.from_trusted(**data, **dict(zip(MATCH_COLUMNS[5:], goals)))
+
+    def _build_competition(self, row: tuple) -> Competition:
+        uuid, region, kingdom, competition_format, season, split = row
+        team_uuids = [
+            UUID(bytes=team_row[0])
+            for team_row in self.connection.execute("SELECT team FROM competition_teams WHERE competition = ?", (uuid,))
+        ]
+        missing = [team_uuid.bytes for team_uuid in team_uuids if team_uuid not in self._teams]
+        if missing:
+            self._load_teams(f"uuid IN ({', '.join('?' * len(missing))})", missing)
+
+        competition = Competition.from_trusted(
+            uuid=UUID(bytes=uuid),
+            region=region,
+            kingdom=kingdom,
+            format=competition_format,
+            season=season,
+            split=split,
+            teams=[self._teams[team_uuid] for team_uuid in team_uuids],
+        )
+        self._competitions[competition.uuid] = competition
+
+        return competition
+
+    def _load_teams(self, condition: str, parameters: Iterable[Any]) -> None:
+        query = f"SELECT {', '.join(TEAM_COLUMNS)} FROM teams WHERE {condition}"
+        for uuid, kings_name, queens_name, acronym, region, first_color, second_color in self.connection.execute(
+            query, tuple(parameters)
+        ):
+            team = Team.from_trusted(
+                uuid=UUID(bytes=uuid),
+                kings_name=kings_name,
+                queens_name=queens_name,
+                acronym=acronym,
+                region=region,
+                first_color=first_color,
+                second_color=second_color,
+            )
+            self._teams[team.uuid] = team
+
+    def _write_competitions(self, competitions: dict[UUID, Competition]) -> dict[UUID, Team]:
+        teams = {team.uuid: team for competition in competitions.values() for team in competition.teams}
+
+        self.connection.executemany(UPSERT_TEAM, (_team_row(team) for team in teams.values()))
+        self.connection.executemany(
+            UPSERT_COMPETITION, (_competition_row(competition) for competition in competitions.values())
+        )
+        self.connection.executemany(
+            "DELETE FROM competition_teams WHERE competition = ?",
+            ((competition_uuid.bytes,) for competition_uuid in competitions),
+        )
+        self.connection.executemany(
+            "INSERT INTO competition_teams (competition, team) VALUES (?, ?)",
+            (
+                (competition.uuid.bytes, team.uuid.bytes)
+                for competition in competitions.values()
+                for team in competition.teams
+            ),
+        )
+
+        return teams
+
+    def _evict(self, teams: Iterable[Team], competitions: Iterable[Competition] = ()) -> None:
+        stale_teams = {team.uuid for team in teams if self._teams.get(team.uuid, team) != team}
+        stale_competitions = {
+            competition.uuid
+            for competition in competitions
+            if self._competitions.get(competition.uuid, competition) != competition
+        }
+
+        for team_uuid in stale_teams:
+            del self._teams[team_uuid]
+        for competition_uuid, competition in list(self._competitions.items()):
+            if competition_uuid in stale_competitions or any(team.uuid in stale_teams for team in competition.teams):
+                del self._competitions[competition_uuid]
+
+
+def _uuid_bytes(value: Team | Competition | str | UUID) -> bytes:
+    if isinstance(value, Team | Competition):
+        return value.uuid.bytes
+
+    return UUIDMixin.validate_uuid(value).bytes
+
+
+def _team_row(team: Team) -> tuple:
+    return (
+        team.uuid.bytes,
+        team.kings_name,
+        team.queens_name,
+        team.acronym,
+        team.region,
+        str(team.first_color),
+        None if team.second_color is None else str(team.second_color),
+    )
+
+
+def _competition_row(competition: Competition) -> tuple:
+    return (
+        competition.uuid.bytes,
+        competition.region,
+        competition.kingdom,
+        competition.format,
+        competition.season,
+        competition.split,
+    )
+
+
+def _match_row(match: Match) -> tuple:
+    played = match.is_played()
+    return (
+        match.uuid.bytes,
+        match.competition.uuid.bytes,
+        match.matchday_round,
+        match.home_team.uuid.bytes,
+        match.away_team.uuid.bytes,
+        match.home_goals if played else None,
+        match.away_goals if played else None,
+        match.home_shootout_goals if played else None,
+        match.away_shootout_goals if played else None,
+    )
@@ -0,0 +1,106 @@
+import pytest
+
+from enums import CompetitionFormat, Kingdom, Region
+from models.competition import Competition
+from models.match import PlayedMatch
+from models.team import Team
+
+
+@pytest.fixture
+def teams():
+    return {
+        Team(
+            uuid="12345678-1234-5678-1234-567812345678",
+            kings_name="Kings Team 1",
+            queens_name="Queens Team 1",
+            acronym="KT1",
+            region=Region.AM,
+            first_color="blue",
+            second_color="white",
+        ),
+        Team(
+            uuid="23456789-1234-5678-1234-567812345678",
+            kings_name="Kings Team 2",
+            queens_name="Queens Team 2",
+            acronym="KT2",
+            region=Region.AM,
+            first_color="red",
+        ),
+    }
+
+
+@pytest.fixture
+def competition(teams):
+    return Competition(
+        uuid="11111111-1111-1111-1111-111111111111",
+        region=Region.AM,
+        kingdom=Kingdom.KINGS,
+        format=CompetitionFormat.LEAGUE,
+        season=2023,
+        split=1,
+        teams=teams,
+    )
+
+
+@pytest.fixture
+def league_teams():
+    return {
+        Team(
+            uuid=f"{index}0000000-0000-0000-0000-000000000000",
+            kings_name=f"Kings League Team {index}",
+            queens_name=f"Queens League Team {index}",
+            acronym=f"LT{index}",
+            region=Region.ESP,
+            first_color="black",
+        )
+        for index in range(1, 5)
+    }
+
+
+@pytest.fixture
+def league(league_teams):
+    return Competition(
+        uuid="44444444-4444-4444-4444-444444444444",
+        region=Region.ESP,
+        kingdom=Kingdom.QUEENS,
+        format=CompetitionFormat.LEAGUE,
+        season=2024,
+        split=2,
+        teams=league_teams,
+    )
+
+
+@pytest.fixture
+def league_team(league_teams):
+    teams_by_acronym = {team.acronym: team for team in league_teams}
+
+    def get_league_team(acronym: str) -> Team:
+        return teams_by_acronym[acronym]
+
+    return get_league_team
+
+
+@pytest.fixture
+def league_results(league, league_team):
+    results = [
+        ("LT1", "LT2", 3, 1, None, None),
+        ("LT3", "LT4", 2, 2, 3, 1),
+        ("LT1", "LT3", 0, 4, None, None),
+        ("LT2", "LT4", 1, 1, 2, 4),
+        ("LT4", "LT1", 5, 5, 0, 1),
+        ("LT2", "LT3", 2, 0, None, None),
+    ]
+    return [
+        PlayedMatch(
+            uuid=f"a0000000-0000-0000-0000-00000000000{index}",
+            competition=league,
+            matchday_round=index // 2 + 1,
+            home_team=league_team(home),
+            away_team=league_team(away),
+            home_goals=home_goals,
+            away_goals=away_goals,
+            home_shootout_goals=home_shootout_goals,
+            away_shootout_goals=away_shootout_goals,
+        )
+        for index, (home, away, home_goals, away_goals, home_shootout_goals, away_shootout_goals) in enumerate(results)
+    ]
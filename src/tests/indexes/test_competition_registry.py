@@ -0,0 +1,82 @@
+import pytest
+
+from enums import CompetitionFormat, Kingdom, Region
+from exceptions.registry_exceptions import (
+    CompetitionNotRegisteredException,
+    InvalidRegistryFilterException,
+)
+from indexes import CompetitionRegistry
+from models import Competition
+
+
+@pytest.fixture
+def cup(league_teams):
+    return Competition(
+        uuid="55555555-5555-5555-5555-555555555555",
+        region=Region.ESP,
+        kingdom=Kingdom.KINGS,
+        format=CompetitionFormat.CUP,
+        season=2024,
+        teams=league_teams,
+    )
+
+
+@pytest.fixture
+def registry(competition, league, cup):
+    return CompetitionRegistry([competition, league, cup])
+
+
+def test_mapping_access(registry, league):
+    assert len(registry) == 3
+    assert registry[league.uuid] is league
+    assert registry[league.uuid_str] is league
+    assert league.uuid in registry
+    assert registry.get("66666666-6666-6666-6666-666666666666") is None
+
+
+def test_find_by_single_field(registry, competition, league, cup):
+    assert registry.find(region=Region.ESP) == [league, cup]
+    assert registry.find(region="americas") == [competition]
+    assert registry.find(season=2024) == [league, cup]
+    assert registry.find(split=None) == [cup]
+
+
+def test_find_composite(registry, league, cup):
+    assert registry.find(region=Region.ESP, format=CompetitionFormat.LEAGUE) == [league]
+    assert registry.find(region=Region.ESP, kingdom=Kingdom.KINGS, season=2024) == [cup]
+    assert registry.find(region=Region.AM, season=2024) == []
+
+
+def test_find_without_filters_returns_all(registry, competition, league, cup):
+    assert registry.find() == [competition, league, cup]
+
+
+def test_find_by_team(registry, teams, league_team, league, cup):
+    assert registry.competitions_for_team(league_team("LT1")) == [league, cup]
+    assert registry.find(team=league_team("LT1").uuid_str, kingdom=Kingdom.QUEENS) == [league]
+    assert len(registry.find(team=next(iter(teams)))) == 1
+
+
+def test_invalid_filter(registry):
+    with pytest.raises(InvalidRegistryFilterException):
+        registry.find(name="Kings League")
+
+
+def test_remove(registry, league, cup):
+    assert registry.remove(league.uuid_str) is league
+
+    assert league.uuid not in registry
+    assert registry.find(region=Region.ESP) == [cup]
+    assert registry.find(kingdom=Kingdom.QUEENS) == []
+    with pytest.raises(CompetitionNotRegisteredException):
+        registry.remove(league.uuid)
+
+
+def test_add_replaces_existing(registry, league, cup):
+    updated = league.model_copy(update={"season": 2025})
+    registry.add(updated)
+
+    assert len(registry) == 3
+    assert registry[league.uuid] is updated
+    assert registry.find(season=2024) == [cup]
+    assert registry.find(season=2025) == [updated]
@@ -0,0 +1,111 @@
+import pytest
+
+from exceptions.index_exceptions import (
+    InvalidMatchFilterException,
+    MatchNotIndexedException,
+)
+from indexes import MatchIndex, match_index
+from indexes.match_index import intersect, positions, union
+from models import Match, PlayedMatch
+
+
+@pytest.fixture
+def fixture(league, league_team):
+    return Match(
+        uuid="b0000000-0000-0000-0000-000000000000",
+        competition=league,
+        matchday_round=4,
+        home_team=league_team("LT3"),
+        away_team=league_team("LT1"),
+    )
+
+
+@pytest.fixture
+def index(league_results, fixture):
+    return MatchIndex([*league_results, fixture])
+
+
+def test_find_by_team_and_round(index, league_results, league_team):
+    assert index.find(team=league_team("LT1"), played=True) == [league_results[0], league_results[2], league_results[4]]
+    assert index.find(team=league_team("LT1"), matchday_round=2) == [league_results[2]]
+    assert index.find(home_team=league_team("LT2").uuid_str, away_team=league_team("LT4")) == [league_results[3]]
+
+
+def test_find_by_round_range(index, league_results):
+    assert index.find(matchday_round=range(2, 4)) == league_results[2:]
+
+
+def test_find_by_competition_and_played(index, league, league_results, fixture):
+    assert index.find(competition=league, played=True) == league_results
+    assert index.find(competition=league.uuid_str, played=False) == [fixture]
+
+
+def test_head_to_head(index, league_results, fixture, league_team):
+    assert index.head_to_head(league_team("LT1"), league_team("LT3")) == [league_results[2], fixture]
+    assert index.head_to_head(league_team("LT2"), league_team("LT1")) == [league_results[0]]
+
+
+def test_postings_intersection(index, league_team):
+    postings = intersect(index.postings(team=league_team("LT1")), index.postings(team=league_team("LT4")))
+
+    assert positions(postings).tolist() == [4]
+    assert index.postings(team=league_team("LT1"), matchday_round=1, played=False) == {}
+
+
+def test_invalid_filter(index):
+    with pytest.raises(InvalidMatchFilterException):
+        index.find(season=2024)
+
+
+def test_play_updates_index(index, fixture):
+    played_match = index.play(fixture.uuid, 1, 3)
+
+    assert isinstance(played_match, PlayedMatch)
+    assert index[fixture.uuid] is played_match
+    assert index.find(played=False) == []
+    assert index.find(matchday_round=4, played=True) == [played_match]
+    assert len(index) == 7
+
+
+def test_remove(index, league_results, league_team):
+    assert index.remove(league_results[2].uuid_str) is league_results[2]
+
+    assert league_results[2].uuid not in index
+    assert index.find(matchday_round=2) == [league_results[3]]
+    assert index.head_to_head(league_team("LT1"), league_team("LT3")) == [index["b0000000-0000-0000-0000-000000000000"]]
+    with pytest.raises(MatchNotIndexedException):
+        index.remove(league_results[2].uuid)
+
+
+def test_remove_compacts_free_slots(index, league_results, fixture, monkeypatch):
+    monkeypatch.setattr(match_index, "COMPACT_MIN_REMOVED", 2)
+    for match in league_results[:4]:
+        index.remove(match.uuid)
+
+    assert len(index._matches) == 3
+    assert index.find() == [*league_results[4:], fixture]
+    assert index.find(played=False) == [fixture]
+
+
+def test_bitmaps_span_chunks():
+    postings = {}
+    for position in (0, 4095, 4096, 10_000):
+        match_index._set(postings, position)
+
+    assert sorted(postings) == [0, 1, 2]
+    assert positions(postings).tolist() == [0, 4095, 4096, 10_000]
+    match_index._unset(postings, 10_000)
+    assert sorted(postings) == [0, 1]
+
+
+def test_queries_only_visit_shared_chunks():
+    narrow, wide = {}, {}
+    for position in (3, 40_005):
+        match_index._set(narrow, position)
+    for position in range(0, 100_000, 7):
+        match_index._set(wide, position)
+
+    assert positions(intersect(narrow, wide)).tolist() == [40_005]
+    assert positions(intersect(wide, narrow, excluded=[narrow])).tolist() == []
+    assert sorted(intersect(narrow, wide)) == [9]
+    assert positions(union(narrow, {0: 1})).tolist() == [0, 3, 40_005]
@@ -0,0 +1,74 @@
+import io
+import json
+from itertools import cycle, islice
+
+import pytest
+
+from exceptions.competition_exceptions import TeamNotFoundException
+from exceptions.ingestion_exceptions import UnknownCompetitionException
+from exceptions.match_exceptions import (
+    EqualShootoutGoalsException,
+    MissingShootoutGoalsException,
+)
+from ingestion import read_played_match_batches, read_played_matches
+from serialization import dump_matches
+
+
+@pytest.fixture
+def lines(league_results):
+    return [json.dumps(row) + "\n" for row in dump_matches(league_results)["matches"]]
+
+
+def test_read_played_matches(lines, league, league_results):
+    matches = list(read_played_matches(io.StringIO("".join(lines)), [league]))
+
+    assert matches == league_results
+    assert all(match.competition is league for match in matches)
+
+
+def test_read_from_path(tmp_path, lines, league, league_results):
+    path = tmp_path / "results.ndjson"
+    path.write_text("".join(lines) + "\n")
+
+    assert list(read_played_matches(path, {league.uuid: league})) == league_results
+
+
+def test_read_batches(lines, league, league_results):
+    batches = list(read_played_match_batches(lines, [league], batch_size=4))
+
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert batches[0] + batches[1] == league_results
+
+
+def test_invalid_rows_go_to_error_channel(lines, league, league_results):
+    draw_without_shootout = {**json.loads(lines[0]), "away_goals": 3}
+    equal_shootout = {**json.loads(lines[1]), "home_shootout_goals": 1}
+    unknown_team = {**json.loads(lines[2]), "home_team": "99999999-9999-9999-9999-999999999999"}
+    unknown_competition = {**json.loads(lines[3]), "competition": "99999999-9999-9999-9999-999999999999"}
+    rows = [draw_without_shootout, equal_shootout, unknown_team, unknown_competition]
+    source = [json.dumps(row) for row in rows] + ["{not json"] + lines[4:]
+
+    errors = []
+    matches = list(read_played_matches(source, [league], errors=errors.append))
+
+    assert matches == league_results[4:]
+    assert [error.line_number for error in errors] == [1, 2, 3, 4, 5]
+    assert [type(error.exception) for error in errors] == [
+        MissingShootoutGoalsException,
+        EqualShootoutGoalsException,
+        TeamNotFoundException,
+        UnknownCompetitionException,
+        json.JSONDecodeError,
+    ]
+    assert errors[4].line == "{not json"
+
+
+def test_errors_raise_without_channel(lines, league):
+    with pytest.raises(UnknownCompetitionException):
+        list(read_played_matches(lines, []))
+
+
+def test_streams_lazily(lines, league, league_results):
+    matches = read_played_matches(cycle(lines), [league])
+
+    assert list(islice(matches, 12)) == league_results * 2
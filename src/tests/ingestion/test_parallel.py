@@ -0,0 +1,84 @@
+import pytest
+
+from ingestion import parallel, validate_records
+from serialization import dump_matches
+
+
+@pytest.fixture
+def records(league_results):
+    return dump_matches(league_results)["matches"]
+
+
+@pytest.fixture
+def dirty_records(records, competition):
+    other = {
+        "uuid": "d0000000-0000-0000-0000-000000000000",
+        "competition": competition.uuid_str,
+        "matchday_round": 1,
+        "home_team": "12345678-1234-5678-1234-567812345678",
+        "away_team": "23456789-1234-5678-1234-567812345678",
+        "home_goals": 1,
+        "away_goals": 0,
+    }
+    return [
+        records[0],
+        {**records[1], "home_shootout_goals": None},
+        other,
+        {**records[2], "competition": "99999999-9999-9999-9999-999999999999"},
+        {**records[3], "home_team": records[3]["away_team"]},
+        records[4],
+        {**records[5], "matchday_round": 0},
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_validate_records(records, league, competition, league_results, max_workers):
+    result = validate_records(records, [league, competition], max_workers=max_workers, chunk_size=2)
+
+    assert result.matches == league_results
+    assert result.rows == list(range(len(records)))
+    assert result.failures == []
+    assert all(match.competition is league for match in result.matches)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_failures_are_aggregated_per_row(dirty_records, league, competition, league_results, max_workers):
+    result = validate_records(dirty_records, [league, competition], max_workers=max_workers, chunk_size=2)
+
+    assert result.rows == [0, 2, 5]
+    assert result.matches[0] == league_results[0]
+    assert result.matches[1].competition is competition
+    assert [(failure.row, failure.exception_type) for failure in result.failures] == [
+        (1, "MissingShootoutGoalsException"),
+        (3, "UnknownCompetitionException"),
+        (4, "IdenticalTeamsException"),
+        (6, "ValidationError"),
+    ]
+    assert result.failures[0].message == "Shootout goals must be provided if the match is a draw in regular time."
+    assert list(result.failures_by_type) == [
+        "MissingShootoutGoalsException",
+        "UnknownCompetitionException",
+        "IdenticalTeamsException",
+        "ValidationError",
+    ]
+
+
+def test_serial_and_parallel_results_match(dirty_records, league, competition):
+    serial = validate_records(dirty_records, [league, competition], max_workers=1)
+    parallel = validate_records(dirty_records, [league, competition], max_workers=3, chunk_size=1)
+
+    assert serial.matches == parallel.matches
+    assert serial.rows == parallel.rows
+    assert serial.failures == parallel.failures
+
+
+def test_no_records(league):
+    result = validate_records([], [league], max_workers=2)
+
+    assert (result.matches, result.rows, result.failures) == ([], [], [])
+
+
+def test_serial_validation_leaves_no_worker_state(records, league, competition):
+    validate_records(records, [league, competition], max_workers=1)
+
+    assert parallel._worker_competitions == {}
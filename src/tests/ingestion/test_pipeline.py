@@ -0,0 +1,122 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from exceptions.ingestion_exceptions import UnknownMatchException
+from exceptions.match_exceptions import (
+    CompetitionMismatchException,
+    MissingShootoutGoalsException,
+)
+from ingestion import IngestionPipeline, NDJSONSink, StandingsSink
+from models.match import Match
+from serialization import dump_matches
+from standings import IncrementalStandings
+
+
+@pytest.fixture
+def fixtures(league_results):
+    return {
+        match.uuid: Match(
+            uuid=match.uuid,
+            competition=match.competition,
+            matchday_round=match.matchday_round,
+            home_team=match.home_team,
+            away_team=match.away_team,
+        )
+        for match in league_results
+    }
+
+
+@pytest.fixture
+def records(league_results):
+    return dump_matches(league_results)["matches"]
+
+
+def run(pipeline, records):
+    asyncio.run(pipeline.run(records))
+
+
+def test_pipeline_writes_played_matches_to_sinks(fixtures, records, league, league_results):
+    standings = IncrementalStandings(league)
+    output = io.StringIO()
+    pipeline = IngestionPipeline(fixtures, [StandingsSink([standings]), NDJSONSink(output)], batch_size=4)
+
+    run(pipeline, [json.dumps(record) for record in records])
+
+    expected = IncrementalStandings(league)
+    for match in league_results:
+        expected.apply(match)
+
+    assert pipeline.errors == []
+    assert standings.standings() == expected.standings()
+    assert [json.loads(line) for line in output.getvalue().splitlines()] == records
+
+
+def test_pipeline_batches_by_size(fixtures, records, league_results):
+    batches = []
+    pipeline = IngestionPipeline(fixtures, [batches.append], batch_size=4, batch_timeout=10)
+
+    run(pipeline, records)
+
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert batches[0] + batches[1] == league_results
+    assert pipeline.metrics["validate"].batches == 2
+    assert pipeline.snapshot()["sink"]["items"] == len(records)
+
+
+def test_pipeline_flushes_partial_batch_after_timeout(fixtures, records):
+    batches = []
+
+    async def feed():
+        async with IngestionPipeline(fixtures, [batches.append], batch_size=100, batch_timeout=0.01) as pipeline:
+            await pipeline.submit(records[0])
+            await asyncio.sleep(0.2)
+            assert len(batches) == 1
+
+    asyncio.run(feed())
+
+    assert [len(batch) for batch in batches] == [1]
+
+
+def test_pipeline_reports_invalid_records(fixtures, records, league_results):
+    unknown = {**records[0], "uuid": "b0000000-0000-0000-0000-000000000000"}
+    mismatch = {**records[1], "competition": "11111111-1111-1111-1111-111111111111"}
+    missing_shootout = {**records[3], "home_shootout_goals": None}
+    batches = []
+    pipeline = IngestionPipeline(fixtures, [batches.append])
+
+    run(pipeline, [unknown, mismatch, records[2], missing_shootout, "not json"])
+
+    assert [error.line_number for error in pipeline.errors] == [1, 2, 5, 4]
+    assert isinstance(pipeline.errors[0].exception, UnknownMatchException)
+    assert isinstance(pipeline.errors[1].exception, CompetitionMismatchException)
+    assert isinstance(pipeline.errors[2].exception, json.JSONDecodeError)
+    assert isinstance(pipeline.errors[3].exception, MissingShootoutGoalsException)
+    assert batches == [[league_results[2]]]
+
+
+def test_standings_sink_corrects_repeated_results(fixtures, records, league):
+    standings = IncrementalStandings(league)
+    correction = {**records[0], "home_goals": 0, "away_goals": 2}
+    pipeline = IngestionPipeline(fixtures, [StandingsSink([standings])], batch_size=1)
+
+    run(pipeline, [records[0], correction])
+
+    corrected = fixtures[next(iter(fixtures))].to_played_match(0, 2)
+    expected = IncrementalStandings(league)
+    expected.apply(corrected)
+
+    assert len(standings) == 1
+    assert standings.standings() == expected.standings()
+
+
+def test_pipeline_propagates_sink_failures(fixtures, records):
+    def failing_sink(matches):
+        raise RuntimeError("sink unavailable")
+
+    pipeline = IngestionPipeline(fixtures, [failing_sink], batch_size=1, queue_size=1)
+
+    with pytest.raises(RuntimeError, match="sink unavailable"):
+        run(pipeline, records * 10)
@@ -154,6 +154,15 @@ def test_has_team_with_invalid_uuid(competition):
         competition.has_team("invalid-uuid-string")
 
 
+def test_team_name_uses_competition_kingdom(competition, league, league_team):
+    team = competition.get_team("12345678-1234-5678-1234-567812345678")
+
+    assert competition.kingdom_index == 0
+    assert competition.team_name(team) == team.kings_name
+    assert league.kingdom_index == 1
+    assert league.team_name(league_team("LT1")) == "Queens League Team 1"
+
+
 def test_competition_immutability(competition):
     with pytest.raises(ValidationError):
         competition.uuid = UUID("98765432-1234-5678-1234-567812345678")
@@ -175,3 +184,30 @@ def test_competition_immutability(competition):
 
     with pytest.raises(ValidationError):
         competition.teams = set()
+
+
+def test_from_trusted_matches_validated(competition):
+    trusted = Competition.from_trusted(**competition.model_dump(mode="json"))
+
+    assert trusted == competition
+    assert trusted.kingdom == Kingdom.KINGS.value
+    assert trusted.has_team("12345678-1234-5678-1234-567812345678")
+    assert trusted.get_team("23456789-1234-5678-1234-567812345678").acronym == "KT2"
+
+
+def test_from_trusted_reuses_team_instances(competition, teams):
+    trusted = Competition.from_trusted(**{**competition.model_dump(mode="json"), "teams": teams})
+
+    assert all(any(team is trusted_team for trusted_team in trusted.teams) for team in teams)
+
+
+def test_from_rows_with_verify_sample(competition):
+    rows = [competition.model_dump(mode="json")] * 10
+
+    assert Competition.from_rows(rows, verify_sample=0.5, seed=1) == [competition] * 10
+
+
+def test_model_validate_indexes_teams(competition):
+    validated = Competition.model_validate(competition.model_dump(mode="json"))
+
+    assert validated.has_team("12345678-1234-5678-1234-567812345678")
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import exceptions
+import models
+from exceptions.competition_exceptions import TeamNotFoundException
+from models.team import Team
+
+SOURCE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def loaded_modules(code: str) -> set[str]:
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{code}\nprint('\\n'.join(sys.modules))"],
+        cwd=SOURCE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return set(completed.stdout.split())
+
+
+def test_importing_packages_does_not_load_pydantic():
+    modules = loaded_modules("import enums, exceptions, models, utils")
+
+    assert "pydantic" not in modules
+    assert "models.team" not in modules
+    assert "exceptions.match_exceptions" not in modules
+
+
+def test_color_parsing_loads_on_first_validation():
+    assert "pydantic_extra_types.color" not in loaded_modules("from models import Team")
+    assert "pydantic_extra_types.color" in loaded_modules(
+        "from models import Team\n"
+        "Team(uuid='12345678-1234-5678-1234-567812345678', kings_name='K', queens_name='Q', acronym='KQ',"
+        " region='spain', first_color='red')"
+    )
+
+
+def test_lazy_package_attributes():
+    assert models.Team is Team
+    assert exceptions.TeamNotFoundException is TeamNotFoundException
+    assert {"Competition", "Match", "PlayedMatch", "Team"} <= set(dir(models))
+
+    with pytest.raises(AttributeError):
+        models.Missing
@@ -9,6 +9,7 @@ from exceptions.match_exceptions import (
     TeamNotInCompetitionException,
 )
 from models import Match, Team
+from utils.trusted_construction_mixin import TrustedConstructionMixin
 
 
 @pytest.fixture
@@ -121,3 +122,52 @@ def test_match_immutability(valid_match):
 
     with pytest.raises(ValidationError):
         valid_match.away_team = valid_match.home_team
+
+
+def test_from_rows_resolves_team_uuids(valid_match, competition):
+    row = {
+        "uuid": "55555555-5555-5555-5555-555555555555",
+        "competition": competition,
+        "matchday_round": 1,
+        "home_team": "12345678-1234-5678-1234-567812345678",
+        "away_team": "23456789-1234-5678-1234-567812345678",
+    }
+
+    assert Match.from_rows([row]) == [valid_match]
+    assert Match.from_rows([row], verify_sample=1.0) == [valid_match]
+    assert Match.from_rows([row])[0].competition is competition
+
+
+def test_from_rows_verify_sample_raises(competition):
+    row = {
+        "uuid": "55555555-5555-5555-5555-555555555555",
+        "competition": competition,
+        "matchday_round": 1,
+        "home_team": "12345678-1234-5678-1234-567812345678",
+        "away_team": "12345678-1234-5678-1234-567812345678",
+    }
+
+    assert len(Match.from_rows([row])) == 1
+    with pytest.raises(IdenticalTeamsException):
+        Match.from_rows([row], verify_sample=1.0)
+
+
+def test_from_trusted_accepts_dumped_rows(valid_match):
+    trusted = Match.from_trusted(**valid_match.model_dump(mode="json"))
+
+    assert trusted == valid_match
+    assert trusted.competition == valid_match.competition
+    assert trusted.home_team == valid_match.home_team
+
+
+def test_trusted_construction_requires_from_trusted():
+    class Untrusted(TrustedConstructionMixin):
+        pass
+
+    with pytest.raises(TypeError):
+        Untrusted()
+
+
+@pytest.mark.parametrize("verify_sample", [0.0, 1.0])
+def test_from_rows_accepts_dumped_rows(valid_match, verify_sample):
+    assert Match.from_rows([valid_match.model_dump(mode="json")], verify_sample=verify_sample) == [valid_match]
@@ -114,3 +114,36 @@ def test_played_match_immutability(played_match_factory):
 
     with pytest.raises(ValidationError):
         match.away_shootout_goals = 10
+
+
+def test_from_trusted(played_match_factory):
+    match = played_match_factory(home_goals=1, away_goals=1, home_shootout_goals=2, away_shootout_goals=3)
+    trusted = PlayedMatch.from_trusted(**{**dict(match), "uuid": match.uuid_str})
+
+    assert trusted == match
+    assert trusted.winner == match.away_team
+    assert str(trusted) == str(match)
+
+
+def test_from_trusted_accepts_dumped_rows(played_match_factory):
+    match = played_match_factory(home_goals=2, away_goals=2, home_shootout_goals=4, away_shootout_goals=3)
+    trusted = PlayedMatch.from_trusted(**match.model_dump(mode="json"))
+
+    assert trusted == match
+    assert trusted.winner == match.home_team
+
+
+@pytest.mark.parametrize("verify_sample", [0.0, 1.0])
+def test_from_rows_accepts_dumped_rows(played_match_factory, verify_sample):
+    match = played_match_factory(home_goals=2, away_goals=2, home_shootout_goals=4, away_shootout_goals=3)
+
+    assert PlayedMatch.from_rows([match.model_dump(mode="json")], verify_sample=verify_sample) == [match]
+
+
+def test_from_rows_verify_sample_raises(played_match_factory):
+    match = played_match_factory(home_goals=1, away_goals=0)
+    row = {**dict(match), "uuid": match.uuid_str, "home_shootout_goals": 1, "away_shootout_goals": 0}
+
+    assert PlayedMatch.from_rows([row])[0].home_shootout_goals == 1
+    with pytest.raises(NonDrawShootoutGoalsException):
+        PlayedMatch.from_rows([row], verify_sample=1.0)
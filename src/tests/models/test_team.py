@@ -6,7 +6,9 @@ from pydantic_extra_types.color import Color
 
 from enums import Kingdom, Region
 from exceptions.enum_exceptions import InvalidEnumValueError
+from exceptions.shared_exceptions import InvalidSampleRateException
 from models import Team
+from utils.color import to_packed_color
 
 
 @pytest.fixture
@@ -40,6 +42,19 @@ def test_invalid_uuid_string():
         )
 
 
+@pytest.mark.parametrize("uuid", [None, 123, b"x", ["not", "hashable"]])
+def test_non_string_uuid_raises_validation_error(uuid):
+    with pytest.raises(ValidationError, match="is not a valid UUID"):
+        Team(
+            uuid=uuid,
+            kings_name="Kings Team",
+            queens_name="Queens Team",
+            acronym="ABC",
+            region=Region.AM,
+            first_color="blue",
+        )
+
+
 def test_team_initialization(team):
     assert team.uuid == UUID("12345678-1234-5678-1234-567812345678")
     assert team.kings_name == "Kings Team"
@@ -50,6 +65,16 @@ def test_team_initialization(team):
     assert team.second_color == Color("white")
 
 
+def test_colors_are_stored_packed(team):
+    assert team.__dict__["first_color"] == 0x0000FFFF
+    assert team.__dict__["second_color"] == 0xFFFFFFFF
+    assert isinstance(team.first_color, Color)
+    assert team.model_dump()["first_color"] == Color("blue")
+    assert team.model_dump(mode="json")["second_color"] == "white"
+    assert "first_color=Color('blue'" in repr(team)
+    assert Team.model_validate_json(team.model_dump_json()) == team
+
+
 def test_uuid_str_property(team):
     uuid_str = team.uuid_str
 
@@ -80,6 +105,11 @@ def test_get_team_name_queens_enum(team):
     assert team_name == "Queens Team"
 
 
+def test_team_names_follow_kingdom_order(team):
+    assert team.team_names == ("Kings Team", "Queens Team")
+    assert [team.get_team_name(kingdom) for kingdom in Kingdom] == list(team.team_names)
+
+
 def test_get_team_name_wrong_kingdom(team):
     with pytest.raises(InvalidEnumValueError) as exc:
         team.get_team_name("invalid")
@@ -108,3 +138,64 @@ def test_team_immutability(team):
 
     with pytest.raises(ValidationError):
         team.second_color = "green"
+
+
+def test_from_trusted_matches_validated(team):
+    trusted = Team.from_trusted(**team.model_dump(mode="json"))
+
+    assert trusted == team
+    assert isinstance(trusted.uuid, UUID)
+    assert trusted.region == Region.AM.value
+    assert trusted.first_color == Color("blue")
+
+
+def test_from_rows(team):
+    rows = [team.model_dump(mode="json")] * 3
+
+    assert Team.from_rows(rows) == [team] * 3
+    assert Team.from_rows(rows, verify_sample=1.0) == [team] * 3
+
+
+def test_from_rows_keeps_field_order(team):
+    row = dict(reversed(team.model_dump(mode="json").items()))
+    trusted = Team.from_rows([row])[0]
+
+    assert trusted == team
+    assert list(trusted.__dict__) == list(Team.model_fields)
+    assert trusted.model_fields_set == set(Team.model_fields)
+
+
+def test_from_rows_verify_sample_validates():
+    row = {
+        "uuid": "12345678-1234-5678-1234-567812345678",
+        "kings_name": "Kings Team",
+        "queens_name": "Queens Team",
+        "acronym": "invalid",
+        "region": "americas",
+        "first_color": "blue",
+    }
+
+    assert Team.from_rows([row])[0].acronym == "invalid"
+    with pytest.raises(ValidationError):
+        Team.from_rows([row], verify_sample=1.0)
+
+
+def test_from_rows_invalid_sample_rate(team):
+    with pytest.raises(InvalidSampleRateException, match="The sample rate must be between 0 and 1, got 1.5."):
+        Team.from_rows([team.model_dump(mode="json")], verify_sample=1.5)
+
+
+def test_copies_and_unvalidated_teams_keep_packed_colors(team):
+    copied = team.model_copy(update={"first_color": "green"})
+    constructed = Team.model_construct(**team.model_dump())
+
+    assert copied.first_color == Color("green")
+    assert copied.__dict__["first_color"] == to_packed_color("green")
+    assert constructed == team
+    assert constructed.second_color == Color("white")
+    assert copied.model_dump(mode="json")["first_color"] == "green"
+
+
+def test_iteration_returns_colors(team):
+    assert dict(team)["first_color"] == Color("blue")
+    assert dict(team)["second_color"] == Color("white")
@@ -0,0 +1,85 @@
+import pytest
+from pydantic_extra_types.color import Color
+
+from models import Match, MatchView, PlayedMatchView, TeamView
+from models.views import from_views, to_view, to_views
+
+
+@pytest.fixture
+def fixture_match(league_results):
+    played = league_results[0]
+    return Match(
+        uuid=played.uuid,
+        competition=played.competition,
+        matchday_round=played.matchday_round,
+        home_team=played.home_team,
+        away_team=played.away_team,
+    )
+
+
+def test_views_round_trip(league_results, fixture_match):
+    matches = [*league_results, fixture_match]
+    views = to_views(matches)
+    restored = list(from_views(views))
+
+    assert restored == matches
+    assert [type(match) for match in restored] == [type(match) for match in matches]
+    assert all(match.home_team is original.home_team for match, original in zip(restored, matches))
+
+
+def test_views_share_team_views(league_results):
+    views = to_views(league_results)
+    home_teams = {view.home_team.uuid: view.home_team for view in views}
+
+    assert all(view.home_team is home_teams[view.home_team.uuid] for view in views)
+
+
+def test_played_match_view_accessors(league_results):
+    for match in league_results:
+        view = to_view(match)
+
+        assert isinstance(view, PlayedMatchView)
+        assert view.is_played()
+        assert view.uuid_str == match.uuid_str
+        assert view.winner.uuid == match.winner.uuid
+        assert (view.regular_time_winner is None) == (match.regular_time_winner is None)
+        assert str(view) == str(match)
+
+
+def test_match_view_accessors(fixture_match):
+    view = to_view(fixture_match)
+
+    assert type(view) is MatchView
+    assert not view.is_played()
+    assert str(view) == str(fixture_match)
+    assert view.to_model() == fixture_match
+
+
+def test_team_view_accessors(league_team):
+    team = league_team("LT1")
+    view = TeamView.from_model(team)
+
+    assert view.first_color == team.first_color == Color("black")
+    assert view.second_color is None
+    assert view.team_names == team.team_names
+    assert view.get_team_name("queens") == team.get_team_name("queens")
+    assert view.get_team_name() == team.get_team_name()
+    assert view.to_model() == team
+
+
+def test_views_are_read_only(league_results):
+    view = to_view(league_results[0])
+
+    with pytest.raises(AttributeError):
+        view.home_goals = 10
+    with pytest.raises(AttributeError):
+        view.extra = 1
+    assert not hasattr(view, "__dict__")
+
+
+def test_played_match_view_renders_shootouts(league_results):
+    match = next(match for match in league_results if match.home_shootout_goals is not None)
+    view = to_view(match)
+
+    assert str(view) == str(match)
+    assert f"({match.home_shootout_goals}) - ({match.away_shootout_goals})" in str(view)
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from exceptions.rating_exceptions import TeamNotRatedException
+from ratings import EloRatings, EloSystem, RatingsCheckpoint
+from storage import MatchTable
+
+
+@pytest.fixture
+def system():
+    return EloSystem(home_advantage=0)
+
+
+@pytest.fixture
+def ratings(system, league_results):
+    ratings = EloRatings(system)
+    ratings.replay(league_results)
+    return ratings
+
+
+def test_regulation_win_moves_half_k_between_equal_teams(system, league_results, league_team):
+    ratings = EloRatings(system)
+    ratings.apply(league_results[0])
+
+    assert ratings.rating(league_team("LT1")) == pytest.approx(1516)
+    assert ratings.rating(league_team("LT2")) == pytest.approx(1484)
+
+
+def test_shootout_win_is_worth_less_than_regulation_win(system, league_results, league_team):
+    ratings = EloRatings(system)
+    ratings.apply(league_results[1])
+
+    assert ratings.rating(league_team("LT3")) == pytest.approx(1500 + 32 * (2 / 3 - 0.5))
+    assert ratings.rating(league_team("LT4")) == pytest.approx(1500 - 32 * (2 / 3 - 0.5))
+
+
+def test_replay_matches_incremental_apply(ratings, system, league_results):
+    incremental = EloRatings(system)
+    for match in league_results:
+        incremental.apply(match)
+
+    np.testing.assert_allclose(ratings.ratings, incremental.ratings)
+    np.testing.assert_array_equal(ratings.played, incremental.played)
+    assert ratings.applied == incremental.applied == 6
+
+
+def test_replay_match_table(ratings, system, league, league_results):
+    from_table = EloRatings(system)
+    from_table.replay(MatchTable.from_matches(league, league_results))
+
+    assert {uuid: from_table.rating(uuid) for uuid in from_table.uuids} == pytest.approx(
+        {uuid: ratings.rating(uuid) for uuid in ratings.uuids}
+    )
+
+
+def test_ratings_are_zero_sum(ratings):
+    assert ratings.ratings.sum() == pytest.approx(1500 * len(ratings))
+    np.testing.assert_array_equal(ratings.played, 3)
+
+
+def test_top(ratings, league_team):
+    top = ratings.top(2)
+
+    assert len(top) == 2
+    assert top[0][1] >= top[1][1]
+    assert top[0][0] in {league_team("LT1").uuid, league_team("LT3").uuid}
+
+
+def test_checkpoint_and_restore(ratings, system, league_results):
+    checkpoint = ratings.checkpoint()
+    ratings.apply(league_results[0])
+
+    restored = EloRatings(system, checkpoint)
+    assert restored.applied == 6
+    assert not np.allclose(restored.ratings, ratings.ratings)
+
+    restored.apply(league_results[0])
+    np.testing.assert_allclose(restored.ratings, ratings.ratings)
+
+
+def test_checkpoint_round_trip(ratings, tmp_path):
+    path = tmp_path / "ratings.npz"
+    ratings.checkpoint().save(path)
+    loaded = RatingsCheckpoint.load(path)
+
+    assert loaded.uuids == tuple(ratings.uuids)
+    np.testing.assert_array_equal(loaded.ratings, ratings.ratings)
+    np.testing.assert_array_equal(loaded.played, ratings.played)
+    assert loaded.applied == ratings.applied
+
+
+def test_unknown_team(ratings, teams):
+    team = next(iter(teams))
+
+    assert team not in ratings
+    with pytest.raises(TeamNotRatedException):
+        ratings.rating(team)
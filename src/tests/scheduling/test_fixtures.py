@@ -0,0 +1,161 @@
+from collections import Counter
+from itertools import groupby
+
+import pytest
+
+from enums import CompetitionFormat, Kingdom, Region
+from exceptions.match_exceptions import TeamNotInCompetitionException
+from exceptions.scheduling_exceptions import (
+    DuplicateSeedException,
+    MissingBracketResultException,
+    NotEnoughTeamsException,
+)
+from models import Competition, Team
+from scheduling import (
+    generate_fixtures,
+    knockout_round,
+    next_bracket,
+    round_robin,
+    seeded_bracket,
+)
+
+
+def make_teams(count: int) -> list[Team]:
+    return [
+        Team(
+            uuid=f"{index:08d}-0000-0000-0000-000000000000",
+            kings_name=f"Kings Team {index}",
+            queens_name=f"Queens Team {index}",
+            acronym=f"T{index:02d}",
+            region=Region.ITA,
+            first_color="green",
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+def make_competition(count: int, competition_format: CompetitionFormat = CompetitionFormat.LEAGUE) -> Competition:
+    return Competition(
+        uuid="66666666-6666-6666-6666-666666666666",
+        region=Region.ITA,
+        kingdom=Kingdom.KINGS,
+        format=competition_format,
+        season=2025,
+        split=1 if competition_format == CompetitionFormat.LEAGUE else None,
+        teams=make_teams(count),
+    )
+
+
+@pytest.mark.parametrize("count", [4, 5, 12])
+def test_round_robin_pairs_every_team_once(count):
+    fixtures = list(round_robin(make_competition(count)))
+
+    pairs = {frozenset((match.home_team.uuid, match.away_team.uuid)) for match in fixtures}
+    assert len(fixtures) == len(pairs) == count * (count - 1) // 2
+    assert max(match.matchday_round for match in fixtures) == count - 1 + count % 2
+
+    for _, round_fixtures in groupby(fixtures, key=lambda match: match.matchday_round):
+        teams = [team for match in round_fixtures for team in (match.home_team, match.away_team)]
+        assert len(teams) == len(set(teams))
+
+
+@pytest.mark.parametrize("count", [3, 4, 5, 7, 9, 12])
+def test_round_robin_balances_home_and_away(count):
+    fixtures = list(round_robin(make_competition(count)))
+
+    home_games = Counter(match.home_team.acronym for match in fixtures)
+    assert len(home_games) == count
+    assert max(home_games.values()) - min(home_games.values()) <= 1
+
+    for team in make_teams(count):
+        venues = [match.home_team == team for match in fixtures if team in (match.home_team, match.away_team)]
+        assert max(len(list(streak)) for _, streak in groupby(venues)) <= 2
+
+
+def test_double_round_robin_mirrors_first_leg():
+    fixtures = list(round_robin(make_competition(6), double_round_robin=True))
+    first_leg, second_leg = fixtures[:15], fixtures[15:]
+
+    assert len(second_leg) == 15
+    assert [(match.away_team, match.home_team) for match in first_leg] == [
+        (match.home_team, match.away_team) for match in second_leg
+    ]
+    assert [match.matchday_round - 5 for match in second_leg] == [match.matchday_round for match in first_leg]
+    assert Counter(match.home_team.acronym for match in fixtures) == Counter({f"T{i:02d}": 5 for i in range(1, 7)})
+
+
+def test_fixtures_are_lazy_and_deterministic():
+    competition = make_competition(4)
+    fixtures = generate_fixtures(competition)
+
+    first = next(fixtures)
+    assert first.matchday_round == 1
+    assert [match.uuid for match in round_robin(competition)] == [match.uuid for match in round_robin(competition)]
+
+
+def test_round_robin_rejects_foreign_teams(league_teams):
+    with pytest.raises(TeamNotInCompetitionException):
+        round_robin(make_competition(4), teams=list(league_teams))
+
+
+def test_round_robin_needs_two_teams():
+    with pytest.raises(NotEnoughTeamsException):
+        round_robin(make_competition(4), teams=make_teams(1))
+
+
+def test_seeded_bracket_places_byes_against_top_seeds():
+    seeds = make_teams(6)
+    bracket = seeded_bracket(make_competition(6, CompetitionFormat.CUP), seeds)
+
+    assert bracket == [seeds[0], None, seeds[3], seeds[4], seeds[1], None, seeds[2], seeds[5]]
+
+
+def test_cup_fixtures_and_next_round():
+    competition = make_competition(8, CompetitionFormat.CUP)
+    seeds = make_teams(8)
+    bracket = seeded_bracket(competition, seeds)
+
+    quarter_finals = list(generate_fixtures(competition, seeds=seeds))
+    assert [(match.home_team.acronym, match.away_team.acronym) for match in quarter_finals] == [
+        ("T01", "T08"),
+        ("T04", "T05"),
+        ("T02", "T07"),
+        ("T03", "T06"),
+    ]
+
+    results = [match.to_played_match(1, 2) for match in quarter_finals]
+    semi_final_bracket = next_bracket(competition, bracket, results)
+    semi_finals = list(knockout_round(competition, semi_final_bracket, matchday_round=2))
+
+    assert [(match.home_team.acronym, match.away_team.acronym) for match in semi_finals] == [
+        ("T08", "T05"),
+        ("T07", "T06"),
+    ]
+    assert {match.matchday_round for match in semi_finals} == {2}
+
+
+def test_next_bracket_requires_results():
+    competition = make_competition(4, CompetitionFormat.CUP)
+    bracket = seeded_bracket(competition)
+
+    with pytest.raises(MissingBracketResultException):
+        next_bracket(competition, bracket, [])
+
+
+def test_duplicate_seeds_are_rejected():
+    teams = make_teams(2)
+
+    with pytest.raises(DuplicateSeedException):
+        round_robin(make_competition(2), teams=[teams[0], teams[0], teams[1]])
+    with pytest.raises(DuplicateSeedException):
+        seeded_bracket(make_competition(2, CompetitionFormat.CUP), [teams[1], teams[1]])
+
+
+def test_finished_bracket_has_no_more_rounds():
+    competition = make_competition(2, CompetitionFormat.CUP)
+    final = list(generate_fixtures(competition))
+    champion_bracket = next_bracket(competition, seeded_bracket(competition), [final[0].to_played_match(3, 1)])
+
+    assert champion_bracket == [final[0].home_team]
+    assert list(knockout_round(competition, champion_bracket)) == []
+    assert next_bracket(competition, champion_bracket, []) == champion_bracket
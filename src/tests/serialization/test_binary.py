@@ -0,0 +1,170 @@
+import pytest
+
+from enums import CompetitionFormat, Kingdom, Region
+from exceptions.serialization_exceptions import (
+    CompetitionNotInSeasonFileException,
+    InvalidSeasonFileException,
+    SeasonFileInUseException,
+    UnsupportedSeasonFileVersionException,
+)
+from models import Competition, Match, PlayedMatch, Team
+from serialization.binary import (
+    HEADER,
+    MATCH_DTYPE,
+    SeasonFile,
+    decode_matches,
+    encode_matches,
+    write_season,
+)
+from storage import MatchTable
+
+
+@pytest.fixture
+def matches(league, league_team, league_results):
+    fixture = Match(
+        uuid="c0000000-0000-0000-0000-000000000000",
+        competition=league,
+        matchday_round=4,
+        home_team=league_team("LT3"),
+        away_team=league_team("LT1"),
+    )
+    return league_results + [fixture]
+
+
+@pytest.fixture
+def cup_match():
+    teams = [
+        Team(
+            uuid=f"e000000{index}-0000-0000-0000-000000000000",
+            kings_name=f"Cup Team {index}",
+            queens_name=f"Cup Queens Team {index}",
+            acronym=f"CT{index}",
+            region=Region.ITA,
+            first_color="#123456",
+            second_color="hsl(120, 50%, 50%)",
+        )
+        for index in range(2)
+    ]
+    cup = Competition(
+        uuid="f0000000-0000-0000-0000-000000000000",
+        region=Region.ITA,
+        kingdom=Kingdom.KINGS,
+        format=CompetitionFormat.CUP,
+        season=2025,
+        teams=teams,
+    )
+    return PlayedMatch(
+        uuid="f1000000-0000-0000-0000-000000000000",
+        competition=cup,
+        matchday_round=1,
+        home_team=teams[0],
+        away_team=teams[1],
+        home_goals=7,
+        away_goals=7,
+        home_shootout_goals=2,
+        away_shootout_goals=1,
+    )
+
+
+def test_round_trip(matches):
+    decoded = decode_matches(encode_matches(matches))
+
+    assert decoded == matches
+    assert [type(match) for match in decoded] == [type(match) for match in matches]
+    assert [str(match) for match in decoded] == [str(match) for match in matches]
+
+
+def test_round_trip_multiple_competitions(matches, cup_match):
+    decoded = decode_matches(encode_matches(matches + [cup_match]))
+
+    assert decoded == matches + [cup_match]
+    assert decoded[-1].competition.split is None
+    assert decoded[-1].home_team.second_color == cup_match.home_team.second_color
+
+
+def test_empty_round_trip():
+    assert decode_matches(encode_matches([])) == []
+
+
+def test_decoded_instances_are_shared(matches):
+    decoded = decode_matches(encode_matches(matches))
+
+    competition = decoded[0].competition
+    assert all(match.competition is competition for match in decoded)
+    assert {id(team) for team in competition.teams} == {
+        id(team) for match in decoded for team in (match.home_team, match.away_team)
+    }
+
+
+def test_strings_are_stored_once(matches):
+    data = encode_matches(matches)
+
+    assert data.count(b"Queens League Team 1") == 1
+    assert data.count(b"black") == 1
+
+
+def test_fixed_width_match_records(matches):
+    assert len(encode_matches(matches)) - len(encode_matches(matches[:-1])) == MATCH_DTYPE.itemsize
+
+
+def test_open_with_mmap(tmp_path, matches, league):
+    path = tmp_path / "season.kdsb"
+    write_season(path, matches)
+
+    with SeasonFile.open(path) as season:
+        assert len(season) == len(matches)
+        assert not season.match_records.flags.owndata
+        assert season.match_records["matchday_round"].tolist() == [1, 1, 2, 2, 3, 3, 4]
+        assert list(season) == matches
+
+
+def test_close_with_exported_view_can_be_retried(tmp_path, matches):
+    path = tmp_path / "season.kdsb"
+    write_season(path, matches)
+    season = SeasonFile.open(path)
+    rounds = season.match_records["matchday_round"]
+
+    with pytest.raises(SeasonFileInUseException):
+        season.close()
+
+    assert list(season) == matches
+    del rounds
+    season.close()
+    season.close()
+    assert season.match_records is None
+
+
+def test_match_table(matches, league, league_results):
+    season = SeasonFile(encode_matches(matches))
+    table = season.match_table(league)
+    expected = MatchTable.from_matches(league, league_results)
+
+    assert len(table) == len(league_results)
+    assert table.winner.tolist() == expected.winner.tolist()
+    assert list(table) == league_results
+
+
+def test_match_table_unknown_competition(matches, competition):
+    with pytest.raises(CompetitionNotInSeasonFileException):
+        SeasonFile(encode_matches(matches)).match_table(competition)
+
+
+def test_invalid_magic(matches):
+    with pytest.raises(InvalidSeasonFileException, match="unexpected magic bytes"):
+        SeasonFile(b"XXXX" + encode_matches(matches)[4:])
+
+
+def test_truncated_file(matches):
+    with pytest.raises(InvalidSeasonFileException, match="shorter than the header"):
+        SeasonFile(encode_matches(matches)[: HEADER.size - 1])
+
+    with pytest.raises(InvalidSeasonFileException, match="past the end of the file"):
+        SeasonFile(encode_matches(matches)[:-1])
+
+
+def test_unsupported_version(matches):
+    data = bytearray(encode_matches(matches))
+    data[4] = 99
+
+    with pytest.raises(UnsupportedSeasonFileVersionException, match="version 99 is not supported"):
+        SeasonFile(bytes(data))
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from models import Match, PlayedMatch
+from serialization import (
+    dump_matches,
+    dump_matches_json,
+    load_matches,
+    load_matches_json,
+)
+
+
+@pytest.fixture
+def matches(league, league_team, league_results):
+    fixture = Match(
+        uuid="c0000000-0000-0000-0000-000000000000",
+        competition=league,
+        matchday_round=4,
+        home_team=league_team("LT3"),
+        away_team=league_team("LT1"),
+    )
+    return league_results + [fixture]
+
+
+def test_dump_writes_each_competition_and_team_once(matches):
+    data = dump_matches(matches)
+
+    assert len(data["competitions"]) == 1
+    assert len(data["teams"]) == 4
+    assert len(data["matches"]) == len(matches)
+    assert data["matches"][0]["competition"] == "44444444-4444-4444-4444-444444444444"
+    assert data["matches"][0]["home_team"] == "10000000-0000-0000-0000-000000000000"
+    assert "home_goals" not in data["matches"][-1]
+
+
+def test_round_trip(matches):
+    loaded = load_matches(dump_matches(matches))
+
+    assert loaded == matches
+    assert [type(match) for match in loaded] == [PlayedMatch] * 6 + [Match]
+    assert [str(match) for match in loaded] == [str(match) for match in matches]
+
+
+def test_json_round_trip(matches):
+    assert load_matches_json(dump_matches_json(matches)) == matches
+
+
+def test_trusted_round_trip(matches):
+    assert load_matches(dump_matches(matches), verify_sample=0.0) == matches
+
+
+def test_loaded_instances_are_shared(matches):
+    loaded = load_matches(dump_matches(matches))
+
+    competition = loaded[0].competition
+    teams = {team.uuid: team for team in competition.teams}
+    assert all(match.competition is competition for match in loaded)
+    assert all(match.home_team is teams[match.home_team.uuid] for match in loaded)
+    assert all(match.away_team is teams[match.away_team.uuid] for match in loaded)
+
+
+def test_payload_smaller_than_model_dump(matches):
+    embedded = json.dumps([json.loads(match.model_dump_json()) for match in matches])
+
+    assert len(dump_matches_json(matches)) < len(embedded) / 2
+
+
+def test_multiple_competitions(matches, competition, teams):
+    team_1, team_2 = sorted(teams, key=lambda team: team.acronym)
+    other = Match(
+        uuid="d0000000-0000-0000-0000-000000000000",
+        competition=competition,
+        matchday_round=1,
+        home_team=team_1,
+        away_team=team_2,
+    )
+    data = dump_matches(matches + [other])
+
+    assert len(data["competitions"]) == 2
+    assert len(data["teams"]) == 6
+    assert load_matches(data)[-1] == other
@@ -0,0 +1,51 @@
+from models import Competition, Match
+from serialization import render_matches
+
+
+def test_render_matches_matches_str(league_results):
+    rendered = render_matches(league_results)
+
+    assert rendered.splitlines() == [str(match) for match in league_results]
+    assert rendered.splitlines()[1] == "Queens League Team 3 2 (3) - (1) 2 Queens League Team 4"
+
+
+def test_render_matches_mixed_competitions(competition, teams, league_results):
+    home_team, away_team = sorted(teams, key=lambda team: team.acronym)
+    fixture = Match(
+        uuid="b0000000-0000-0000-0000-000000000000",
+        competition=competition,
+        matchday_round=1,
+        home_team=home_team,
+        away_team=away_team,
+    )
+
+    rendered = render_matches([league_results[0], fixture], separator=" | ")
+
+    assert (
+        rendered == f"Queens League Team 1 3 - 1 Queens League Team 2 | {home_team.kings_name} - {away_team.kings_name}"
+    )
+
+
+def test_render_no_matches():
+    assert render_matches([]) == ""
+
+
+def test_render_streamed_matches_from_short_lived_competitions(league_results):
+    def stream():
+        for index in range(100):
+            match = league_results[index % len(league_results)]
+            data = match.competition.model_dump(mode="json")
+            data["teams"] = [
+                {**team, "kings_name": f"Kings {index}", "queens_name": f"Queens {index} {team['acronym']}"}
+                for team in data["teams"]
+            ]
+            competition = Competition(**data)
+            yield Match.from_trusted(
+                uuid=match.uuid,
+                competition=competition,
+                matchday_round=match.matchday_round,
+                home_team=competition.get_team(match.home_team.uuid),
+                away_team=competition.get_team(match.away_team.uuid),
+            )
+
+    assert render_matches(stream()).splitlines() == [str(match) for match in stream()]
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from exceptions.match_exceptions import CompetitionMismatchException
+from exceptions.simulation_exceptions import InvalidSimulationCountException
+from models import Match
+from scheduling import round_robin
+from simulation import GoalModel, SeasonSimulator
+from standings import StandingsEngine
+
+
+@pytest.fixture
+def remaining(league):
+    return [match for match in round_robin(league) if match.matchday_round > 1]
+
+
+@pytest.fixture
+def simulator(league, league_results, remaining):
+    return SeasonSimulator(league, [*league_results[:2], *remaining])
+
+
+def test_run_is_reproducible(simulator):
+    first = simulator.run(2_000, seed=7, chunk_size=300)
+    second = simulator.run(2_000, seed=7, chunk_size=300)
+
+    assert first.simulations == 2_000
+    np.testing.assert_array_equal(first.positions, second.positions)
+    assert not np.array_equal(first.positions, simulator.run(2_000, seed=8, chunk_size=300).positions)
+
+
+def test_positions_are_permutations(simulator):
+    result = simulator.run(500, seed=1)
+
+    np.testing.assert_array_equal(np.sort(result.positions, axis=1), np.tile(np.arange(1, 5), (500, 1)))
+    np.testing.assert_allclose(result.position_probabilities().sum(axis=0), 1)
+    np.testing.assert_allclose(result.position_probabilities().sum(axis=1), 1)
+    assert result.title_probabilities().sum() == pytest.approx(1)
+    np.testing.assert_allclose(result.top_probabilities(4), 1)
+
+
+def test_simulated_stats_follow_match_rules(simulator, remaining):
+    rng = np.random.default_rng(0)
+    shape = (1_000, len(remaining))
+    home_goals, away_goals = rng.poisson(3, shape), rng.poisson(3, shape)
+    home_shootout_goals = rng.integers(0, 6, shape)
+    away_shootout_goals = rng.integers(0, 5, shape)
+    away_shootout_goals += away_shootout_goals >= home_shootout_goals
+
+    stats = simulator._simulated_stats(home_goals, away_goals, home_shootout_goals, away_shootout_goals)
+
+    assert not np.any(home_shootout_goals == away_shootout_goals)
+    np.testing.assert_array_equal(stats.played, 3)
+    np.testing.assert_array_equal(stats.wins + stats.losses, stats.played)
+    np.testing.assert_array_equal(stats.shootout_wins.sum(axis=1), stats.shootout_losses.sum(axis=1))
+    np.testing.assert_array_equal(stats.goals_for.sum(axis=1), stats.goals_against.sum(axis=1))
+
+
+def test_points_include_played_results(simulator):
+    result = simulator.run(100, seed=3)
+
+    assert result.points.min() >= 0
+    assert np.all(result.points.sum(axis=1) >= 2 * 6)
+    assert np.all(result.points.sum(axis=1) <= 3 * 6)
+
+
+def test_finished_season_matches_standings_engine(league, league_results):
+    result = SeasonSimulator(league, league_results).run(10, seed=0)
+    standings = StandingsEngine().compute(league, league_results)
+
+    expected = {row.team.uuid: row.position for row in standings}
+    for index, team in enumerate(result.teams):
+        assert set(result.positions[:, index]) == {expected[team.uuid]}
+    assert result.title_probabilities().tolist() == [float(team.acronym == "LT3") for team in result.teams]
+
+
+def test_goal_model_uses_played_form(league, league_results, simulator):
+    home_rate, away_rate = simulator.home_rate, simulator.away_rate
+
+    assert home_rate.shape == away_rate.shape == (len(simulator.home_team),)
+    assert not np.allclose(home_rate, GoalModel().home_goals)
+
+
+def test_run_in_pool_matches_inline(simulator):
+    inline = simulator.run(1_000, seed=11, chunk_size=250)
+    pooled = simulator.run(1_000, seed=11, chunk_size=250, max_workers=2)
+
+    np.testing.assert_array_equal(inline.positions, pooled.positions)
+
+
+def test_rejects_invalid_simulation_count(simulator):
+    with pytest.raises(InvalidSimulationCountException):
+        simulator.run(0)
+
+
+def test_rejects_matches_from_other_competitions(league, competition, teams):
+    home_team, away_team = sorted(teams, key=lambda team: team.acronym)
+    match = Match(
+        uuid="b0000000-0000-0000-0000-000000000000",
+        competition=competition,
+        matchday_round=1,
+        home_team=home_team,
+        away_team=away_team,
+    )
+
+    with pytest.raises(CompetitionMismatchException):
+        SeasonSimulator(league, [match])
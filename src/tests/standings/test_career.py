@@ -0,0 +1,105 @@
+import pytest
+
+from enums import CompetitionFormat, Kingdom, Region
+from exceptions.standings_exceptions import (
+    IncompatibleAggregateException,
+    InvalidGroupFieldException,
+)
+from models.competition import Competition
+from models.match import PlayedMatch
+from standings import CareerAggregate, StandingsEngine, TeamStats, aggregate_careers
+
+
+@pytest.fixture
+def cup(league_teams):
+    return Competition(
+        uuid="55555555-5555-5555-5555-555555555555",
+        region=Region.ESP,
+        kingdom=Kingdom.KINGS,
+        format=CompetitionFormat.CUP,
+        season=2025,
+        teams=league_teams,
+    )
+
+
+@pytest.fixture
+def cup_results(cup, league_team):
+    return [
+        PlayedMatch(
+            uuid=f"b0000000-0000-0000-0000-00000000000{index}",
+            competition=cup,
+            matchday_round=1,
+            home_team=league_team(home),
+            away_team=league_team(away),
+            home_goals=home_goals,
+            away_goals=away_goals,
+            home_shootout_goals=home_shootout_goals,
+            away_shootout_goals=away_shootout_goals,
+        )
+        for index, (home, away, home_goals, away_goals, home_shootout_goals, away_shootout_goals) in enumerate(
+            [("LT1", "LT2", 1, 1, 4, 3), ("LT3", "LT1", 0, 2, None, None)]
+        )
+    ]
+
+
+def test_matches_standings_for_single_competition(league, league_results):
+    aggregate = aggregate_careers(league_results)
+    standings = StandingsEngine().compute(league, league_results)
+
+    for row in standings:
+        stats = aggregate.stats(row.team)
+        assert stats == TeamStats(**row.model_dump(exclude={"position", "team", "goal_difference"}))
+
+
+def test_career_totals_across_competitions(league_results, cup_results, league_team):
+    aggregate = aggregate_careers(league_results + cup_results)
+    row = next(row for row in aggregate.table() if row.team == league_team("LT1"))
+
+    assert (row.played, row.regulation_wins, row.shootout_wins, row.shootout_losses) == (5, 2, 2, 0)
+    assert (row.goals_for, row.goals_against) == (11, 11)
+    assert row.shootout_conversion == 1.0
+    assert row.team.team_names == ("Kings League Team 1", "Queens League Team 1")
+
+
+def test_group_by(league_results, cup_results, league_team):
+    aggregate = aggregate_careers(league_results + cup_results, group_by=("season", "format", "split"))
+
+    assert aggregate.groups() == [(2024, "league", 2), (2025, "cup", None)]
+    assert [(row.season, row.format, row.split) for row in aggregate.team_table(league_team("LT1"))] == [
+        (2024, "league", 2),
+        (2025, "cup", None),
+    ]
+    cup_table = aggregate.table((2025, "cup", None))
+    assert [row.team.acronym for row in cup_table] == ["LT1", "LT2", "LT3"]
+    assert aggregate.stats(league_team("LT4"), (2025, "cup", None)).played == 0
+
+
+def test_shootout_conversion_without_shootouts(league_results, league_team):
+    aggregate = aggregate_careers(league_results)
+    row = next(row for row in aggregate.table() if row.team == league_team("LT2"))
+
+    assert row.shootout_conversion == 0.0
+    assert CareerAggregate().table() == []
+
+
+def test_merge_partials(league_results, cup_results):
+    matches = league_results + cup_results
+    merged = CareerAggregate(["season"]).update(matches[:3]).merge(CareerAggregate(["season"]).update(matches[3:]))
+
+    assert merged.table() == aggregate_careers(matches, group_by=["season"]).table()
+
+
+def test_parallel(league_results, cup_results):
+    matches = league_results + cup_results
+
+    assert aggregate_careers(matches, max_workers=2, chunk_size=3).table() == aggregate_careers(matches).table()
+
+
+def test_invalid_group_field():
+    with pytest.raises(InvalidGroupFieldException):
+        CareerAggregate(["team"])
+
+
+def test_merge_requires_same_grouping():
+    with pytest.raises(IncompatibleAggregateException):
+        CareerAggregate(["season"]).merge(CareerAggregate(["split"]))
@@ -0,0 +1,77 @@
+import pytest
+
+from standings import PointsSystem, StandingsEngine
+from standings.tiebreakers import fewest_goals_against, shootout_wins
+from storage import MatchTable
+
+
+@pytest.fixture
+def engine():
+    return StandingsEngine()
+
+
+def test_compute_standings(engine, league, league_results):
+    standings = engine.compute(league, league_results)
+
+    assert [row.team.acronym for row in standings] == ["LT3", "LT1", "LT4", "LT2"]
+    assert [row.position for row in standings] == [1, 2, 3, 4]
+    assert [row.points for row in standings] == [5, 5, 4, 4]
+    assert [row.goal_difference for row in standings] == [2, -2, 0, 0]
+
+
+def test_team_stats(engine, league, league_results):
+    rows = {row.team.acronym: row for row in engine.compute(league, league_results)}
+
+    lt4 = rows["LT4"]
+    assert lt4.played == 3
+    assert lt4.regulation_wins == 0
+    assert lt4.shootout_wins == 1
+    assert lt4.shootout_losses == 2
+    assert lt4.regulation_losses == 0
+    assert lt4.goals_for == 8
+    assert lt4.goals_against == 8
+    assert lt4.shootout_goals_for == 5
+    assert lt4.shootout_goals_against == 6
+
+    lt1 = rows["LT1"]
+    assert (lt1.regulation_wins, lt1.shootout_wins, lt1.shootout_losses, lt1.regulation_losses) == (1, 1, 0, 1)
+    assert (lt1.goals_for, lt1.goals_against) == (8, 10)
+
+
+def test_stats_match_model_winners(engine, league, league_results):
+    table = MatchTable.from_matches(league, league_results)
+    stats = engine.compute_stats(table)
+
+    for index, team in enumerate(table.teams):
+        regulation_wins = sum(1 for match in league_results if match.regular_time_winner == team)
+        wins = sum(1 for match in league_results if match.winner == team)
+        assert stats.regulation_wins[index] == regulation_wins
+        assert stats.wins[index] == wins
+
+
+def test_compute_from_match_table(engine, league, league_results):
+    table = MatchTable.from_matches(league, league_results)
+
+    assert engine.compute(league, table) == engine.compute(league, league_results)
+
+
+def test_custom_points_system(league, league_results):
+    engine = StandingsEngine(points_system=PointsSystem(shootout_win=3, shootout_loss=0))
+    points = {row.team.acronym: row.points for row in engine.compute(league, league_results)}
+
+    assert points == {"LT1": 6, "LT2": 3, "LT3": 6, "LT4": 3}
+
+
+def test_custom_tiebreakers(league, league_results):
+    engine = StandingsEngine(tiebreakers=[shootout_wins])
+    assert [row.team.acronym for row in engine.compute(league, league_results)] == ["LT1", "LT3", "LT4", "LT2"]
+
+    engine = StandingsEngine(tiebreakers=[fewest_goals_against])
+    assert [row.team.acronym for row in engine.compute(league, league_results)] == ["LT3", "LT1", "LT2", "LT4"]
+
+
+def test_no_matches(engine, league):
+    standings = engine.compute(league)
+
+    assert len(standings) == 4
+    assert all(row.played == 0 and row.points == 0 for row in standings)
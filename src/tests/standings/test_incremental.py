@@ -0,0 +1,71 @@
+import pytest
+
+from exceptions.match_exceptions import CompetitionMismatchException
+from exceptions.standings_exceptions import (
+    ResultAlreadyAppliedException,
+    ResultNotFoundException,
+)
+from models import PlayedMatch
+from standings import IncrementalStandings, StandingsEngine
+
+
+@pytest.fixture
+def standings(league, league_results):
+    standings = IncrementalStandings(league)
+    for match in league_results:
+        standings.apply(match)
+    return standings
+
+
+def test_matches_batch_engine(standings, league, league_results):
+    assert standings.standings() == StandingsEngine().compute(league, league_results)
+    assert len(standings) == len(league_results)
+
+
+def test_top(standings):
+    assert [row.team.acronym for row in standings.top(2)] == ["LT3", "LT1"]
+    assert [row.position for row in standings.top(2)] == [1, 2]
+
+
+def test_empty_standings(league):
+    standings = IncrementalStandings(league)
+    assert [row.team.acronym for row in standings.standings()] == ["LT1", "LT2", "LT3", "LT4"]
+    assert all(row.points == 0 for row in standings.standings())
+
+
+def test_revoke(standings, league, league_results):
+    standings.revoke(league_results[2].uuid_str)
+
+    assert league_results[2].uuid not in standings
+    assert standings.standings() == StandingsEngine().compute(league, league_results[:2] + league_results[3:])
+
+
+def test_correct(standings, league, league_results):
+    corrected = PlayedMatch(
+        **{**dict(league_results[2]), "uuid": league_results[2].uuid_str, "home_goals": 5, "away_goals": 4}
+    )
+    standings.correct(corrected)
+
+    expected = StandingsEngine().compute(league, league_results[:2] + [corrected] + league_results[3:])
+    assert standings.standings() == expected
+    assert [row.team.acronym for row in standings.top(1)] == ["LT1"]
+
+
+def test_stats(standings, league_team):
+    stats = standings.stats(league_team("LT4"))
+    assert (stats.shootout_wins, stats.shootout_losses, stats.points) == (1, 2, 4)
+
+
+def test_result_already_applied(standings, league_results):
+    with pytest.raises(ResultAlreadyAppliedException, match="has already been applied"):
+        standings.apply(league_results[0])
+
+
+def test_result_not_found(league, league_results):
+    with pytest.raises(ResultNotFoundException, match="No result has been applied"):
+        IncrementalStandings(league).revoke(league_results[0].uuid)
+
+
+def test_competition_mismatch(competition, league_results):
+    with pytest.raises(CompetitionMismatchException):
+        IncrementalStandings(competition).apply(league_results[0])
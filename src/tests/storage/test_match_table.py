@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+
+from exceptions.match_exceptions import (
+    CompetitionMismatchException,
+    EqualShootoutGoalsException,
+    IdenticalTeamsException,
+    MissingShootoutGoalsException,
+    NonDrawShootoutGoalsException,
+)
+from exceptions.match_table_exceptions import (
+    ColumnLengthMismatchException,
+    TeamIndexOutOfRangeException,
+    UnplayedMatchException,
+)
+from models import Match
+from storage import MatchTable
+from storage.match_table import NULL_GOALS, NULL_TEAM
+
+
+@pytest.fixture
+def match_table(league, league_results):
+    return MatchTable.from_matches(league, league_results)
+
+
+def test_from_matches_columns(match_table):
+    assert len(match_table) == 6
+    assert match_table.home_team.tolist() == [0, 2, 0, 1, 3, 1]
+    assert match_table.away_team.tolist() == [1, 3, 2, 3, 0, 2]
+    assert match_table.matchday_round.tolist() == [1, 1, 2, 2, 3, 3]
+    assert match_table.home_goals.tolist() == [3, 2, 0, 1, 5, 2]
+    assert match_table.away_goals.tolist() == [1, 2, 4, 1, 5, 0]
+    assert match_table.home_shootout_goals.tolist() == [NULL_GOALS, 3, NULL_GOALS, 2, 0, NULL_GOALS]
+    assert match_table.away_shootout_goals.tolist() == [NULL_GOALS, 1, NULL_GOALS, 4, 1, NULL_GOALS]
+
+
+def test_competition_is_shared(match_table, league):
+    assert match_table.competition is league
+    assert all(played_match.competition is league for played_match in match_table)
+
+
+def test_goal_difference(match_table):
+    assert match_table.goal_difference.tolist() == [2, 0, -4, 0, 0, 2]
+
+
+def test_regular_time_winner_matches_models(match_table, league_results):
+    expected = [
+        NULL_TEAM if match.regular_time_winner is None else match_table.team_index[match.regular_time_winner.uuid]
+        for match in league_results
+    ]
+    assert match_table.regular_time_winner.tolist() == expected
+
+
+def test_winner_matches_models(match_table, league_results):
+    expected = [match_table.team_index[match.winner.uuid] for match in league_results]
+    assert match_table.winner.tolist() == expected
+
+
+def test_row_round_trip(match_table, league_results):
+    assert list(match_table) == league_results
+    assert match_table[-1] == league_results[-1]
+
+
+def test_row_index_out_of_range(match_table):
+    with pytest.raises(IndexError):
+        match_table[6]
+
+
+def test_filter(match_table):
+    round_two = match_table.filter(match_table.matchday_round == 2)
+    assert len(round_two) == 2
+    assert round_two.competition is match_table.competition
+    assert [str(match) for match in round_two] == [
+        "Queens League Team 1 0 - 4 Queens League Team 3",
+        "Queens League Team 2 1 (2) - (4) 1 Queens League Team 4",
+    ]
+
+
+def test_empty_table(league):
+    match_table = MatchTable.from_matches(league, [])
+    assert len(match_table) == 0
+    assert match_table.winner.tolist() == []
+
+
+def test_unplayed_match_exception(league, league_team):
+    match = Match(
+        uuid="b0000000-0000-0000-0000-000000000000",
+        competition=league,
+        matchday_round=1,
+        home_team=league_team("LT1"),
+        away_team=league_team("LT2"),
+    )
+    with pytest.raises(UnplayedMatchException, match="has not been played yet"):
+        MatchTable.from_matches(league, [match])
+
+
+def test_competition_mismatch_exception(competition, league_results):
+    with pytest.raises(CompetitionMismatchException, match="does not belong to competition"):
+        MatchTable.from_matches(competition, league_results)
+
+
+def test_column_length_mismatch_exception(match_table):
+    with pytest.raises(ColumnLengthMismatchException):
+        MatchTable(
+            competition=match_table.competition,
+            uuids=match_table.uuids,
+            matchday_round=match_table.matchday_round[:-1],
+            home_team=match_table.home_team,
+            away_team=match_table.away_team,
+            home_goals=match_table.home_goals,
+            away_goals=match_table.away_goals,
+            home_shootout_goals=match_table.home_shootout_goals,
+            away_shootout_goals=match_table.away_shootout_goals,
+        )
+
+
+def test_team_index_out_of_range_exception(match_table):
+    with pytest.raises(TeamIndexOutOfRangeException, match="between 0 and 3"):
+        MatchTable(
+            competition=match_table.competition,
+            uuids=match_table.uuids,
+            matchday_round=match_table.matchday_round,
+            home_team=np.full(len(match_table), 4),
+            away_team=match_table.away_team,
+            home_goals=match_table.home_goals,
+            away_goals=match_table.away_goals,
+            home_shootout_goals=match_table.home_shootout_goals,
+            away_shootout_goals=match_table.away_shootout_goals,
+        )
+
+
+def draw_columns(match_table, **changes):
+    columns = {name: column.copy() for name, column in match_table._columns().items()}
+    draw = int(np.flatnonzero(match_table.is_regular_time_draw)[0])
+    for name, value in changes.items():
+        columns[name][draw] = value(columns, draw) if callable(value) else value
+
+    return columns
+
+
+def test_identical_teams_exception(match_table):
+    columns = draw_columns(match_table)
+    columns["away_team"] = columns["home_team"]
+
+    with pytest.raises(IdenticalTeamsException):
+        MatchTable(competition=match_table.competition, **columns)
+
+
+@pytest.mark.parametrize(
+    ("changes", "exception"),
+    [
+        ({"home_shootout_goals": NULL_GOALS}, MissingShootoutGoalsException),
+        (
+            {"home_shootout_goals": lambda columns, row: columns["away_shootout_goals"][row]},
+            EqualShootoutGoalsException,
+        ),
+        ({"home_goals": lambda columns, row: columns["home_goals"][row] + 1}, NonDrawShootoutGoalsException),
+    ],
+)
+def test_shootout_goal_invariants(match_table, changes, exception):
+    with pytest.raises(exception):
+        MatchTable(competition=match_table.competition, **draw_columns(match_table, **changes))
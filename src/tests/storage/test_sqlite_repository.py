@@ -0,0 +1,125 @@
+import pytest
+
+from exceptions.repository_exceptions import (
+    InvalidRepositoryFilterException,
+    RecordNotFoundException,
+)
+from models import Match, PlayedMatch
+from storage import SQLiteRepository
+
+
+@pytest.fixture
+def fixture(league, league_team):
+    return Match(
+        uuid="b0000000-0000-0000-0000-000000000000",
+        competition=league,
+        matchday_round=4,
+        home_team=league_team("LT3"),
+        away_team=league_team("LT1"),
+    )
+
+
+@pytest.fixture
+def repository(league_results, fixture):
+    with SQLiteRepository() as repository:
+        repository.save_matches([*league_results, fixture])
+        yield repository
+
+
+def test_round_trip(repository, league_results, fixture):
+    loaded = list(repository.matches())
+
+    assert loaded == [*league_results, fixture]
+    assert [type(match) for match in loaded] == [PlayedMatch] * 6 + [Match]
+
+
+def test_loads_share_instances(repository):
+    first, second = list(repository.matches())[:2]
+
+    assert first.competition is second.competition
+    assert first.home_team is first.competition.get_team(first.home_team.uuid)
+    assert repository.get_team(first.home_team.uuid) is first.home_team
+    assert next(repository.matches(matchday_round=3)).competition is first.competition
+
+
+def test_filters(repository, league, league_results, league_team, fixture):
+    assert list(repository.matches(team=league_team("LT1"), played=True)) == [
+        league_results[0],
+        league_results[2],
+        league_results[4],
+    ]
+    assert list(repository.matches(competition=league.uuid_str, matchday_round=2)) == league_results[2:4]
+    assert list(repository.matches(played=False)) == [fixture]
+    assert repository.count_matches(season=2024) == 7
+    assert repository.count_matches(season=2023) == 0
+
+
+def test_invalid_filter(repository):
+    with pytest.raises(InvalidRepositoryFilterException):
+        list(repository.matches(kingdom="queens"))
+
+
+def test_upsert_updates_existing_rows(repository, fixture):
+    played = fixture.to_played_match(2, 1)
+    repository.save_matches([played])
+
+    assert repository.count_matches() == 7
+    assert list(repository.matches(matchday_round=4)) == [played]
+
+
+def test_team_update_refreshes_cached_competition(repository, league, league_team):
+    cached = repository.get_competition(league.uuid)
+    renamed = league_team("LT1").model_copy(update={"queens_name": "Renamed Team"})
+    repository.save_teams([renamed])
+
+    reloaded = repository.get_competition(league.uuid)
+    assert reloaded is not cached
+    assert reloaded.get_team(renamed.uuid).queens_name == "Renamed Team"
+
+
+def test_resaving_unchanged_models_keeps_instances(repository, league, league_results):
+    cached = repository.get_competition(league.uuid)
+    repository.save_matches(league_results)
+
+    assert repository.get_competition(league.uuid) is cached
+
+
+def test_competitions(repository, league, competition):
+    repository.save_competitions([competition])
+
+    assert repository.competitions() == [league, competition]
+    assert repository.competitions(season=2023) == [competition]
+    assert repository.get_competition(competition.uuid_str).teams == competition.teams
+
+
+def test_delete_matches(repository, fixture):
+    repository.delete_matches([fixture.uuid_str])
+
+    assert repository.count_matches(played=False) == 0
+
+
+def test_missing_records(repository):
+    with pytest.raises(RecordNotFoundException):
+        repository.get_team("99999999-9999-9999-9999-999999999999")
+    with pytest.raises(RecordNotFoundException):
+        repository.get_competition("99999999-9999-9999-9999-999999999999")
+
+
+def test_persists_to_file(tmp_path, league_results):
+    path = tmp_path / "season.db"
+    with SQLiteRepository(path) as repository:
+        repository.save_matches(league_results)
+
+    with SQLiteRepository(path) as repository:
+        assert list(repository.matches()) == league_results
+
+
+def test_save_matches_is_atomic(league_results):
+    broken = league_results[1].model_copy(update={"uuid": None})
+
+    with SQLiteRepository() as repository:
+        with pytest.raises(Exception):
+            repository.save_matches([league_results[0], broken])
+
+        assert repository.competitions() == []
+        assert list(repository.matches()) == []
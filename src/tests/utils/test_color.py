@@ -0,0 +1,40 @@
+import pytest
+from pydantic_extra_types.color import Color
+
+from utils.color import pack_color, parse_color, to_packed_color, unpack_color
+
+
+@pytest.mark.parametrize("value", ["blue", "#123456", "rgb(1, 2, 3)"])
+def test_packed_color_round_trip(value):
+    color = Color(value)
+
+    assert unpack_color(pack_color(color)) == color
+    assert str(unpack_color(pack_color(color))) == str(color)
+
+
+def test_packed_color_keeps_alpha_to_eight_bits():
+    color = unpack_color(pack_color(Color("rgba(255, 0, 0, 0.5)")))
+
+    assert str(color) == "#ff000080"
+    assert color.as_rgb_tuple()[3] == pytest.approx(0.5, abs=1 / 255)
+
+
+def test_pack_color_layout():
+    assert pack_color(Color("#12345678")) == 0x12345678
+    assert pack_color(Color("white")) == 0xFFFFFFFF
+
+
+def test_parse_color_is_memoized():
+    parse_color.cache_clear()
+    parse_color("red")
+    parse_color("red")
+
+    assert parse_color.cache_info().hits == 1
+
+
+def test_to_packed_color_accepts_colors_and_tuples():
+    assert to_packed_color(Color("red")) == to_packed_color("red") == to_packed_color((255, 0, 0))
+
+
+def test_unpack_color_shares_instances():
+    assert unpack_color(0xFF0000FF) is unpack_color(0xFF0000FF)
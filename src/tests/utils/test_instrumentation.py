@@ -0,0 +1,121 @@
+from inspect import signature
+
+import pytest
+
+from exceptions.competition_exceptions import TeamNotFoundException
+from models.competition import Competition
+from models.match import PlayedMatch
+from utils.instrumentation import (
+    INSTRUMENTATION,
+    LATENCY_BUCKETS,
+    CallMetrics,
+    instrument,
+    instrumented,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    INSTRUMENTATION.disable()
+    INSTRUMENTATION.reset()
+    yield
+    INSTRUMENTATION.disable()
+    INSTRUMENTATION.reset()
+
+
+def test_disabled_instrumentation_records_nothing(competition):
+    competition.get_team("12345678-1234-5678-1234-567812345678")
+
+    assert INSTRUMENTATION.snapshot() == {}
+
+
+def test_context_manager_records_validators_and_lookups(competition):
+    with instrument() as instrumentation:
+        Competition(**competition.model_dump(mode="json"))
+        competition.has_team("12345678-1234-5678-1234-567812345678")
+        with pytest.raises(TeamNotFoundException):
+            competition.get_team("00000000-0000-0000-0000-000000000000")
+
+    snapshot = instrumentation.snapshot()
+
+    assert not instrumentation.enabled
+    assert snapshot["Competition.validate_unique_team_uuids"]["count"] == 1
+    assert snapshot["Competition.validate_teams_region"]["count"] == 1
+    assert snapshot["Competition.has_team"]["count"] == 1
+    assert snapshot["Competition.get_team"]["count"] == 1
+    assert snapshot["intern_uuid"]["count"] >= 2
+    assert snapshot["Competition.get_team"]["histogram"]["+Inf"] == 1
+
+
+def test_nested_context_restores_previous_state():
+    INSTRUMENTATION.enable()
+    with INSTRUMENTATION:
+        pass
+
+    assert INSTRUMENTATION.enabled
+
+
+def test_call_metrics_histogram_is_cumulative():
+    metrics = CallMetrics()
+    for seconds in (5e-7, 3e-6, 3e-6, 1.0):
+        metrics.observe(seconds)
+
+    histogram = metrics.snapshot()["histogram"]
+
+    assert metrics.count == 4
+    assert metrics.total_seconds == pytest.approx(1.0000065)
+    assert histogram["1e-06"] == 1
+    assert histogram["5e-06"] == 3
+    assert histogram[repr(LATENCY_BUCKETS[-1])] == 3
+    assert histogram["+Inf"] == 4
+
+
+def test_instrumented_functions_share_named_metrics():
+    @instrumented("test.double")
+    def double(value: int) -> int:
+        return 2 * value
+
+    with instrument():
+        assert double(2) == 4
+        assert double(value=3) == 6
+
+    assert INSTRUMENTATION.snapshot()["test.double"]["count"] == 2
+    assert double.__name__ == "double"
+
+
+def test_prometheus_dump():
+    @instrumented("test.noop")
+    def noop() -> None:
+        return None
+
+    with instrument() as instrumentation:
+        noop()
+
+    text = instrumentation.prometheus()
+
+    assert text.startswith("# HELP kings_data_call_seconds")
+    assert "# TYPE kings_data_call_seconds histogram" in text
+    assert 'kings_data_call_seconds_bucket{function="test.noop",le="+Inf"} 1' in text
+    assert 'kings_data_call_seconds_count{function="test.noop"} 1' in text
+    assert 'function="Competition.get_team"' not in text
+    assert 'function="Competition.get_team"' in instrumentation.prometheus(include_idle=True)
+
+
+def test_instrumented_functions_keep_their_code_and_signature(competition):
+    code = Competition.get_team.__code__
+    with instrument():
+        assert Competition.get_team.__code__ is code
+        competition.get_team("12345678-1234-5678-1234-567812345678")
+
+    assert Competition.get_team.__code__ is code
+    assert signature(Competition.get_team) == signature(Competition.get_team.__wrapped__)
+    assert list(signature(Competition.get_team).parameters) == ["self", "team_uuid"]
+
+
+def test_hooks_follow_toggles_after_schema_build(league, league_results):
+    match = league_results[0]
+    with instrument() as instrumentation:
+        PlayedMatch(**dict(match))
+    PlayedMatch(**dict(match))
+
+    assert instrumentation.snapshot()["PlayedMatch.validate_shootout_goals"]["count"] == 1
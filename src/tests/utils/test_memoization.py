@@ -0,0 +1,65 @@
+import pickle
+
+import pytest
+
+from enums import Kingdom
+from utils.memoization import clear_memo, instance_memo
+
+
+@pytest.fixture
+def played_match(league_results):
+    return league_results[0]
+
+
+def test_winner_is_computed_once(played_match):
+    winner = played_match.winner
+
+    assert played_match.winner is winner
+    assert instance_memo(played_match)["winner"] is winner
+    assert instance_memo(played_match)["regular_time_winner"] is winner
+
+
+def test_memo_does_not_leak_into_fields(played_match, league_results):
+    played_match.winner
+    played_match.uuid_str
+
+    assert "winner" not in played_match.__dict__
+    assert played_match == played_match.model_copy()
+    assert played_match.model_dump(mode="json")["winner"]["acronym"] == "LT1"
+
+
+def test_model_copy_starts_with_empty_memo(played_match):
+    assert played_match.winner.acronym == "LT1"
+
+    updated = played_match.model_copy(update={"home_goals": 0})
+
+    assert updated.winner.acronym == "LT2"
+    assert played_match.winner.acronym == "LT1"
+
+
+def test_pickle_drops_memo(played_match):
+    played_match.winner
+    restored = pickle.loads(pickle.dumps(played_match.home_team))
+
+    assert restored == played_match.home_team
+    assert instance_memo(restored) == {}
+
+
+def test_uuid_str_is_memoized(competition):
+    assert competition.uuid_str == "11111111-1111-1111-1111-111111111111"
+    assert instance_memo(competition)["uuid_str"] is competition.uuid_str
+
+
+def test_team_names_are_memoized(league_team):
+    team = league_team("LT1")
+
+    assert team.get_team_name(Kingdom.QUEENS) == "Queens League Team 1"
+    assert team.get_team_name(kingdom="kings") == "Kings League Team 1"
+    assert instance_memo(team)["team_names"] == ("Kings League Team 1", "Queens League Team 1")
+
+
+def test_clear_memo(played_match):
+    played_match.winner
+    clear_memo(played_match)
+
+    assert instance_memo(played_match) == {}
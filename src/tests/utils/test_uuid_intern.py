@@ -0,0 +1,57 @@
+from uuid import UUID
+
+import pytest
+
+from exceptions.shared_exceptions import InvalidUUIDException
+from utils.uuid_intern import clear_uuid_cache, intern_uuid, uuid_to_str
+
+UUID_STR = "12345678-1234-5678-1234-567812345678"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_uuid_cache()
+    yield
+    clear_uuid_cache()
+
+
+def test_intern_uuid_from_string():
+    uuid = intern_uuid(UUID_STR)
+
+    assert uuid == UUID(UUID_STR)
+    assert intern_uuid(UUID_STR) is uuid
+
+
+def test_intern_uuid_is_canonical_across_inputs():
+    uuid = intern_uuid(UUID_STR)
+
+    assert intern_uuid(UUID(UUID_STR)) is uuid
+    assert intern_uuid(UUID_STR.upper()) is uuid
+    assert intern_uuid("{" + UUID_STR + "}") is uuid
+
+
+def test_intern_uuid_invalid_value():
+    with pytest.raises(InvalidUUIDException, match="The provided ID 'invalid-uuid-string' is not a valid UUID."):
+        intern_uuid("invalid-uuid-string")
+
+
+@pytest.mark.parametrize("value", [None, 123, b"x", ["not", "hashable"]])
+def test_intern_uuid_non_string_value(value):
+    with pytest.raises(InvalidUUIDException):
+        intern_uuid(value)
+
+
+def test_uuid_to_str_is_cached():
+    uuid = intern_uuid(UUID_STR)
+
+    assert uuid_to_str(uuid) == UUID_STR
+    assert uuid_to_str(uuid) is uuid_to_str(UUID(UUID_STR))
+
+
+def test_models_share_canonical_uuid(competition):
+    team = competition.get_team(UUID_STR)
+
+    assert team.uuid is intern_uuid(UUID_STR)
+    assert competition.get_team(UUID(UUID_STR)) is team
+    assert competition.has_team(UUID("23456789-1234-5678-1234-567812345678"))
+    assert team.uuid_str is team.uuid_str
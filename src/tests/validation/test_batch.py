@@ -0,0 +1,179 @@
+import pytest
+
+from enums import Region
+from exceptions.match_exceptions import (
+    IdenticalTeamsException,
+    MissingShootoutGoalsException,
+    TeamNotInCompetitionException,
+)
+from models import Competition, PlayedMatch
+from serialization import dump_matches
+from validation import ErrorCode, check_competitions, check_matches
+
+
+@pytest.fixture
+def rows(league, league_results):
+    return [{**row, "competition": league} for row in dump_matches(league_results)["matches"]]
+
+
+def model_exception(row):
+    try:
+        PlayedMatch(**PlayedMatch.resolve_row(row))
+    except Exception as exception:
+        return exception
+
+
+def test_clean_batch_has_no_errors(rows, league):
+    errors = check_matches(rows, league)
+
+    assert not errors
+    assert errors.valid_rows(len(rows)) == list(range(len(rows)))
+
+
+def test_batch_errors_match_model_validators(rows, league, league_team, teams):
+    outsider = next(iter(teams))
+    rows[0] = {**rows[0], "away_team": rows[0]["home_team"]}
+    rows[1] = {**rows[1], "home_shootout_goals": None}
+    rows[2] = {**rows[2], "home_team": outsider}
+    rows[3] = {**rows[3], "home_team": league_team("LT1"), "away_team": league_team("LT1")}
+
+    errors = check_matches(rows, [league])
+
+    assert [(error.row, error.code) for error in errors] == [
+        (0, ErrorCode.IDENTICAL_TEAMS),
+        (1, ErrorCode.MISSING_SHOOTOUT_GOALS),
+        (2, ErrorCode.TEAM_NOT_IN_COMPETITION),
+        (3, ErrorCode.IDENTICAL_TEAMS),
+    ]
+    assert errors.valid_rows(len(rows)) == [4, 5]
+    for error, exception_type in zip(
+        errors,
+        (
+            IdenticalTeamsException,
+            MissingShootoutGoalsException,
+            TeamNotInCompetitionException,
+            IdenticalTeamsException,
+        ),
+    ):
+        exception = model_exception(rows[error.row])
+        assert isinstance(exception, exception_type)
+        assert isinstance(error.exception(), exception_type)
+        assert error.message == str(exception)
+
+
+def test_batch_reports_lookup_and_field_errors(rows, league):
+    rows[0] = {**rows[0], "competition": "99999999-9999-9999-9999-999999999999"}
+    rows[1] = {**rows[1], "home_team": "not-a-uuid", "matchday_round": 0}
+    rows[2] = {**rows[2], "away_team": "99999999-9999-9999-9999-999999999999", "home_goals": -1}
+    rows[3] = {**rows[3], "home_goals": 5, "away_goals": 0}
+
+    errors = check_matches(rows, {league.uuid: league})
+
+    assert list(zip(errors.rows, errors.codes)) == [
+        (0, ErrorCode.UNKNOWN_COMPETITION),
+        (1, ErrorCode.INVALID_FIELD),
+        (1, ErrorCode.INVALID_UUID),
+        (2, ErrorCode.TEAM_NOT_FOUND),
+        (2, ErrorCode.INVALID_FIELD),
+        (3, ErrorCode.NON_DRAW_SHOOTOUT_GOALS),
+    ]
+    assert errors.params[1] == ("matchday_round", 0, "a positive integer")
+    assert errors.counts()[ErrorCode.INVALID_FIELD] == 2
+    assert dict(errors.messages())[3] == "Shootout goals must be None for a non-draw match."
+
+    with pytest.raises(Exception, match="99999999-9999-9999-9999-999999999999"):
+        errors.raise_first()
+
+
+def test_batch_accepts_dumped_model_rows(league, league_results):
+    rows = [match.model_dump(mode="json") for match in league_results]
+    outsider = {**rows[1]["home_team"], "uuid": "99999999-9999-9999-9999-999999999999"}
+    rows[1] = {**rows[1], "home_team": outsider}
+
+    errors = check_matches(rows, league)
+
+    assert list(zip(errors.rows, errors.codes)) == [(1, ErrorCode.TEAM_NOT_FOUND)]
+    assert errors.params[0] == ("99999999-9999-9999-9999-999999999999",)
+    assert model_exception(rows[0]) is None
+    assert not check_matches(rows[:1], [])
+
+
+def test_unplayed_rows_skip_goal_checks(rows, league):
+    fixtures = [
+        {key: row[key] for key in ("uuid", "competition", "matchday_round", "home_team", "away_team")} for row in rows
+    ]
+
+    assert not check_matches(fixtures, league, played=False)
+
+
+def test_check_competitions(league):
+    row = league.model_dump(mode="json")
+    foreign = {**row["teams"][0], "region": Region.AM.value}
+    duplicate = {**row["teams"][1], "acronym": "DUP"}
+    rows = [
+        row,
+        {**row, "split": None},
+        {**row, "teams": [*row["teams"], foreign]},
+        {**row, "teams": [*row["teams"], duplicate]},
+    ]
+
+    errors = check_competitions(rows)
+
+    assert list(zip(errors.rows, errors.codes)) == [
+        (1, ErrorCode.INVALID_SPLIT),
+        (2, ErrorCode.DUPLICATE_TEAM_UUID),
+        (2, ErrorCode.REGION_MISMATCH),
+        (3, ErrorCode.DUPLICATE_TEAM_UUID),
+    ]
+    with pytest.raises(Exception) as raised:
+        Competition(**rows[1])
+    assert errors[0].message == str(raised.value)
+    assert "DUP" not in errors[3].message
+    assert "LT" in errors[2].message
+
+
+def test_check_competitions_accepts_repeated_identical_teams(league):
+    row = league.model_dump(mode="json")
+    row = {**row, "teams": [*row["teams"], row["teams"][0]]}
+
+    assert not check_competitions([row])
+    assert Competition(**row) == league
+
+
+def test_dirty_rows_are_recorded_per_row(rows, league):
+    rows[0] = {key: value for key, value in rows[0].items() if key != "home_goals"}
+    rows[1] = {key: value for key, value in rows[1].items() if key != "competition"}
+    rows[2] = {**rows[2], "home_team": 42, "away_goals": "many"}
+    rows[3] = {**rows[3], "matchday_round": "2", "home_goals": "1", "away_goals": 1.0}
+
+    errors = check_matches(rows, league)
+
+    assert list(zip(errors.rows, errors.codes)) == [
+        (0, ErrorCode.MISSING_FIELD),
+        (1, ErrorCode.MISSING_FIELD),
+        (2, ErrorCode.INVALID_UUID),
+        (2, ErrorCode.INVALID_FIELD),
+    ]
+    assert dict(errors.messages())[0] == "Field 'home_goals' is required."
+    assert errors.params[3][0] == "away_goals"
+    assert model_exception(rows[3]) is None
+
+
+def test_dirty_competition_rows_are_recorded_per_row(league):
+    row = league.model_dump(mode="json")
+    bad_team = {**row["teams"][0], "first_color": "not-a-color"}
+    rows = [
+        {key: value for key, value in row.items() if key != "format"},
+        {**row, "format": "tournament"},
+        {**row, "teams": [*row["teams"][1:], bad_team]},
+    ]
+
+    errors = check_competitions(rows)
+
+    assert list(zip(errors.rows, errors.codes)) == [
+        (0, ErrorCode.MISSING_FIELD),
+        (1, ErrorCode.INVALID_FIELD),
+        (2, ErrorCode.INVALID_FIELD),
+    ]
+    assert errors.params[1][0] == "format"
+    assert errors.params[2][0] == "teams[3]"
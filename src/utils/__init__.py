@@ -1,3 +1,17 @@
-from .uuid_mixin import UUIDMixin
+from typing import TYPE_CHECKING
 
-__all__ = ["UUIDMixin"]
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .trusted_construction_mixin import TrustedConstructionMixin
+    from .uuid_mixin import UUIDMixin
+
+__all__ = ["TrustedConstructionMixin", "UUIDMixin"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "TrustedConstructionMixin": ".trusted_construction_mixin",
+        "UUIDMixin": ".uuid_mixin",
+    },
+)
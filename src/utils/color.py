@@ -0,0 +1,92 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from pydantic_core import core_schema
+
+if TYPE_CHECKING:
+    from pydantic_extra_types.color import Color
+
+COLOR_CACHE_SIZE = 4_096
+OPAQUE = 0xFF
+
+
+def pack_color(color: "Color") -> int:
+    rgba = color.as_rgb_tuple()
+    red, green, blue = rgba[:3]
+    alpha = OPAQUE if len(rgba) == 3 else round(rgba[3] * OPAQUE)
+
+    return red << 24 | green << 16 | blue << 8 | alpha
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def unpack_color(rgba: int) -> "Color":
+    from pydantic_extra_types.color import Color
+
+    red, green, blue, alpha = rgba >> 24 & 0xFF, rgba >> 16 & 0xFF, rgba >> 8 & 0xFF, rgba & 0xFF
+    if alpha == OPAQUE:
+        return Color((red, green, blue))
+
+    return Color((red, green, blue, alpha / OPAQUE))
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def parse_color(value: str) -> int:
+    from pydantic_extra_types.color import Color
+
+    return pack_color(Color(value))
+
+
+def to_packed_color(value: Any) -> int:
+    if isinstance(value, str):
+        return parse_color(value)
+
+    from pydantic_extra_types.color import Color
+
+    return pack_color(value if isinstance(value, Color) else Color(value))
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def color_to_str(rgba: int) -> str:
+    return str(unpack_color(rgba))
+
+
+def _serialize_packed_color(rgba: Any, info: core_schema.SerializationInfo) -> "Color | str":
+    if type(rgba) is not int:
+        rgba = to_packed_color(rgba)
+
+    return color_to_str(rgba) if info.mode_is_json() else unpack_color(rgba)
+
+
+class PackedColor:
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            to_packed_color,
+            serialization=core_schema.plain_serializer_function_ser_schema(_serialize_packed_color, info_arg=True),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: core_schema.CoreSchema, handler: Any) -> dict[str, Any]:
+        return {"type": "string", "format": "color"}
+
+
+class ColorField:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> "Color | None | ColorField":
+        if instance is None:
+            return self
+
+        rgba = instance.__dict__[self.name]
+        if rgba is None:
+            return None
+        if type(rgba) is not int:
+            rgba = to_packed_color(rgba)
+
+        return unpack_color(rgba)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        raise AttributeError(f"{self.name} is read-only")
@@ -0,0 +1,125 @@
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1)
+METRIC_NAME = "kings_data_call_seconds"
+
+
+@dataclass(slots=True)
+class CallMetrics:
+    count: int = 0
+    total_seconds: float = 0.0
+    bucket_counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def reset(self) -> None:
+        self.count = 0
+        self.total_seconds = 0.0
+        self.bucket_counts[:] = [0] * len(self.bucket_counts)
+
+    def cumulative_buckets(self) -> list[tuple[str, int]]:
+        bounds = [*(repr(bound) for bound in LATENCY_BUCKETS), "+Inf"]
+        total, buckets = 0, []
+        for bound, count in zip(bounds, self.bucket_counts):
+            total += count
+            buckets.append((bound, total))
+
+        return buckets
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.count if self.count else 0.0,
+            "histogram": dict(self.cumulative_buckets()),
+        }
+
+
+class Instrumentation:
+    def __init__(self):
+        self.enabled = False
+        self.metrics: dict[str, CallMetrics] = {}
+        self._previous: list[bool] = []
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        for metrics in self.metrics.values():
+            metrics.reset()
+
+    def register(self, name: str) -> CallMetrics:
+        return self.metrics.setdefault(name, CallMetrics())
+
+    def snapshot(self, include_idle: bool = False) -> dict[str, dict[str, Any]]:
+        return {
+            name: metrics.snapshot() for name, metrics in sorted(self.metrics.items()) if include_idle or metrics.count
+        }
+
+    def prometheus(self, include_idle: bool = False) -> str:
+        lines = [
+            f"# HELP {METRIC_NAME} Time spent in instrumented validators and lookups.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        for name, metrics in sorted(self.metrics.items()):
+            if not include_idle and not metrics.count:
+                continue
+            for bound, count in metrics.cumulative_buckets():
+                lines.append(f'{METRIC_NAME}_bucket{{function="{name}",le="{bound}"}} {count}')
+            lines.append(f'{METRIC_NAME}_sum{{function="{name}"}} {metrics.total_seconds!r}')
+            lines.append(f'{METRIC_NAME}_count{{function="{name}"}} {metrics.count}')
+
+        return "\n".join(lines) + "\n"
+
+    def __enter__(self) -> "Instrumentation":
+        self._previous.append(self.enabled)
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if not self._previous.pop():
+            self.disable()
+
+
+INSTRUMENTATION = Instrumentation()
+
+
+def instrument(reset: bool = True) -> Instrumentation:
+    if reset:
+        INSTRUMENTATION.reset()
+
+    return INSTRUMENTATION
+
+
+def instrumented(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    metrics = INSTRUMENTATION.register(name)
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not INSTRUMENTATION.enabled:
+                return func(*args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.observe(perf_counter() - start)
+
+        return wrapper
+
+    return decorator
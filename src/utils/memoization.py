@@ -0,0 +1,31 @@
+from functools import cached_property
+from typing import Any
+
+MEMO_SLOT = "_memo"
+
+_object_setattr = object.__setattr__
+
+
+def instance_memo(instance: Any) -> dict[Any, Any]:
+    try:
+        return object.__getattribute__(instance, MEMO_SLOT)
+    except AttributeError:
+        memo = {}
+        _object_setattr(instance, MEMO_SLOT, memo)
+        return memo
+
+
+def clear_memo(instance: Any) -> None:
+    _object_setattr(instance, MEMO_SLOT, {})
+
+
+class memoized_property(cached_property):
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return instance._memo[self.attrname]
+        except (AttributeError, KeyError):
+            value = instance_memo(instance)[self.attrname] = self.func(instance)
+            return value
@@ -0,0 +1,102 @@
+import random
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from enum import Enum
+from typing import Any, Self, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from exceptions.shared_exceptions import InvalidSampleRateException
+
+T = TypeVar("T", bound=BaseModel)
+
+_new_instance = object.__new__
+_set_dict, _set_fields_set, _set_extra, _set_private = (
+    BaseModel.__dict__[name].__set__ for name in BaseModel.__slots__
+)
+_field_layouts: dict[type, tuple[dict[str, Any], tuple[str, ...], frozenset[str], bool]] = {}
+_enum_values: dict[type[Enum], dict[Any, Any]] = {}
+
+
+def trusted_enum_value(enum: type[Enum], value: Any) -> Any:
+    values = _enum_values.get(enum)
+    if values is None:
+        values = _enum_values[enum] = {
+            **{member: member.value for member in enum},
+            **{member.value: member.value for member in enum},
+        }
+
+    enum_value = values.get(value)
+    if enum_value is None:
+        return enum(value).value
+
+    return enum_value
+
+
+class TrustedConstructionMixin(ABC):
+    @classmethod
+    @abstractmethod
+    def from_trusted(cls, **data) -> Self: ...
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Mapping[str, Any]], verify_sample: float = 0.0, seed: int | None = None
+    ) -> list[Self]:
+        if not 0 <= verify_sample <= 1:
+            raise InvalidSampleRateException(verify_sample)
+
+        from_trusted = cls.from_trusted
+        if not verify_sample:
+            if cls.resolve_row.__func__ is TrustedConstructionMixin.resolve_row.__func__:
+                return [from_trusted(**row) for row in rows]
+
+            resolve_row = cls.resolve_row
+            return [from_trusted(**resolve_row(row)) for row in rows]
+
+        sampler = random.Random(seed)
+        instances = []
+        for row in rows:
+            row = cls.resolve_row(row)
+            if sampler.random() < verify_sample:
+                instances.append(cls(**row))
+            else:
+                instances.append(from_trusted(**row))
+
+        return instances
+
+    @classmethod
+    def resolve_row(cls, row: Mapping[str, Any]) -> Mapping[str, Any]:
+        return row
+
+
+def construct_trusted(model: type[T], data: dict[str, Any]) -> T:
+    layout = _field_layouts.get(model)
+    if layout is None:
+        layout = _field_layouts[model] = (
+            {name: field.default for name, field in model.model_fields.items()},
+            tuple(model.model_fields),
+            frozenset(model.model_fields),
+            model.__pydantic_post_init__ is not None,
+        )
+
+    template, names, name_set, post_init = layout
+    if tuple(data) == names:
+        values = data
+        fields_set = set(name_set)
+    else:
+        values = {
+            name: data[name] if name in data or default is PydanticUndefined else default
+            for name, default in template.items()
+        }
+        fields_set = set(data).intersection(values)
+
+    instance = _new_instance(model)
+    _set_dict(instance, values)
+    _set_fields_set(instance, fields_set)
+    _set_extra(instance, None)
+    _set_private(instance, None)
+    if post_init:
+        instance.model_post_init(None)
+
+    return instance
@@ -0,0 +1,40 @@
+from functools import lru_cache
+from uuid import UUID
+
+from exceptions.shared_exceptions import InvalidUUIDException
+from utils.instrumentation import instrumented
+
+UUID_CACHE_SIZE = 65_536
+
+
+@lru_cache(maxsize=UUID_CACHE_SIZE)
+def _canonical_uuid(value: UUID) -> UUID:
+    return value
+
+
+@lru_cache(maxsize=UUID_CACHE_SIZE)
+def _parse_uuid(value: str) -> UUID:
+    return _canonical_uuid(UUID(value))
+
+
+@lru_cache(maxsize=UUID_CACHE_SIZE)
+def uuid_to_str(value: UUID) -> str:
+    return str(value)
+
+
+@instrumented("intern_uuid")
+def intern_uuid(value: str | UUID) -> UUID:
+    if isinstance(value, UUID):
+        return _canonical_uuid(value)
+    if not isinstance(value, str):
+        raise InvalidUUIDException(value)
+    try:
+        return _parse_uuid(value)
+    except ValueError:
+        raise InvalidUUIDException(value)
+
+
+def clear_uuid_cache() -> None:
+    _canonical_uuid.cache_clear()
+    _parse_uuid.cache_clear()
+    uuid_to_str.cache_clear()
@@ -2,24 +2,22 @@ from uuid import UUID
 
 from pydantic import field_validator
 
-from exceptions.shared_exceptions import InvalidUUIDException
+from utils.memoization import memoized_property
+from utils.uuid_intern import intern_uuid, uuid_to_str
 
 
 class UUIDMixin:
-    uuid: str
+    uuid: UUID
 
-    @field_validator("uuid")
+    @field_validator("uuid", mode="before")
     @classmethod
     def validate_uuid_field(cls, v) -> UUID:
         return cls.validate_uuid(v)
 
     @staticmethod
-    def validate_uuid(value: str) -> UUID:
-        try:
-            return UUID(value)
-        except ValueError:
-            raise InvalidUUIDException(value)
+    def validate_uuid(value: str | UUID) -> UUID:
+        return intern_uuid(value)
 
-    @property
+    @memoized_property
     def uuid_str(self) -> str:
-        return str(self.uuid)
+        return uuid_to_str(self.uuid)
@@ -0,0 +1,3 @@
+from .batch import BatchError, ErrorCode, ErrorTable, check_competitions, check_matches
+
+__all__ = ["BatchError", "ErrorCode", "ErrorTable", "check_competitions", "check_matches"]
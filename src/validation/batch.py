@@ -0,0 +1,351 @@
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from pydantic import NonNegativeInt, PositiveInt, TypeAdapter, ValidationError
+
+from enums import CompetitionFormat, Kingdom, Region
+from exceptions.competition_exceptions import (
+    DuplicateTeamUUIDException,
+    InvalidSplitException,
+    RegionMismatchException,
+    TeamNotFoundException,
+)
+from exceptions.ingestion_exceptions import UnknownCompetitionException
+from exceptions.match_exceptions import (
+    EqualShootoutGoalsException,
+    IdenticalTeamsException,
+    MissingShootoutGoalsException,
+    NonDrawShootoutGoalsException,
+    TeamNotInCompetitionException,
+)
+from exceptions.shared_exceptions import InvalidUUIDException
+from exceptions.validation_exceptions import (
+    InvalidFieldValueException,
+    MissingFieldException,
+)
+from models.competition import Competition
+from models.team import Team
+from utils.uuid_intern import intern_uuid
+
+Competitions = Mapping[UUID, Competition] | Iterable[Competition]
+
+SPLIT_REQUIRED = "Split cannot be None for a league competition."
+SPLIT_FORBIDDEN = "Split must be None for non-league competition formats."
+
+MATCH_FIELDS = ("competition", "matchday_round", "home_team", "away_team")
+GOAL_FIELDS = ("home_goals", "away_goals")
+SHOOTOUT_GOAL_FIELDS = ("home_shootout_goals", "away_shootout_goals")
+COMPETITION_FIELDS = ("region", "kingdom", "format", "teams")
+
+_INTEGER_RULES = {
+    0: (TypeAdapter(NonNegativeInt), "a non-negative integer"),
+    1: (TypeAdapter(PositiveInt), "a positive integer"),
+}
+
+
+class ErrorCode(Enum):
+    MISSING_FIELD = "missing_field"
+    INVALID_FIELD = "invalid_field"
+    INVALID_UUID = "invalid_uuid"
+    UNKNOWN_COMPETITION = "unknown_competition"
+    TEAM_NOT_FOUND = "team_not_found"
+    TEAM_NOT_IN_COMPETITION = "team_not_in_competition"
+    IDENTICAL_TEAMS = "identical_teams"
+    MISSING_SHOOTOUT_GOALS = "missing_shootout_goals"
+    EQUAL_SHOOTOUT_GOALS = "equal_shootout_goals"
+    NON_DRAW_SHOOTOUT_GOALS = "non_draw_shootout_goals"
+    INVALID_SPLIT = "invalid_split"
+    DUPLICATE_TEAM_UUID = "duplicate_team_uuid"
+    REGION_MISMATCH = "region_mismatch"
+
+
+def _team_names(teams: Sequence[Team], kingdom: str) -> list[str]:
+    return [f"{team.get_team_name(kingdom)} ({team.uuid})" for team in teams]
+
+
+_EXCEPTIONS: dict[ErrorCode, Callable[..., Exception]] = {
+    ErrorCode.MISSING_FIELD: MissingFieldException,
+    ErrorCode.INVALID_FIELD: InvalidFieldValueException,
+    ErrorCode.INVALID_UUID: InvalidUUIDException,
+    ErrorCode.UNKNOWN_COMPETITION: UnknownCompetitionException,
+    ErrorCode.TEAM_NOT_FOUND: TeamNotFoundException,
+    ErrorCode.TEAM_NOT_IN_COMPETITION: lambda team, kingdom: TeamNotInCompetitionException(team.get_team_name(kingdom)),
+    ErrorCode.IDENTICAL_TEAMS: lambda team, kingdom: IdenticalTeamsException(team.get_team_name(kingdom)),
+    ErrorCode.MISSING_SHOOTOUT_GOALS: MissingShootoutGoalsException,
+    ErrorCode.EQUAL_SHOOTOUT_GOALS: EqualShootoutGoalsException,
+    ErrorCode.NON_DRAW_SHOOTOUT_GOALS: NonDrawShootoutGoalsException,
+    ErrorCode.INVALID_SPLIT: InvalidSplitException,
+    ErrorCode.DUPLICATE_TEAM_UUID: lambda teams, kingdom: DuplicateTeamUUIDException(_team_names(teams, kingdom)),
+    ErrorCode.REGION_MISMATCH: RegionMismatchException,
+}
+
+
+class BatchError(NamedTuple):
+    row: int
+    code: ErrorCode
+    params: tuple
+
+    def exception(self) -> Exception:
+        return _EXCEPTIONS[self.code](*self.params)
+
+    @property
+    def message(self) -> str:
+        return str(self.exception())
+
+
+@dataclass(slots=True)
+class ErrorTable:
+    rows: list[int] = field(default_factory=list)
+    codes: list[ErrorCode] = field(default_factory=list)
+    params: list[tuple] = field(default_factory=list)
+
+    def add(self, row: int, code: ErrorCode, *params: Any) -> None:
+        self.rows.append(row)
+        self.codes.append(code)
+        self.params.append(params)
+
+    def invalid_rows(self) -> set[int]:
+        return set(self.rows)
+
+    def valid_rows(self, count: int) -> list[int]:
+        invalid = self.invalid_rows()
+        return [row for row in range(count) if row not in invalid]
+
+    def counts(self) -> Counter:
+        return Counter(self.codes)
+
+    def messages(self) -> Iterator[tuple[int, str]]:
+        for error in self:
+            yield error.row, error.message
+
+    def raise_first(self) -> None:
+        if self.rows:
+            raise self[0].exception()
+
+    def __getitem__(self, index: int) -> BatchError:
+        return BatchError(self.rows[index], self.codes[index], self.params[index])
+
+    def __iter__(self) -> Iterator[BatchError]:
+        return map(BatchError, self.rows, self.codes, self.params)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __bool__(self) -> bool:
+        return bool(self.rows)
+
+
+def check_matches(
+    rows: Sequence[Mapping[str, Any]], competitions: Competitions | Competition, played: bool = True
+) -> ErrorTable:
+    if isinstance(competitions, Competition):
+        competitions = [competitions]
+    registry = _registry(competitions)
+    team_lookups: dict[UUID, dict[UUID, Team]] = {}
+    errors = ErrorTable()
+    add = errors.add
+
+    required = MATCH_FIELDS + GOAL_FIELDS if played else MATCH_FIELDS
+
+    for index, row in enumerate(rows):
+        if not _has_fields(index, row, required, add):
+            continue
+
+        competition = _resolve_competition(index, row["competition"], registry, add)
+        _coerce_int(index, "matchday_round", row["matchday_round"], 1, add)
+
+        if competition is not None:
+            teams = team_lookups.get(competition.uuid)
+            if teams is None:
+                teams = team_lookups[competition.uuid] = {team.uuid: team for team in competition.teams}
+            home_team = _resolve_team(index, row["home_team"], competition, teams, add)
+            away_team = _resolve_team(index, row["away_team"], competition, teams, add)
+            if home_team is not None and home_team == away_team:
+                add(index, ErrorCode.IDENTICAL_TEAMS, home_team, competition.kingdom)
+
+        if played:
+            _check_goals(index, row, add)
+
+    return errors
+
+
+def check_competitions(rows: Sequence[Mapping[str, Any]]) -> ErrorTable:
+    errors = ErrorTable()
+    add = errors.add
+
+    for index, row in enumerate(rows):
+        if not _has_fields(index, row, COMPETITION_FIELDS, add):
+            continue
+
+        region = _enum_value(index, "region", row["region"], Region, add)
+        kingdom = _enum_value(index, "kingdom", row["kingdom"], Kingdom, add)
+        competition_format = _enum_value(index, "format", row["format"], CompetitionFormat, add)
+
+        split = row.get("split")
+        if split is None and competition_format == CompetitionFormat.LEAGUE.value:
+            add(index, ErrorCode.INVALID_SPLIT, SPLIT_REQUIRED)
+        elif split is not None and competition_format not in (None, CompetitionFormat.LEAGUE.value):
+            add(index, ErrorCode.INVALID_SPLIT, SPLIT_FORBIDDEN)
+
+        teams = list(dict.fromkeys(_resolve_teams(index, row["teams"], add)))
+        seen: dict[UUID, Team] = {}
+        duplicates: list[Team] = []
+        for team in teams:
+            first = seen.setdefault(team.uuid, team)
+            if first is not team:
+                if first not in duplicates:
+                    duplicates.append(first)
+                duplicates.append(team)
+        if duplicates and kingdom is not None:
+            add(index, ErrorCode.DUPLICATE_TEAM_UUID, duplicates, kingdom)
+
+        if region is not None:
+            invalid_teams = [team.acronym for team in teams if team.region != region]
+            if invalid_teams:
+                add(index, ErrorCode.REGION_MISMATCH, region, invalid_teams)
+
+    return errors
+
+
+def _has_fields(index: int, row: Mapping[str, Any], names: Sequence[str], add: Callable) -> bool:
+    missing = [name for name in names if name not in row]
+    for name in missing:
+        add(index, ErrorCode.MISSING_FIELD, name)
+
+    return not missing
+
+
+def _coerce_int(index: int, name: str, value: Any, minimum: int, add: Callable) -> int | None:
+    if type(value) is int and value >= minimum:
+        return value
+
+    adapter, expected = _INTEGER_RULES[minimum]
+    try:
+        return adapter.validate_python(value)
+    except ValidationError:
+        add(index, ErrorCode.INVALID_FIELD, name, value, expected)
+        return None
+
+
+def _enum_value(index: int, name: str, value: Any, enum: type[Enum], add: Callable) -> Any:
+    try:
+        return enum(value).value
+    except ValueError:
+        add(index, ErrorCode.INVALID_FIELD, name, value, f"one of {', '.join(str(member.value) for member in enum)}")
+        return None
+
+
+def _resolve_teams(index: int, values: Iterable[Team | Mapping[str, Any]], add: Callable) -> list[Team]:
+    teams = []
+    for position, value in enumerate(values):
+        if isinstance(value, Team):
+            teams.append(value)
+            continue
+        try:
+            teams.append(Team.from_trusted(**value))
+        except Exception as exception:
+            add(index, ErrorCode.INVALID_FIELD, f"teams[{position}]", value, f"a valid team ({exception})")
+
+    return teams
+
+
+def _registry(competitions: Competitions) -> Mapping[UUID, Competition]:
+    if isinstance(competitions, Mapping):
+        return competitions
+
+    return {competition.uuid: competition for competition in competitions}
+
+
+def _resolve_competition(
+    index: int,
+    value: Competition | Mapping[str, Any] | str | UUID,
+    registry: Mapping[UUID, Competition],
+    add: Callable,
+) -> Competition | None:
+    if isinstance(value, Competition):
+        return value
+
+    reference = _reference(value)
+    competition_uuid = _parse_uuid(index, reference, add)
+    if competition_uuid is None:
+        return None
+
+    competition = registry.get(competition_uuid)
+    if competition is not None:
+        return competition
+    if not isinstance(value, Mapping):
+        add(index, ErrorCode.UNKNOWN_COMPETITION, str(reference))
+        return None
+
+    try:
+        return Competition.from_trusted(**value)
+    except Exception as exception:
+        add(index, ErrorCode.INVALID_FIELD, "competition", reference, f"a valid competition ({exception})")
+        return None
+
+
+def _resolve_team(
+    index: int,
+    value: Team | Mapping[str, Any] | str | UUID,
+    competition: Competition,
+    teams: Mapping[UUID, Team],
+    add: Callable,
+) -> Team | None:
+    if isinstance(value, Team):
+        if value.uuid not in teams:
+            add(index, ErrorCode.TEAM_NOT_IN_COMPETITION, value, competition.kingdom)
+            return None
+        return value
+
+    reference = _reference(value)
+    team_uuid = _parse_uuid(index, reference, add)
+    if team_uuid is None:
+        return None
+
+    team = teams.get(team_uuid)
+    if team is None:
+        add(index, ErrorCode.TEAM_NOT_FOUND, str(reference))
+
+    return team
+
+
+def _reference(value: Any) -> Any:
+    return value.get("uuid") if isinstance(value, Mapping) else value
+
+
+def _parse_uuid(index: int, value: Any, add: Callable) -> UUID | None:
+    try:
+        if isinstance(value, (str, UUID)):
+            return intern_uuid(value)
+    except InvalidUUIDException:
+        pass
+
+    add(index, ErrorCode.INVALID_UUID, value)
+    return None
+
+
+def _check_goals(index: int, row: Mapping[str, Any], add: Callable) -> None:
+    values = []
+    valid = True
+    for name in GOAL_FIELDS + SHOOTOUT_GOAL_FIELDS:
+        value = row.get(name)
+        if value is not None or name in GOAL_FIELDS:
+            value = _coerce_int(index, name, value, 0, add)
+            valid = valid and value is not None
+        values.append(value)
+
+    if not valid:
+        return
+
+    home_goals, away_goals, home_shootout_goals, away_shootout_goals = values
+    if home_goals == away_goals:
+        if home_shootout_goals is None or away_shootout_goals is None:
+            add(index, ErrorCode.MISSING_SHOOTOUT_GOALS)
+        elif home_shootout_goals == away_shootout_goals:
+            add(index, ErrorCode.EQUAL_SHOOTOUT_GOALS)
+    elif home_shootout_goals is not None or away_shootout_goals is not None:
+        add(index, ErrorCode.NON_DRAW_SHOOTOUT_GOALS)